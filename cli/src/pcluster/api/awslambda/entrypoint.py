@@ -8,7 +8,9 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import os
+import time
 from os import environ
 from typing import Any, Dict
 
@@ -25,6 +27,7 @@ tracer = Tracer(service="pcluster")
 
 # Initialize as a global to re-use across Lambda invocations
 pcluster_api = None  # pylint: disable=invalid-name
+xray_instrumented = False  # pylint: disable=invalid-name
 
 profile = environ.get("PROFILE", "prod")
 is_dev_profile = profile == "dev"
@@ -35,19 +38,40 @@ if is_dev_profile:
     environ["FLASK_DEBUG"] = "1"
 
 
+def _build_flask_app():
+    start = time.perf_counter()
+    app = ParallelClusterFlaskApp(swagger_ui=is_dev_profile, validate_responses=is_dev_profile)
+    init_phases = {**app.init_phases, "total": round(time.perf_counter() - start, 3)}
+    # Module imports are not included, they are part of the Init Duration reported by Lambda
+    logger.info("Initialized Flask Application. Initialization phases duration (seconds): %s", json.dumps(init_phases))
+    return app
+
+
 @tracer.capture_method
 def _init_flask_app():
-    return ParallelClusterFlaskApp(swagger_ui=is_dev_profile, validate_responses=is_dev_profile)
+    return _build_flask_app()
+
+
+# The Flask application is built during the Lambda init phase, which runs before the first invocation and with
+# provisioned concurrency before any request is received. A failure is retried when handling the first request.
+if environ.get("AWS_LAMBDA_FUNCTION_NAME") and environ.get("PCLUSTER_API_EAGER_INIT", "true").lower() == "true":
+    try:
+        logger.info("Initializing Flask Application during Lambda init phase")
+        pcluster_api = _build_flask_app()  # pylint: disable=invalid-name
+    except Exception as e:
+        logger.warning("Unable to initialize Flask Application during Lambda init phase: %s", e)
 
 
 @logger.inject_lambda_context(log_event=is_dev_profile)
 @tracer.capture_lambda_handler
 def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
     try:
-        global pcluster_api  # pylint: disable=global-statement,invalid-name
+        global pcluster_api, xray_instrumented  # pylint: disable=global-statement,invalid-name
         if not pcluster_api:
             logger.info("Initializing Flask Application")
             pcluster_api = _init_flask_app()
+        if not xray_instrumented:
+            xray_instrumented = True
             # Instrument X-Ray recorder to trace requests served by the Flask application
             if event.get("version") == "2.0":
                 xray_recorder.configure(service="ParallelCluster Flask App")
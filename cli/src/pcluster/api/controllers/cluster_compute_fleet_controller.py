@@ -8,7 +8,12 @@
 
 # pylint: disable=W0613
 
-from pcluster.api.controllers.common import configure_aws_region, convert_errors, validate_cluster
+from pcluster.api.controllers.common import (
+    configure_aws_region,
+    convert_errors,
+    invalidate_cluster_description,
+    validate_cluster,
+)
 from pcluster.api.errors import BadRequestException
 from pcluster.api.models import (
     DescribeComputeFleetResponseContent,
@@ -85,6 +90,7 @@ def update_compute_fleet(update_compute_fleet_request_content, cluster_name, reg
                     "the update compute fleet status can only be set to"
                     " `ENABLED` or `DISABLED` for AWS Batch clusters."
                 )
+    invalidate_cluster_description(cluster_name)
     status, last_status_updated_time = cluster.compute_fleet_status_with_last_updated_time
     last_status_updated_time = last_status_updated_time and to_utc_datetime(last_status_updated_time)
     return UpdateComputeFleetResponseContent(last_status_updated_time=last_status_updated_time, status=status.value)
@@ -9,6 +9,7 @@
 # pylint: disable=W0613
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 from pcluster.api.controllers.common import (
@@ -16,8 +17,10 @@ from pcluster.api.controllers.common import (
     configure_aws_region,
     configure_aws_region_from_config,
     convert_errors,
+    get_cluster_description,
     get_validator_suppressors,
     http_success_status_code,
+    invalidate_cluster_description,
     validate_cluster,
 )
 from pcluster.api.converters import (
@@ -53,7 +56,7 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.common import StackNotFoundError, region_scope
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.models.cluster import (
     Cluster,
@@ -63,6 +66,7 @@ from pcluster.models.cluster import (
     NotFoundClusterActionError,
 )
 from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.inventory import list_cluster_stacks
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
@@ -171,6 +175,7 @@ def delete_cluster(cluster_name, region=None):
         if not cluster.status == CloudFormationStackStatus.DELETE_IN_PROGRESS:
             # TODO: remove keep_logs logic from delete
             cluster.delete(keep_logs=False)
+            invalidate_cluster_description(cluster_name)
 
         return DeleteClusterResponseContent(
             cluster=ClusterInfoSummary(
@@ -203,18 +208,20 @@ def describe_cluster(cluster_name, region=None):
 
     :rtype: DescribeClusterResponseContent
     """
+    return get_cluster_description(cluster_name, lambda: _describe_cluster(cluster_name))
+
+
+def _describe_cluster(cluster_name):
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
     cfn_stack = cluster.stack
+    region = os.environ.get("AWS_DEFAULT_REGION")
 
-    fleet_status = cluster.compute_fleet_status
-
-    config_url = "NOT_AVAILABLE"
-    try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
+    # Once the stack is known, the remaining lookups are independent of each other and are performed concurrently
+    lookups = [lambda: cluster.compute_fleet_status, lambda: _get_config_url(cluster), lambda: _get_head_node(cluster)]
+    with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+        futures = [executor.submit(_run_in_region, region, lookup) for lookup in lookups]
+        fleet_status, config_url, head_node = [future.result() for future in futures]
 
     response = DescribeClusterResponseContent(
         creation_time=to_utc_datetime(cfn_stack.creation_time),
@@ -226,12 +233,11 @@ def describe_cluster(cluster_name, region=None):
         compute_fleet_status=fleet_status.value,
         cloudformation_stack_arn=cfn_stack.id,
         last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
-        region=os.environ.get("AWS_DEFAULT_REGION"),
+        region=region,
         cluster_status=cloud_formation_status_to_cluster_status(cfn_stack.status),
     )
 
-    try:
-        head_node = cluster.head_node_instance
+    if head_node:
         response.head_node = EC2Instance(
             instance_id=head_node.id,
             launch_time=to_utc_datetime(head_node.launch_time),
@@ -240,11 +246,31 @@ def describe_cluster(cluster_name, region=None):
             state=InstanceState.from_dict(head_node.state),
             private_ip_address=head_node.private_ip,
         )
+
+    return response
+
+
+def _run_in_region(region, function):
+    with region_scope(region):
+        return function()
+
+
+def _get_config_url(cluster: Cluster):
+    try:
+        return cluster.config_presigned_url
+    except ClusterActionError as e:
+        # Do not fail request when S3 bucket is not available
+        LOGGER.error(e)
+        return "NOT_AVAILABLE"
+
+
+def _get_head_node(cluster: Cluster):
+    try:
+        return cluster.head_node_instance
     except ClusterActionError as e:
         # This should not be treated as a failure cause head node might not be running in some cases
         LOGGER.info(e)
-
-    return response
+        return None
 
 
 @configure_aws_region()
@@ -265,6 +291,21 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
     stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
     stacks = [ClusterStack(stack) for stack in stacks]
 
+    clusters = _cluster_stacks_to_cluster_info_summaries(stacks, os.environ.get("AWS_DEFAULT_REGION"), cluster_status)
+    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+
+
+def list_region_clusters(region, cluster_status=None):
+    """
+    Retrieve all the clusters of the given region, without pagination.
+
+    It is meant to be invoked within the region_scope of the given region.
+    """
+    stacks = [ClusterStack(stack) for stack in list_cluster_stacks()]
+    return _cluster_stacks_to_cluster_info_summaries(stacks, region, cluster_status)
+
+
+def _cluster_stacks_to_cluster_info_summaries(stacks: List[ClusterStack], region: str, cluster_status=None):
     clusters = []
     for stack in stacks:
         current_cluster_status = cloud_formation_status_to_cluster_status(stack.status)
@@ -273,13 +314,12 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
                 cluster_name=stack.cluster_name,
                 cloudformation_stack_status=stack.status,
                 cloudformation_stack_arn=stack.id,
-                region=os.environ.get("AWS_DEFAULT_REGION"),
+                region=region,
                 version=stack.version,
                 cluster_status=current_cluster_status,
             )
             clusters.append(cluster_info)
-
-    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+    return clusters
 
 
 @convert_errors()
@@ -355,6 +395,7 @@ def update_cluster(
             validation_failure_level=FailureLevel[validation_failure_level],
             force=force_update,
         )
+        invalidate_cluster_description(cluster_name)
 
         change_set, _ = _analyze_changes(changes)
         return UpdateClusterResponseContent(
@@ -14,7 +14,7 @@
 import functools
 import logging
 import os
-from typing import List, Optional, Set, Union
+from typing import Callable, List, Optional, Set, Union
 
 import boto3
 from pkg_resources import packaging
@@ -27,15 +27,18 @@ from pcluster.api.errors import (
     NotFoundException,
     ParallelClusterApiException,
 )
-from pcluster.aws.common import BadRequestError, LimitExceededError, StackNotFoundError
+from pcluster.aws.common import BadRequestError, Boto3ClientFactory, Cache, LimitExceededError, StackNotFoundError
 from pcluster.config.common import AllValidatorsSuppressor, TypeMatchValidatorsSuppressor, ValidatorSuppressor
-from pcluster.constants import SUPPORTED_REGIONS
+from pcluster.constants import DESCRIBE_CLUSTER_CACHE_TTL, SUPPORTED_REGIONS
 from pcluster.models.cluster import Cluster
 from pcluster.models.common import BadRequest, Conflict, LimitExceeded, NotFound, parse_config
 from pcluster.utils import get_installed_version, to_utc_datetime
 
 LOGGER = logging.getLogger(__name__)
 
+# Cluster descriptions shared by the requests served by the API process, by region, credentials and cluster name
+_cluster_descriptions = Cache.create_store("describe_cluster", maxsize=1024, ttl=DESCRIBE_CLUSTER_CACHE_TTL)
+
 
 def _set_region(region):
     if not region:
@@ -127,6 +130,26 @@ def validate_cluster(cluster: Cluster):
         )
 
 
+def get_cluster_description(cluster_name: str, describe: Callable):
+    """
+    Return the description of the cluster, calling describe to retrieve it when not cached or expired.
+
+    Concurrent requests for the same cluster wait for a single invocation of describe.
+    """
+    if not Cache.is_enabled():
+        return describe()
+    return _cluster_descriptions.get_or_compute(_cluster_description_key(cluster_name), describe)
+
+
+def invalidate_cluster_description(cluster_name: str):
+    """Discard the cached description of the cluster, to be called by the operations changing its status."""
+    _cluster_descriptions.invalidate(_cluster_description_key(cluster_name))
+
+
+def _cluster_description_key(cluster_name: str):
+    return Boto3ClientFactory.session_key(), cluster_name
+
+
 def validate_timestamp(date_str: str, ts_name: str = "Time"):
     try:
         return to_utc_datetime(date_str)
@@ -58,6 +58,7 @@ from pcluster.models.imagebuilder import (
     NonExistingImageError,
 )
 from pcluster.models.imagebuilder_resources import ImageBuilderStack, NonExistingStackError
+from pcluster.models.inventory import list_imagebuilder_stacks
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
@@ -129,7 +130,9 @@ def build_image(
         )
 
         return BuildImageResponseContent(
-            image=_imagebuilder_stack_to_image_info_summary(imagebuilder.stack),
+            image=_imagebuilder_stack_to_image_info_summary(
+                imagebuilder.stack, os_lib.environ.get("AWS_DEFAULT_REGION")
+            ),
             validation_messages=validation_results_to_config_validation_errors(suppressed_validation_failures) or None,
         )
     except ConfigValidationError as e:
@@ -327,12 +330,24 @@ def list_images(image_status, region=None, next_token=None):
     :rtype: ListImagesResponseContent
     """
     if image_status == ImageStatusFilteringOption.AVAILABLE:
-        return ListImagesResponseContent(images=_get_available_images())
+        return ListImagesResponseContent(images=_get_available_images(os_lib.environ.get("AWS_DEFAULT_REGION")))
     else:
         images, next_token = _get_images_in_progress(image_status, next_token)
         return ListImagesResponseContent(images=images, next_token=next_token)
 
 
+def list_region_images(image_status, region):
+    """
+    Retrieve all the custom images of the given region, without pagination.
+
+    It is meant to be invoked within the region_scope of the given region.
+    """
+    if image_status == ImageStatusFilteringOption.AVAILABLE:
+        return _get_available_images(region)
+    stacks = [ImageBuilderStack(stack) for stack in list_imagebuilder_stacks()]
+    return _imagebuilder_stacks_to_image_info_summaries(stacks, image_status, region)
+
+
 def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRequestException:
     config_validation_messages = validation_results_to_config_validation_errors(e.validation_failures) or None
     return BuildImageBadRequestException(
@@ -342,20 +357,26 @@ def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRe
     )
 
 
-def _get_available_images():
-    return [_image_info_to_image_info_summary(image) for image in AWSApi.instance().ec2.get_images()]
+def _get_available_images(region):
+    return [_image_info_to_image_info_summary(image, region) for image in AWSApi.instance().ec2.get_images()]
 
 
 def _get_images_in_progress(image_status, next_token):
     stacks, next_token = AWSApi.instance().cfn.get_imagebuilder_stacks(next_token=next_token)
     imagebuilder_stacks = [ImageBuilderStack(stack) for stack in stacks]
+    summaries = _imagebuilder_stacks_to_image_info_summaries(
+        imagebuilder_stacks, image_status, os_lib.environ.get("AWS_DEFAULT_REGION")
+    )
+    return summaries, next_token
+
+
+def _imagebuilder_stacks_to_image_info_summaries(imagebuilder_stacks, image_status, region):
     cloudformation_states = _image_status_to_cloudformation_status(image_status)
-    summaries = [
-        _imagebuilder_stack_to_image_info_summary(stack)
+    return [
+        _imagebuilder_stack_to_image_info_summary(stack, region)
         for stack in imagebuilder_stacks
         if stack.status in cloudformation_states
     ]
-    return summaries, next_token
 
 
 def _image_status_to_cloudformation_status(image_status):
@@ -373,22 +394,22 @@ def _image_status_to_cloudformation_status(image_status):
     return mapping.get(image_status, set())
 
 
-def _imagebuilder_stack_to_image_info_summary(stack):
+def _imagebuilder_stack_to_image_info_summary(stack, region):
     return ImageInfoSummary(
         image_id=stack.pcluster_image_id,
         image_build_status=cloud_formation_status_to_image_status(stack.status),
         cloudformation_stack_status=stack.status,
         cloudformation_stack_arn=stack.id,
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=region,
         version=stack.version,
     )
 
 
-def _image_info_to_image_info_summary(image):
+def _image_info_to_image_info_summary(image, region):
     return ImageInfoSummary(
         image_id=image.pcluster_image_id,
         image_build_status=ImageBuildStatus.BUILD_COMPLETE,
         ec2_ami_info=Ec2AmiInfoSummary(ami_id=image.id),
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=region,
         version=image.version,
     )
@@ -11,7 +11,7 @@
 import json
 import logging
 import os
-from typing import List, Union
+from typing import Dict, List, Union
 
 from pkg_resources import packaging
 
@@ -30,6 +30,7 @@ from pcluster.models.cluster_resources import ClusterInstance
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.imagebuilder import ImageBuilder, ImageBuilderActionError, NonExistingImageError
 from pcluster.models.imagebuilder_resources import ImageBuilderStack, NonExistingStackError
+from pcluster.models.inventory import Inventory, list_cluster_stacks, list_imagebuilder_stacks
 from pcluster.utils import get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
@@ -136,6 +137,17 @@ class ImageBuilderImageInfo(ImageBuilderInfo):
         return json.dumps(self.__dict__)
 
 
+class InventoryInfo:
+    """Resources listed in multiple regions, along with the error messages of the regions that could not be listed."""
+
+    def __init__(self, items: list, failures: Dict[str, str]):
+        self.items = items
+        self.failures = failures
+
+    def __repr__(self):
+        return json.dumps({"items": [item.__dict__ for item in self.items], "failures": self.failures}, default=str)
+
+
 class PclusterApi:
     """Proxy class for all Pcluster API commands used in the CLI."""
 
@@ -265,6 +277,17 @@ class PclusterApi:
         except Exception as e:
             return ApiFailure(str(e))
 
+    @staticmethod
+    def list_clusters_in_regions(regions: List[str]) -> Union[InventoryInfo, ApiFailure]:
+        """List existing clusters in multiple regions, querying them concurrently."""
+        try:
+            clusters, failures = Inventory(regions).collect(
+                lambda region: [ClusterInfo(ClusterStack(stack)) for stack in list_cluster_stacks()]
+            )
+            return InventoryInfo(clusters, failures)
+        except Exception as e:
+            return ApiFailure(str(e))
+
     @staticmethod
     def describe_cluster_instances(
         cluster_name: str, region: str, node_type: NodeType = None
@@ -390,24 +413,39 @@ class PclusterApi:
             if region:
                 os.environ["AWS_DEFAULT_REGION"] = region
 
-            # get built images by image name tag
-            images = AWSApi.instance().ec2.get_images()
-            imagebuilders = [ImageBuilder(image=image, image_id=image.pcluster_image_id) for image in images]
-            images_response = [ImageBuilderImageInfo(imagebuilder=imagebuilder) for imagebuilder in imagebuilders]
-
-            # get building image stacks by image name tag
             stacks, _ = AWSApi.instance().cfn.get_imagebuilder_stacks()
-            imagebuilder_stacks = [
-                ImageBuilder(image_id=stack.get("StackName"), stack=ImageBuilderStack(stack)) for stack in stacks
-            ]
-            imagebuilder_stacks_response = [
-                ImageBuilderStackInfo(imagebuilder=imagebuilder) for imagebuilder in imagebuilder_stacks
-            ]
-
-            return images_response + imagebuilder_stacks_response
+            return PclusterApi._get_images_info(stacks)
         except Exception as e:
             return ApiFailure(str(e))
 
+    @staticmethod
+    def list_images_in_regions(regions: List[str]) -> Union[InventoryInfo, ApiFailure]:
+        """List existing images in multiple regions, querying them concurrently."""
+        try:
+            images, failures = Inventory(regions).collect(
+                lambda region: PclusterApi._get_images_info(list_imagebuilder_stacks())
+            )
+            return InventoryInfo(images, failures)
+        except Exception as e:
+            return ApiFailure(str(e))
+
+    @staticmethod
+    def _get_images_info(stacks: List[dict]):
+        # get built images by image name tag
+        images = AWSApi.instance().ec2.get_images()
+        imagebuilders = [ImageBuilder(image=image, image_id=image.pcluster_image_id) for image in images]
+        images_response = [ImageBuilderImageInfo(imagebuilder=imagebuilder) for imagebuilder in imagebuilders]
+
+        # get building image stacks by image name tag
+        imagebuilder_stacks = [
+            ImageBuilder(image_id=stack.get("StackName"), stack=ImageBuilderStack(stack)) for stack in stacks
+        ]
+        imagebuilder_stacks_response = [
+            ImageBuilderStackInfo(imagebuilder=imagebuilder) for imagebuilder in imagebuilder_stacks
+        ]
+
+        return images_response + imagebuilder_stacks_response
+
     @staticmethod
     def _get_underlying_image_or_stack(imagebuilder: ImageBuilder):
         image = None
@@ -9,6 +9,7 @@
 # Generated by OpenAPI Generator (python-flask)
 
 import datetime
+import functools
 import logging
 import shutil
 import subprocess
@@ -157,7 +158,13 @@ def _deserialize_dict(data, boxed_type):
     return {k: _deserialize(v, boxed_type) for k, v in six.iteritems(data)}
 
 
+@functools.lru_cache(maxsize=None)
 def assert_valid_node_js():
+    """Check that a supported Node.js runtime is available.
+
+    The check spawns a node process, so a successful result is cached for the lifetime of the process. Failures are
+    not cached, so that the check is repeated once Node.js has been installed.
+    """
     _assert_node_executable()
     _assert_node_version()
 
@@ -8,10 +8,11 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
-import os
+import threading
 
 from pcluster.aws.batch import BatchClient
 from pcluster.aws.cfn import CfnClient
+from pcluster.aws.common import Boto3ClientFactory
 from pcluster.aws.dynamo import DynamoResource
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.aws.efs import EfsClient
@@ -33,12 +34,15 @@ class AWSApi:
     A singleton instance can be retrieved from everywhere in the code by calling AWSApi.instance().
     Specific API client wrappers are provided through properties of this instance; for instance AWSApi.instance().ec2
     will return the client wrapper for EC2 service.
+    An instance is kept for each region and set of credentials, so that client wrappers are reused when the region
+    set in the environment changes, e.g. across ParallelCluster API requests.
     """
 
-    _instance = None
+    _instances = {}
+    _lock = threading.Lock()
 
     def __init__(self):
-        self.aws_region = os.environ.get("AWS_DEFAULT_REGION")
+        self.aws_region = Boto3ClientFactory.session_key()[0]
 
         self._batch = None
         self._cfn = None
@@ -156,7 +160,19 @@ class AWSApi:
 
     @staticmethod
     def instance():
-        """Return the singleton AWSApi instance."""
-        if not AWSApi._instance or AWSApi._instance.aws_region != os.environ.get("AWS_DEFAULT_REGION"):
-            AWSApi._instance = AWSApi()
-        return AWSApi._instance
+        """Return the AWSApi instance for the region and credentials currently set in the environment."""
+        key = Boto3ClientFactory.session_key()
+        instance = AWSApi._instances.get(key)
+        if not instance:
+            with AWSApi._lock:
+                instance = AWSApi._instances.get(key)
+                if not instance:
+                    instance = AWSApi._instances[key] = AWSApi()
+        return instance
+
+    @staticmethod
+    def reset():
+        """Discard all the AWSApi instances together with the shared boto3 sessions and clients."""
+        with AWSApi._lock:
+            AWSApi._instances.clear()
+        Boto3ClientFactory.reset()
@@ -10,11 +10,13 @@
 # limitations under the License.
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 
 from pcluster.aws.aws_resources import StackInfo
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, StackNotFoundError
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
 from pcluster.constants import PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
 
 LOGGER = logging.getLogger(__name__)
@@ -23,8 +25,15 @@ LOGGER = logging.getLogger(__name__)
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
 
+    # Prefix of the pagination tokens returned when listing stacks through describe_stacks
+    DESCRIBE_STACKS_TOKEN_PREFIX = "describe-stacks:"
+    DESCRIBE_STACKS_MAX_WORKERS = 10
+    # Errors of the Tagging API calls that make stacks be listed through describe_stacks
+    TAGGING_API_UNAVAILABLE_ERROR_CODES = {"AccessDeniedException", "AccessDenied"}
+
     def __init__(self):
         super().__init__("cloudformation")
+        self._tagging_client = None
 
     @AWSExceptionHandler.handle_client_exception
     def create_stack(self, stack_name: str, disable_rollback: bool, tags: list, template_body: str):
@@ -153,6 +162,72 @@ class CfnClient(Boto3Client):
         return self._list_parentless_stacks_with_tag(PCLUSTER_IMAGE_ID_TAG, next_token)
 
     def _list_parentless_stacks_with_tag(self, tag, next_token=None):
+        """
+        Return a page of the root stacks carrying the given tag.
+
+        Stacks are looked up through the Resource Groups Tagging API, which filters them by tag server-side, so that
+        listing scales with the number of tagged stacks rather than with the number of stacks in the account.
+        The Tagging API is eventually consistent and can miss stacks that have just been created: the stacks in
+        CREATE_IN_PROGRESS status are therefore merged into the first page.
+        If the Tagging API is not available, i.e. the tag:GetResources permission is missing or the API is not
+        supported in the region, all the stacks are described and filtered client-side. Pagination tokens of the
+        latter are prefixed by DESCRIBE_STACKS_TOKEN_PREFIX, so that later pages are retrieved in the same way.
+        """
+        if next_token and next_token.startswith(self.DESCRIBE_STACKS_TOKEN_PREFIX):
+            describe_stacks_token = next_token.replace(self.DESCRIBE_STACKS_TOKEN_PREFIX, "", 1)
+            return self._describe_parentless_stacks_with_tag(tag, describe_stacks_token)
+
+        if not self._tagging_client:
+            self._tagging_client = ResourceGroupsTaggingClient()
+        try:
+            stack_arns, result_token = self._tagging_client.get_resources_with_tag(
+                tag, "cloudformation:stack", next_token
+            )
+        except AWSClientError as e:
+            if next_token or not self._is_tagging_api_unavailable(e):
+                raise
+            LOGGER.warning(
+                "Unable to list stacks through the Resource Groups Tagging API, describing all stacks: %s", e
+            )
+            return self._describe_parentless_stacks_with_tag(tag)
+
+        if not next_token:
+            stack_arns += [arn for arn in self._list_stacks_being_created() if arn not in stack_arns]
+
+        stack_list = []
+        with ThreadPoolExecutor(max_workers=self.DESCRIBE_STACKS_MAX_WORKERS) as executor:
+            for stack in executor.map(self._describe_stack_if_exists, stack_arns):
+                if (
+                    stack
+                    and stack.get("StackStatus") != "DELETE_COMPLETE"
+                    and stack.get("ParentId") is None
+                    and StackInfo(stack).get_tag(tag)
+                ):
+                    stack_list.append(stack)
+        return stack_list, result_token
+
+    def _is_tagging_api_unavailable(self, error: AWSClientError):
+        """Tell if the error means that the Tagging API cannot be used, rather than a transient failure."""
+        # Errors without code are raised by botocore, e.g. when the endpoint of the region cannot be reached
+        return error.error_code is None or error.error_code in self.TAGGING_API_UNAVAILABLE_ERROR_CODES
+
+    def _list_stacks_being_created(self):
+        """Return the ids of the root stacks in CREATE_IN_PROGRESS status."""
+        stack_ids = []
+        for page in self._client.get_paginator("list_stacks").paginate(StackStatusFilter=["CREATE_IN_PROGRESS"]):
+            stack_ids.extend(
+                summary["StackId"] for summary in page.get("StackSummaries", []) if summary.get("ParentId") is None
+            )
+        return stack_ids
+
+    def _describe_stack_if_exists(self, stack_arn):
+        """Describe the given stack, returning None if it has been deleted in the meantime."""
+        try:
+            return self.describe_stack(stack_arn)
+        except StackNotFoundError:
+            return None
+
+    def _describe_parentless_stacks_with_tag(self, tag, next_token=None):
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
@@ -162,4 +237,5 @@ class CfnClient(Boto3Client):
         for stack in result.get("Stacks", []):
             if stack.get("ParentId") is None and StackInfo(stack).get_tag(tag):
                 stack_list.append(stack)
-        return stack_list, result.get("NextToken")
+        result_token = result.get("NextToken")
+        return stack_list, f"{self.DESCRIBE_STACKS_TOKEN_PREFIX}{result_token}" if result_token else None
@@ -10,13 +10,20 @@
 # limitations under the License.
 
 import functools
+import hashlib
+import inspect
+import json
 import logging
 import os
+import random
+import tempfile
 import threading
 import time
 from abc import ABC
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict
+from typing import Dict, List
 
 import boto3
 from botocore.config import Config
@@ -34,12 +41,13 @@ class AWSClientError(Exception):
         VALIDATION_ERROR = "ValidationError"
         REQUEST_LIMIT_EXCEEDED = "RequestLimitExceeded"
         THROTTLING_EXCEPTION = "ThrottlingException"
+        THROTTLING = "Throttling"
         CONDITIONAL_CHECK_FAILED_EXCEPTION = "ConditionalCheckFailedException"
 
         @classmethod
         def throttling_error_codes(cls):
             """Return a set of error codes returned when service rate limits are exceeded."""
-            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value}
+            return {cls.REQUEST_LIMIT_EXCEEDED.value, cls.THROTTLING_EXCEPTION.value, cls.THROTTLING.value}
 
     def __init__(self, function_name: str, message: str, error_code: str = None):
         super().__init__(message)
@@ -81,70 +89,366 @@ class AWSExceptionHandler:
 
     @staticmethod
     def handle_client_exception(func):
-        """Handle Boto3 errors, can be used as a decorator."""
+        """
+        Handle Boto3 errors, can be used as a decorator.
+
+        Generator functions are supported too, converting the errors raised while their items are retrieved.
+        """
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except (BotoCoreError, ClientError) as e:
+                    raise AWSExceptionHandler._convert_client_exception(func.__name__, e)
+
+            return generator_wrapper
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
-            except ParamValidationError as validation_error:
-                error = BadRequestError(
-                    func.__name__,
-                    "Error validating parameter. Failed with exception: {0}".format(str(validation_error)),
-                )
-            except BotoCoreError as e:
-                error = AWSClientError(func.__name__, str(e))
-            except ClientError as e:
-                # add request id
-                message = e.response["Error"]["Message"]
-                error_code = e.response["Error"]["Code"]
-
-                if error_code in AWSClientError.ErrorCode.throttling_error_codes():
-                    error = LimitExceededError(func.__name__, message, error_code)
-                elif error_code == AWSClientError.ErrorCode.VALIDATION_ERROR:
-                    error = BadRequestError(func.__name__, message, error_code)
-                else:
-                    error = AWSClientError(func.__name__, message, error_code)
-            LOGGER.error("Encountered error when performing boto3 call in %s: %s", error.function_name, error.message)
-            raise error
+            except (BotoCoreError, ClientError) as e:
+                raise AWSExceptionHandler._convert_client_exception(func.__name__, e)
 
         return wrapper
 
+    @staticmethod
+    def _convert_client_exception(function_name: str, exception: Exception) -> AWSClientError:
+        """Convert a Boto3 error to the corresponding AWSClientError, logging it."""
+        if isinstance(exception, ParamValidationError):
+            error = BadRequestError(
+                function_name,
+                "Error validating parameter. Failed with exception: {0}".format(str(exception)),
+            )
+        elif isinstance(exception, BotoCoreError):
+            error = AWSClientError(function_name, str(exception))
+        else:
+            # add request id
+            message = exception.response["Error"]["Message"]
+            error_code = exception.response["Error"]["Code"]
+
+            if error_code in AWSClientError.ErrorCode.throttling_error_codes():
+                error = LimitExceededError(function_name, message, error_code)
+            elif error_code == AWSClientError.ErrorCode.VALIDATION_ERROR:
+                error = BadRequestError(function_name, message, error_code)
+            else:
+                error = AWSClientError(function_name, message, error_code)
+        LOGGER.error("Encountered error when performing boto3 call in %s: %s", error.function_name, error.message)
+        return error
+
     @staticmethod
     def retry_on_boto3_throttling(func):
-        """Retry boto3 calls on throttling, can be used as a decorator."""
+        """
+        Retry boto3 calls on throttling, can be used as a decorator.
+
+        The attempts already made by botocore count towards the max attempts of the RetryPolicy, so that throttled calls
+        are retried here only when botocore did not retry them, with exponential backoff and jitter.
+        """
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
+            attempts = 0
             while True:
                 try:
                     return func(*args, **kwargs)
                 except ClientError as e:
-                    if e.response["Error"]["Code"] != "Throttling":
+                    attempts += e.response.get("ResponseMetadata", {}).get("RetryAttempts", 0) + 1
+                    if (
+                        e.response["Error"]["Code"] not in AWSClientError.ErrorCode.throttling_error_codes()
+                        or attempts >= RetryPolicy.get_max_attempts()
+                    ):
                         raise
-                    LOGGER.debug("Throttling when calling %s function. Will retry in %d seconds.", func.__name__, 5)
-                    time.sleep(5)
+                    delay = RetryPolicy.get_backoff_delay(attempts)
+                    LOGGER.debug(
+                        "Throttling when calling %s function. Will retry in %.2f seconds.", func.__name__, delay
+                    )
+                    time.sleep(delay)
 
         return wrapper
 
 
-def _log_boto3_calls(params, **kwargs):
-    service = kwargs["event_name"].split(".")[-2]
-    operation = kwargs["event_name"].split(".")[-1]
-    region = kwargs["context"].get("client_region", boto3.session.Session().region_name)
-    LOGGER.info(
-        "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
-    )
+class TokenBucket:
+    """Token bucket allowing a given rate of requests per second, with bursts up to the bucket capacity."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, waiting until one is available. Return the time spent waiting in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            # Tokens can go negative: the next requests wait for the debt to be repaid
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_time:
+            time.sleep(wait_time)
+        return wait_time
+
+
+class RetryPolicy:
+    """
+    Retry and client-side throttling policy shared by all the Boto3Client and Boto3Resource wrappers.
+
+    Failed calls, including throttled ones, are retried by botocore with exponential backoff and jitter, up to a total
+    of PCLUSTER_AWS_MAX_ATTEMPTS attempts including the first one; PCLUSTER_AWS_RETRY_MODE selects the botocore retry
+    mode ("standard" or "adaptive"). When PCLUSTER_AWS_MAX_REQUEST_RATE is set, requests sent to each service and
+    region are limited to that rate by a token bucket shared by all the clients of the process.
+    Requests, retries, throttling errors and rate limiter waits are counted by service and region.
+    """
+
+    DEFAULT_MAX_ATTEMPTS = 5
+    DEFAULT_RETRY_MODE = "standard"
+    BACKOFF_BASE = 1
+    MAX_BACKOFF = 20
+
+    _buckets: Dict = {}
+    _stats: Dict = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_max_attempts() -> int:
+        """Return the maximum number of attempts of each call, including the first one."""
+        max_attempts = os.environ.get("PCLUSTER_AWS_MAX_ATTEMPTS")
+        if max_attempts:
+            try:
+                if int(max_attempts) >= 1:
+                    return int(max_attempts)
+            except ValueError:
+                pass
+            LOGGER.warning("Ignoring invalid value of PCLUSTER_AWS_MAX_ATTEMPTS: %s", max_attempts)
+        return RetryPolicy.DEFAULT_MAX_ATTEMPTS
+
+    @staticmethod
+    def get_max_request_rate():
+        """Return the maximum number of requests per second for each service and region, None if not limited."""
+        max_request_rate = os.environ.get("PCLUSTER_AWS_MAX_REQUEST_RATE")
+        if max_request_rate:
+            try:
+                if float(max_request_rate) > 0:
+                    return float(max_request_rate)
+            except ValueError:
+                pass
+            LOGGER.warning("Ignoring invalid value of PCLUSTER_AWS_MAX_REQUEST_RATE: %s", max_request_rate)
+        return None
+
+    @staticmethod
+    def get_backoff_delay(attempt: int) -> float:
+        """Return the delay before retrying the given failed attempt: exponential backoff with full jitter."""
+        return random.uniform(0, min(RetryPolicy.MAX_BACKOFF, RetryPolicy.BACKOFF_BASE * 2 ** (attempt - 1)))
+
+    @staticmethod
+    def get_botocore_config(botocore_config_kwargs: Dict = None) -> Config:
+        """Return the botocore Config with the retry settings of the policy."""
+        config_kwargs = {
+            "retries": {
+                # total_max_attempts includes the first call, while max_attempts would only count the retries
+                "total_max_attempts": RetryPolicy.get_max_attempts(),
+                "mode": os.environ.get("PCLUSTER_AWS_RETRY_MODE", RetryPolicy.DEFAULT_RETRY_MODE),
+            }
+        }
+        config_kwargs.update(botocore_config_kwargs or {})
+        return Config(**config_kwargs)
+
+    @staticmethod
+    def register(client, service: str):
+        """Register the rate limiter and the statistics handlers in the given botocore client."""
+        region = client.meta.region_name
+        stats = RetryPolicy._get_stats(service, region)
+
+        def _limit_request_rate(**kwargs):
+            max_request_rate = RetryPolicy.get_max_request_rate()
+            if max_request_rate:
+                wait_time = RetryPolicy._get_bucket(service, region, max_request_rate).acquire()
+                with RetryPolicy._lock:
+                    stats["requests"] += 1
+                    if wait_time:
+                        stats["rate_limited_waits"] += 1
+                        stats["rate_limited_time"] += wait_time
+            else:
+                with RetryPolicy._lock:
+                    stats["requests"] += 1
+
+        def _count_retries(parsed, **kwargs):
+            retry_attempts = parsed.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+            error_code = parsed.get("Error", {}).get("Code")
+            with RetryPolicy._lock:
+                stats["retries"] += retry_attempts
+                if error_code in AWSClientError.ErrorCode.throttling_error_codes():
+                    stats["throttling_errors"] += 1
+
+        def _count_throttling(response, **kwargs):
+            if (
+                response
+                and response[1].get("Error", {}).get("Code") in AWSClientError.ErrorCode.throttling_error_codes()
+            ):
+                with RetryPolicy._lock:
+                    stats["throttled_requests"] += 1
+
+        client.meta.events.register("before-send.*.*", _limit_request_rate)
+        client.meta.events.register("needs-retry.*.*", _count_throttling)
+        client.meta.events.register("after-call.*.*", _count_retries)
+
+    @staticmethod
+    def _get_bucket(service, region, rate):
+        with RetryPolicy._lock:
+            bucket = RetryPolicy._buckets.get((service, region))
+            if bucket is None or bucket.rate != rate:
+                bucket = RetryPolicy._buckets[(service, region)] = TokenBucket(rate)
+            return bucket
+
+    @staticmethod
+    def _get_stats(service, region):
+        with RetryPolicy._lock:
+            return RetryPolicy._stats.setdefault(
+                (service, region),
+                {
+                    "requests": 0,
+                    "retries": 0,
+                    "throttled_requests": 0,
+                    "throttling_errors": 0,
+                    "rate_limited_waits": 0,
+                    "rate_limited_time": 0.0,
+                },
+            )
+
+    @staticmethod
+    def stats():
+        """
+        Return the statistics of the calls by "service/region".
+
+        requests: number of requests sent, including retries
+        retries: number of retries performed by botocore
+        throttled_requests: number of requests that failed with a throttling error, including retried ones
+        throttling_errors: number of calls that failed with a throttling error after all the retries
+        rate_limited_waits, rate_limited_time: number of requests delayed by the rate limiter and total delay
+        """
+        with RetryPolicy._lock:
+            return {f"{service}/{region}": dict(stats) for (service, region), stats in RetryPolicy._stats.items()}
+
+    @staticmethod
+    def reset_stats():
+        """Reset all the statistics."""
+        with RetryPolicy._lock:
+            RetryPolicy._stats.clear()
+
+
+def _get_boto3_calls_logger(region: str):
+    """Return an event handler logging the boto3 calls performed in the given region."""
+
+    def _log_boto3_calls(params, **kwargs):
+        service = kwargs["event_name"].split(".")[-2]
+        operation = kwargs["event_name"].split(".")[-1]
+        LOGGER.info(
+            "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
+        )
+
+    return _log_boto3_calls
+
+
+_region_scope = threading.local()
+
+
+@contextmanager
+def region_scope(region: str):
+    """
+    Make the AWS clients used by the current thread target the given region instead of AWS_DEFAULT_REGION.
+
+    It allows to perform calls to different regions concurrently, since the environment is shared by all the threads.
+    """
+    previous_region = getattr(_region_scope, "region", None)
+    _region_scope.region = region
+    try:
+        yield
+    finally:
+        _region_scope.region = previous_region
+
+
+class Boto3ClientFactory:
+    """
+    Factory of the boto3 sessions and clients shared by all the Boto3Client wrappers.
+
+    A boto3 session is created for each region and set of credentials taken from the environment, so that
+    credentials, endpoint and service model resolution are performed only once. Clients are thread-safe and are
+    shared by all the wrappers and threads using the same session, service and configuration.
+    Resources are not thread-safe, so a new one is created from the shared session for each wrapper.
+    """
+
+    MAX_POOL_CONNECTIONS = 50
+    CREDENTIALS_ENV_VARIABLES = ["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_SESSION_TOKEN", "AWS_PROFILE"]
+
+    _sessions: Dict = {}
+    _clients: Dict = {}
+    _lock = threading.RLock()
+
+    @staticmethod
+    def session_key():
+        """Return the key identifying the session for the current region and the credentials set in the environment."""
+        credentials = "\0".join(
+            os.environ.get(variable, "") for variable in Boto3ClientFactory.CREDENTIALS_ENV_VARIABLES
+        )
+        region = getattr(_region_scope, "region", None) or os.environ.get("AWS_DEFAULT_REGION")
+        return region, hashlib.sha256(credentials.encode()).hexdigest()
+
+    @staticmethod
+    def get_session():
+        """Return the boto3 session for the region and credentials currently set in the environment."""
+        key = Boto3ClientFactory.session_key()
+        with Boto3ClientFactory._lock:
+            session = Boto3ClientFactory._sessions.get(key)
+            if session is None:
+                session = Boto3ClientFactory._sessions[key] = boto3.session.Session(region_name=key[0])
+            return session
+
+    @staticmethod
+    def get_client(service: str, botocore_config_kwargs: Dict = None):
+        """Return the shared client for the given service, creating it on first use."""
+        config_kwargs = {"max_pool_connections": Boto3ClientFactory.MAX_POOL_CONNECTIONS}
+        config_kwargs.update(botocore_config_kwargs or {})
+        key = (Boto3ClientFactory.session_key(), service, json.dumps(config_kwargs, sort_keys=True))
+        with Boto3ClientFactory._lock:
+            client = Boto3ClientFactory._clients.get(key)
+            if client is None:
+                client = Boto3ClientFactory.get_session().client(
+                    service, config=RetryPolicy.get_botocore_config(config_kwargs)
+                )
+                Boto3ClientFactory._register_handlers(client, service)
+                Boto3ClientFactory._clients[key] = client
+            return client
+
+    @staticmethod
+    def get_resource(service: str):
+        """Return a new resource for the given service, created from the shared session."""
+        with Boto3ClientFactory._lock:
+            resource = Boto3ClientFactory.get_session().resource(service, config=RetryPolicy.get_botocore_config())
+        Boto3ClientFactory._register_handlers(resource.meta.client, service)
+        return resource
+
+    @staticmethod
+    def _register_handlers(client, service: str):
+        client.meta.events.register("provide-client-params.*.*", _get_boto3_calls_logger(client.meta.region_name))
+        RetryPolicy.register(client, service)
+
+    @staticmethod
+    def reset():
+        """Discard all the sessions and clients."""
+        with Boto3ClientFactory._lock:
+            Boto3ClientFactory._sessions.clear()
+            Boto3ClientFactory._clients.clear()
 
 
 class Boto3Client(ABC):
     """Abstract Boto3 client."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._client = Boto3ClientFactory.get_client(client_name, botocore_config_kwargs)
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -164,14 +468,277 @@ class Boto3Resource(ABC):
     """Abstract Boto3 resource."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
-        self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._resource = Boto3ClientFactory.get_resource(resource_name)
+
+
+class _CacheStore:
+    """
+    Bounded LRU store backing a single cached function.
+
+    Entries are evicted in least-recently-used order when the store is full and are discarded when their time-to-live
+    expires. Concurrent invocations for the same key wait for the first one to complete instead of running in parallel.
+    A value whose key is invalidated while it is being computed is returned to its caller but not stored, since it may
+    reflect the state preceding the invalidation.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, expiration time)
+        self._in_flight = {}  # key -> Event set when the value has been computed
+        self._invalidated = set()  # keys invalidated while their value is being computed
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidated.update(self._in_flight)
+
+    def invalidate(self, key):
+        """Remove the entry for the given key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+            if key in self._in_flight:
+                self._invalidated.add(key)
+
+    def get(self, key):
+        """Return a tuple (found, value) for the given key, without computing it when missing."""
+        with self._lock:
+            return self._get(key)
+
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expiration = entry
+            if expiration is None or expiration > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        return False, None
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for the given key, calling compute to generate it when missing or expired."""
+        while True:
+            with self._lock:
+                found, value = self._get(key)
+                if found:
+                    return value
+                event = self._in_flight.get(key)
+                owner = event is None
+                if owner:
+                    event = self._in_flight[key] = threading.Event()
+                    self.misses += 1
+
+            if not owner:
+                # Another thread is computing the same value: wait for it and read it from the cache.
+                # If that computation failed, the next iteration will compute the value again.
+                event.wait()
+                continue
+
+            try:
+                value = compute()
+                with self._lock:
+                    if key not in self._invalidated:
+                        self._put(key, value)
+                return value
+            finally:
+                with self._lock:
+                    del self._in_flight[key]
+                    self._invalidated.discard(key)
+                event.set()
+
+    def put(self, key, value):
+        """Store the value for the given key, evicting the least recently used entries if the store is full."""
+        with self._lock:
+            self._put(key, value)
+
+    def _put(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl if self.ttl is not None else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """Return hits, misses, evictions and current size of the store."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
+
+
+class _FunctionCacheStore(_CacheStore):
+    """
+    Store backing a function decorated with Cache.cached, optionally backed by the PersistentCache.
+
+    Persisted entries do not outlive the time-to-live of the in-memory ones, capped by PCLUSTER_PERSISTENT_CACHE_TTL.
+    """
+
+    def __init__(
+        self, name: str, maxsize: int, ttl: float = None, persistent: bool = False, serialize=None, deserialize=None
+    ):
+        super().__init__(name, maxsize, ttl)
+        self.persistent = persistent
+        self.serialize = serialize
+        self.deserialize = deserialize
+
+    @staticmethod
+    def _key(args, kwargs):
+        return Cache._make_key(args), Cache._make_key(kwargs)
+
+    @staticmethod
+    def _persistent_key(args, kwargs):
+        # The first argument (self) is the client instance, which is not part of the persisted key
+        return [args[1:], kwargs]
+
+    def _use_persistent_cache(self):
+        return self.persistent and PersistentCache.is_enabled()
+
+    def _persistent_ttl(self):
+        persistent_ttl = PersistentCache.get_ttl()
+        return min(self.ttl, persistent_ttl) if self.ttl is not None else persistent_ttl
+
+    def call(self, func, args, kwargs):
+        """Return the cached result of func for the given arguments, calling it when missing."""
+        if not self._use_persistent_cache():
+            return self.get_or_compute(self._key(args, kwargs), lambda: func(*args, **kwargs))
+        return self.get_or_compute(
+            self._key(args, kwargs),
+            lambda: PersistentCache.get_or_compute(
+                self.name,
+                self._persistent_key(args, kwargs),
+                lambda: func(*args, **kwargs),
+                self.serialize,
+                self.deserialize,
+                self._persistent_ttl(),
+            ),
+        )
+
+    def lookup(self, args, kwargs):
+        """Return a tuple (found, value) with the cached result for the given arguments, if any."""
+        key = self._key(args, kwargs)
+        found, value = self.get(key)
+        if not found and self._use_persistent_cache():
+            found, value = PersistentCache.get(self.name, self._persistent_key(args, kwargs), self.deserialize)
+            if found:
+                self.put(key, value)
+        return found, value
+
+    def store(self, value, args, kwargs):
+        """Store the given value as the result for the given arguments."""
+        self.put(self._key(args, kwargs), value)
+        if self._use_persistent_cache():
+            PersistentCache.put(
+                self.name, self._persistent_key(args, kwargs), value, self.serialize, self._persistent_ttl()
+            )
+
+
+class PersistentCache:
+    """
+    On-disk cache, shared by concurrent processes, for data that changes rarely, e.g. instance types information.
+
+    The cache is disabled by default and can be enabled by setting the PCLUSTER_PERSISTENT_CACHE environment variable
+    to "true". Entries are stored as JSON files in the PCLUSTER_PERSISTENT_CACHE_DIR directory (~/.parallelcluster/cache
+    by default), scoped by partition, region and account, and expire after PCLUSTER_PERSISTENT_CACHE_TTL seconds.
+    """
+
+    DEFAULT_DIR = os.path.join("~", ".parallelcluster", "cache")
+    DEFAULT_TTL = 24 * 60 * 60
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return os.environ.get("PCLUSTER_PERSISTENT_CACHE", "false").lower() == "true" and Cache.is_enabled()
+
+    @staticmethod
+    def get_ttl():
+        """Return the time-to-live in seconds of the persisted entries."""
+        return float(os.environ.get("PCLUSTER_PERSISTENT_CACHE_TTL", PersistentCache.DEFAULT_TTL))
+
+    @staticmethod
+    def get_scope_dir():
+        """Return the directory containing the entries of the current partition, region and account."""
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+        from pcluster.utils import get_partition  # pylint: disable=import-outside-toplevel
+
+        cache_dir = os.path.expanduser(os.environ.get("PCLUSTER_PERSISTENT_CACHE_DIR", PersistentCache.DEFAULT_DIR))
+        return os.path.join(cache_dir, get_partition(), get_region(), AWSApi.instance().sts.get_account_id())
+
+    @staticmethod
+    def _entry_path(name, key):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(PersistentCache.get_scope_dir(), name, f"{digest}.json")
+
+    @staticmethod
+    def get(name: str, key, deserialize=None):
+        """
+        Return a tuple (found, value) with the persisted value for the given key.
+
+        :param name: name of the cached function, used to group its entries
+        :param key: JSON serializable key; if the key is not serializable, the persistent cache is bypassed
+        :param deserialize: function converting the persisted JSON object back to the value
+        """
+        try:
+            path = PersistentCache._entry_path(name, key)
+            with open(path, encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+            if entry["expiration"] > time.time():
+                LOGGER.debug("Persistent cache hit for %s", name)
+                return True, deserialize(entry["value"]) if deserialize else entry["value"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            LOGGER.debug("Ignoring persistent cache entry of %s: %s", name, e)
+        return False, None
+
+    @staticmethod
+    def put(name: str, key, value, serialize=None, ttl: float = None):
+        """
+        Persist the value for the given key.
+
+        :param serialize: function converting the value to a JSON serializable object
+        :param ttl: time-to-live in seconds of the entry, PCLUSTER_PERSISTENT_CACHE_TTL if not specified
+        """
+        try:
+            PersistentCache._write_entry(
+                PersistentCache._entry_path(name, key), serialize(value) if serialize else value, ttl
+            )
+        except Exception as e:
+            LOGGER.debug("Unable to write persistent cache entry of %s: %s", name, e)
+
+    @staticmethod
+    def get_or_compute(name: str, key, compute, serialize=None, deserialize=None, ttl: float = None):
+        """Return the persisted value for the given key, calling compute to generate and persist it when missing."""
+        found, value = PersistentCache.get(name, key, deserialize)
+        if not found:
+            value = compute()
+            PersistentCache.put(name, key, value, serialize, ttl)
+        return value
+
+    @staticmethod
+    def _write_entry(path, value, ttl: float = None):
+        """Write the entry atomically, so that concurrent readers never see a partially written file."""
+        expiration = time.time() + (ttl if ttl is not None else PersistentCache.get_ttl())
+        content = json.dumps({"expiration": expiration, "value": value})
+        directory = os.path.dirname(path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_file.name, path)
 
 
 class Cache:
     """Simple utility class providing a cache mechanism for expensive functions."""
 
-    _caches = []
+    DEFAULT_MAXSIZE = 256
+
+    _caches: List[_CacheStore] = []
 
     @staticmethod
     def is_enabled():
@@ -179,58 +746,101 @@ class Cache:
         return not os.environ.get("PCLUSTER_CACHE_DISABLED")
 
     @staticmethod
-    def clear_all():
-        """Clear the content of all caches."""
+    def clear_all(preserve_ttl: bool = False):
+        """
+        Clear the content of all caches.
+
+        :param preserve_ttl: if True, caches whose entries have a time-to-live are preserved, since their entries
+        expire on their own.
+        """
         for cache in Cache._caches:
-            cache.clear()
+            if not (preserve_ttl and cache.ttl is not None):
+                cache.clear()
+
+    @staticmethod
+    def stats():
+        """Return the usage statistics of all the caches, by cached function name."""
+        return {cache.name: cache.stats() for cache in Cache._caches}
+
+    @staticmethod
+    def create_store(name: str, maxsize: int = DEFAULT_MAXSIZE, ttl: float = None) -> _CacheStore:
+        """
+        Create a cache store for values that are not the result of a single function, e.g. generated artifacts.
+
+        The store is cleared and reported in the statistics together with the caches of the decorated functions.
+        """
+        cache = _CacheStore(name, maxsize, ttl)
+        Cache._caches.append(cache)
+        return cache
 
     @staticmethod
     def _make_key(val):
-        if isinstance(val, list):
-            key = hash(tuple(Cache._make_key(x) for x in val))
-        elif isinstance(val, tuple):
-            key = hash(val)
+        """Turn the given value into a hashable key, preserving equality semantics of lists, dicts and sets."""
+        if isinstance(val, (list, tuple)):
+            key = (type(val).__name__,) + tuple(Cache._make_key(x) for x in val)
         elif isinstance(val, dict):
-            key = hash(tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys())))
+            key = ("dict",) + tuple((key, Cache._make_key(val[key])) for key in sorted(val.keys(), key=repr))
+        elif isinstance(val, (set, frozenset)):
+            key = ("set", frozenset(Cache._make_key(x) for x in val))
         else:
-            key = hash(val)
+            key = val
         return key
 
     @staticmethod
-    def cached(function):
+    def cached(
+        function=None,
+        *,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = None,
+        persistent: bool = False,
+        serialize=None,
+        deserialize=None,
+    ):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        It can be used either as @Cache.cached or as @Cache.cached(maxsize=..., ttl=...).
+        Results are kept up to a maximum of maxsize entries, evicting the least recently used ones, and, if ttl is
+        specified, for no longer than ttl seconds.
+        If persistent is True, results are also stored in the PersistentCache when it is enabled. It is meant to be
+        used on methods of the AWS clients: the first argument (self) is not part of the persisted key. Persisted
+        results expire after ttl seconds as well, capped by the time-to-live of the PersistentCache.
+        serialize and deserialize convert results to and from JSON serializable objects.
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
-        Cache._caches.append(cache)
 
-        @functools.wraps(function)
-        def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
-                else:
-                    return_value = function(*args, **kwargs)
+        def decorator(func):
+            cache = _FunctionCacheStore(func.__qualname__, maxsize, ttl, persistent, serialize, deserialize)
+            Cache._caches.append(cache)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not Cache.is_enabled():
+                    return func(*args, **kwargs)
+                return cache.call(func, args, kwargs)
+
+            def cache_lookup(*args, **kwargs):
+                """Return a tuple (found, value) with the cached result for the given arguments, if any."""
+                return cache.lookup(args, kwargs) if Cache.is_enabled() else (False, None)
+
+            def cache_store(value, *args, **kwargs):
+                """Store the given value as the result for the given arguments, e.g. when retrieved in bulk."""
                 if Cache.is_enabled():
-                    cache[cache_key] = return_value
-                return return_value
+                    cache.store(value, args, kwargs)
 
-        return wrapper
+            wrapper.cache = cache
+            wrapper.cache_lookup = cache_lookup
+            wrapper.cache_store = cache_store
+            return wrapper
+
+        return decorator(function) if function else decorator
 
 
 def get_region():
     """Get region used internally for all the AWS calls."""
-    region = boto3.session.Session().region_name
+    region = Boto3ClientFactory.get_session().region_name
     if region is None:
         raise AWSClientError("get_region", "AWS region not configured")
     return region
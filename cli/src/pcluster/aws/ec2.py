@@ -8,8 +8,9 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
 import re
-from typing import List
+from typing import Dict, List
 
 from botocore.exceptions import ClientError
 
@@ -25,7 +26,17 @@ from pcluster.constants import (
     PCLUSTER_IMAGE_ID_TAG,
     SUPPORTED_ARCHITECTURES,
 )
-from pcluster.utils import get_partition
+from pcluster.utils import get_partition, grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of instance types that can be passed to a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_MAX_ITEMS = 100
+
+# Time-to-live, in seconds, of cached data that rarely or never changes, which can then be reused across API requests
+INSTANCE_TYPES_CACHE_TTL = 6 * 60 * 60
+OFFICIAL_IMAGES_CACHE_TTL = 60 * 60
+NETWORKING_CACHE_TTL = 60 * 60
 
 
 class Ec2Client(Boto3Client):
@@ -35,13 +46,15 @@ class Ec2Client(Boto3Client):
         super().__init__("ec2")
         self.additional_instance_types_data = {}
 
-    @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
     def list_instance_types(self) -> List[str]:
         """Return a list of instance types."""
-        return [offering.get("InstanceType") for offering in self.describe_instance_type_offerings()] + list(
-            self.additional_instance_types_data.keys()
-        )
+        return self._list_offered_instance_types() + list(self.additional_instance_types_data.keys())
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=INSTANCE_TYPES_CACHE_TTL, persistent=True)
+    def _list_offered_instance_types(self) -> List[str]:
+        """Return the list of instance types offered in the region."""
+        return [offering.get("InstanceType") for offering in self.describe_instance_type_offerings()]
 
     @AWSExceptionHandler.handle_client_exception
     def describe_instance_type_offerings(self, filters=None, location_type=None):
@@ -52,7 +65,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=INSTANCE_TYPES_CACHE_TTL)
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -70,7 +83,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_subnets, SubnetIds=subnet_ids))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(maxsize=1024, ttl=NETWORKING_CACHE_TTL)
     def get_subnet_avail_zone(self, subnet_id):
         """Return the availability zone associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -79,7 +92,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(maxsize=1024, ttl=NETWORKING_CACHE_TTL)
     def get_subnet_vpc(self, subnet_id):
         """Return a vpc associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -215,17 +228,68 @@ class Ec2Client(Boto3Client):
             .get("Value")
         )
 
-    @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
+        additional_instance_type_data = self.additional_instance_types_data.get(instance_type)
+        if additional_instance_type_data:
+            return InstanceTypeInfo(additional_instance_type_data)
+        return self._describe_instance_type(instance_type)
+
+    @AWSExceptionHandler.handle_client_exception
+    def get_instance_types_info(self, instance_types: List[str]) -> Dict[str, InstanceTypeInfo]:
+        """
+        Return the information of the given instance types, retrieving all the missing ones in bulk.
+
+        DescribeInstanceTypes is called for batches of up to 100 instance types not already cached, and results are
+        stored in the cache used by get_instance_type_info.
+        Instance types that cannot be described, e.g. because invalid, are not part of the result.
+        """
+        result = {}
+        missing_instance_types = []
+        for instance_type in dict.fromkeys(instance_types):
+            if instance_type in self.additional_instance_types_data:
+                result[instance_type] = InstanceTypeInfo(self.additional_instance_types_data[instance_type])
+                continue
+            found, instance_type_info = Ec2Client._describe_instance_type.cache_lookup(self, instance_type)
+            if found:
+                result[instance_type] = instance_type_info
+            else:
+                missing_instance_types.append(instance_type)
+
+        for instance_types_batch in grouper(missing_instance_types, DESCRIBE_INSTANCE_TYPES_MAX_ITEMS):
+            try:
+                instance_types_data = list(
+                    self._paginate_results(
+                        self._client.describe_instance_types, InstanceTypes=list(instance_types_batch)
+                    )
+                )
+            except ClientError as e:
+                # The whole batch fails when any instance type is invalid; they will be described one by one on use
+                LOGGER.debug("Unable to describe instance types %s: %s", instance_types_batch, e)
+                continue
+            for instance_type_data in instance_types_data:
+                instance_type_info = InstanceTypeInfo(instance_type_data)
+                Ec2Client._describe_instance_type.cache_store(
+                    instance_type_info, self, instance_type_info.instance_type()
+                )
+                result[instance_type_info.instance_type()] = instance_type_info
+        return result
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(
+        maxsize=1024,
+        ttl=INSTANCE_TYPES_CACHE_TTL,
+        persistent=True,
+        serialize=lambda instance_type_info: instance_type_info.instance_type_data,
+        deserialize=InstanceTypeInfo,
+    )
+    def _describe_instance_type(self, instance_type):
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
         )
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(maxsize=1024, ttl=INSTANCE_TYPES_CACHE_TTL)
     def get_supported_architectures(self, instance_type):
         """Return a list of architectures supported for the given instance type."""
         instance_info = self.get_instance_type_info(instance_type)
@@ -235,7 +299,7 @@ class Ec2Client(Boto3Client):
         return list(set(supported_architectures) & set(SUPPORTED_ARCHITECTURES))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(ttl=OFFICIAL_IMAGES_CACHE_TTL, persistent=True)
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
@@ -288,11 +352,14 @@ class Ec2Client(Boto3Client):
     @AWSExceptionHandler.handle_client_exception
     def list_instance_ids(self, filters):
         """Retrieve a filtered list of instance ids."""
-        return [
-            instance.get("InstanceId")
-            for result in self._paginate_results(self._client.describe_instances, Filters=filters)
-            for instance in result.get("Instances")
-        ]
+        return list(self.iter_instance_ids(filters))
+
+    @AWSExceptionHandler.handle_client_exception
+    def iter_instance_ids(self, filters):
+        """Yield the ids of the instances matching the filters as the result pages are retrieved."""
+        for result in self._paginate_results(self._client.describe_instances, Filters=filters):
+            for instance in result.get("Instances"):
+                yield instance.get("InstanceId")
 
     @AWSExceptionHandler.handle_client_exception
     def describe_instances(self, filters, next_token=None):
@@ -307,7 +374,7 @@ class Ec2Client(Boto3Client):
         return instances, response.get("NextToken")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(maxsize=1024, ttl=INSTANCE_TYPES_CACHE_TTL)
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
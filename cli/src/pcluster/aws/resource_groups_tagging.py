@@ -0,0 +1,41 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from pcluster.aws.common import AWSExceptionHandler, Boto3Client
+
+
+class ResourceGroupsTaggingClient(Boto3Client):
+    """Resource Groups Tagging API Boto3 client."""
+
+    MAX_RESOURCES_PER_PAGE = 100
+
+    def __init__(self):
+        super().__init__("resourcegroupstaggingapi")
+
+    @AWSExceptionHandler.handle_client_exception
+    def get_resources_with_tag(self, tag_key: str, resource_type: str, next_token: str = None):
+        """
+        Return a page of the ARNs of the resources of the given type carrying the given tag, filtered server-side.
+
+        :param tag_key: key of the tag, with any value
+        :param resource_type: resource type, e.g. cloudformation:stack
+        :param next_token: token of the page to retrieve
+        :return: a tuple with the list of ARNs and the token of the next page, if any
+        """
+        kwargs = {
+            "TagFilters": [{"Key": tag_key}],
+            "ResourceTypeFilters": [resource_type],
+            "ResourcesPerPage": self.MAX_RESOURCES_PER_PAGE,
+        }
+        if next_token:
+            kwargs["PaginationToken"] = next_token
+        result = self._client.get_resources(**kwargs)
+        resource_arns = [resource["ResourceARN"] for resource in result.get("ResourceTagMappingList", [])]
+        return resource_arns, result.get("PaginationToken") or None
@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
@@ -16,6 +17,11 @@ from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
 class S3Client(Boto3Client):
     """S3 Boto3 client."""
 
+    # Files and file-like objects larger than the threshold are uploaded with concurrent multipart uploads
+    TRANSFER_CONFIG = TransferConfig(
+        multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=4
+    )
+
     def __init__(self):
         super().__init__("s3", botocore_config_kwargs={"s3": {"addressing_style": "virtual"}})
 
@@ -47,9 +53,10 @@ class S3Client(Boto3Client):
             )
 
     @AWSExceptionHandler.handle_client_exception
-    def put_object(self, bucket_name, body, key):
+    def put_object(self, bucket_name, body, key, metadata: dict = None):
         """Upload object content to s3."""
-        return self._client.put_object(Bucket=bucket_name, Body=body, Key=key)
+        optional_args = {"Metadata": metadata} if metadata else {}
+        return self._client.put_object(Bucket=bucket_name, Body=body, Key=key, **optional_args)
 
     @AWSExceptionHandler.handle_client_exception
     def get_object(self, bucket_name, key, version_id=None):
@@ -107,14 +114,26 @@ class S3Client(Boto3Client):
         self._client.put_bucket_policy(Bucket=bucket_name, Policy=policy)
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_fileobj(self, bucket_name, file_obj, key):
+    def upload_fileobj(self, bucket_name, file_obj, key, metadata: dict = None):
         """Upload file-like object to S3 bucket."""
-        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key)
+        self._client.upload_fileobj(
+            Fileobj=file_obj,
+            Bucket=bucket_name,
+            Key=key,
+            ExtraArgs={"Metadata": metadata} if metadata else None,
+            Config=self.TRANSFER_CONFIG,
+        )
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_file(self, bucket_name, file_path, key):
+    def upload_file(self, bucket_name, file_path, key, metadata: dict = None):
         """Upload file to S3 bucket."""
-        self._client.upload_file(Filename=file_path, Bucket=bucket_name, Key=key)
+        self._client.upload_file(
+            Filename=file_path,
+            Bucket=bucket_name,
+            Key=key,
+            ExtraArgs={"Metadata": metadata} if metadata else None,
+            Config=self.TRANSFER_CONFIG,
+        )
 
     @AWSExceptionHandler.handle_client_exception
     def create_presigned_url(self, bucket_name, object_name, version_id=None, expiration=3600):
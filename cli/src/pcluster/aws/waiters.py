@@ -0,0 +1,196 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import threading
+import time
+from typing import Callable, Collection, Dict, List, Tuple
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import StackNotFoundError
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WaiterTimeoutError(TimeoutError):
+    """Raised when the deadline of a wait expires."""
+
+    pass
+
+
+class WaiterCancelledError(Exception):
+    """Raised when a wait is cancelled."""
+
+    pass
+
+
+class Waiter:
+    """
+    Poll a condition with adaptive backoff until it is met, the deadline expires or the wait is cancelled.
+
+    The delay between two polls grows by the backoff factor while nothing changes, up to max_delay, and shrinks back
+    towards min_delay when a poll reports progress.
+    """
+
+    def __init__(
+        self,
+        min_delay: float,
+        max_delay: float,
+        timeout: float = None,
+        backoff: float = 2,
+        cancel_event: threading.Event = None,
+    ):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.backoff = backoff
+        self.cancel_event = cancel_event
+
+    def wait(self, poll: Callable[[], Tuple[bool, bool]]):
+        """
+        Call poll until it reports that the wait is over.
+
+        :param poll: function returning whether the condition is met and whether any progress was observed
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        delay = self.min_delay
+        while True:
+            done, progressed = poll()
+            if done:
+                return
+            delay = (
+                max(self.min_delay, delay / self.backoff) if progressed else min(self.max_delay, delay * self.backoff)
+            )
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise WaiterTimeoutError(f"Wait did not complete within {self.timeout} seconds.")
+                delay = min(delay, remaining)
+            self._sleep(delay)
+
+    def _sleep(self, delay: float):
+        if self.cancel_event is None:
+            time.sleep(delay)
+        elif self.cancel_event.wait(delay):
+            raise WaiterCancelledError("Wait cancelled.")
+
+
+class StackWaiter:
+    """
+    Wait for a CloudFormation stack to leave its in-progress states, tailing its events.
+
+    Every poll retrieves only the stack events newer than the last seen one, usually a single DescribeStackEvents
+    call, reports them through the callback and ends the wait as soon as an event of the stack itself shows a status
+    out of the waiting states. The status of the stack is described again only after a quiet period without events.
+    """
+
+    STACK_RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+    DEFAULT_MIN_DELAY = 5
+    DEFAULT_MAX_DELAY = 30
+
+    def __init__(
+        self,
+        stack_name: str,
+        on_event: Callable[[Dict], None] = None,
+        timeout: float = None,
+        min_delay: float = DEFAULT_MIN_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        cancel_event: threading.Event = None,
+    ):
+        self.stack_name = stack_name
+        self.on_event = on_event
+        self._waiter = Waiter(min_delay, max_delay, timeout=timeout, cancel_event=cancel_event)
+        self._stack_id = stack_name
+        self._last_event_id = None
+        self._quiet_polls = 0
+
+    def wait(self, waiting_states: Collection[str] = None) -> str:
+        """
+        Wait for the stack to reach a status out of the waiting states.
+
+        :param waiting_states: statuses to wait on, all the *_IN_PROGRESS ones by default
+        :return: the final status of the stack, DELETE_COMPLETE if the stack does not exist
+        """
+        status = self._describe_status()
+        if not self._is_waiting(status, waiting_states):
+            return status
+        # Events already present when the wait starts are not reported, except the most recent one
+        events = self._get_new_events(max_pages=1)
+        if events:
+            self._report(events[-1:])
+
+        def _poll():
+            nonlocal status
+            new_events = self._get_new_events()
+            self._report(new_events)
+            for event in reversed(new_events):
+                if self._is_stack_event(event):
+                    status = event["ResourceStatus"]
+                    break
+            if new_events:
+                self._quiet_polls = 0
+            else:
+                self._quiet_polls += 1
+                # Fall back to the stack status, in case the final event was published before the tail started
+                if self._quiet_polls % 3 == 0:
+                    status = self._describe_status()
+            return not self._is_waiting(status, waiting_states), bool(new_events)
+
+        self._waiter.wait(_poll)
+        return status
+
+    def _describe_status(self) -> str:
+        try:
+            stack = AWSApi.instance().cfn.describe_stack(self._stack_id)
+        except StackNotFoundError:
+            return "DELETE_COMPLETE"
+        # The stack id identifies the stack and its events even after it is deleted
+        self._stack_id = stack.get("StackId", self._stack_id)
+        self.stack_name = stack.get("StackName", self.stack_name)
+        return stack.get("StackStatus")
+
+    def _get_new_events(self, max_pages: int = None) -> List[Dict]:
+        """Return the events newer than the last seen one, oldest first."""
+        new_events = []
+        next_token = None
+        pages = 0
+        while True:
+            response = AWSApi.instance().cfn.get_stack_events(self._stack_id, next_token=next_token)
+            pages += 1
+            for event in response.get("StackEvents", []):
+                if event.get("EventId") == self._last_event_id:
+                    next_token = None
+                    break
+                new_events.append(event)
+            else:
+                next_token = response.get("NextToken")
+            if not next_token or (max_pages and pages >= max_pages):
+                break
+        if new_events:
+            self._last_event_id = new_events[0].get("EventId")
+        return list(reversed(new_events))
+
+    def _report(self, events: List[Dict]):
+        for event in events:
+            LOGGER.debug("Stack event: %s", event)
+            if self.on_event:
+                self.on_event(event)
+
+    def _is_stack_event(self, event: Dict) -> bool:
+        return (
+            event.get("LogicalResourceId") == self.stack_name
+            and event.get("ResourceType", self.STACK_RESOURCE_TYPE) == self.STACK_RESOURCE_TYPE
+        )
+
+    @staticmethod
+    def _is_waiting(status: str, waiting_states: Collection[str] = None) -> bool:
+        if waiting_states is None:
+            return status.endswith("_IN_PROGRESS")
+        return status in waiting_states
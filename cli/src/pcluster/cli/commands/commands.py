@@ -17,5 +17,6 @@ from pcluster.cli.commands.cluster_logs import ExportClusterLogsCommand
 from pcluster.cli.commands.configure.command import ConfigureCommand
 from pcluster.cli.commands.dcv_connect import DcvConnectCommand
 from pcluster.cli.commands.image_logs import ExportImageLogsCommand
+from pcluster.cli.commands.inventory import ListInventoryCommand
 from pcluster.cli.commands.ssh import SshCommand
 from pcluster.cli.commands.version import VersionCommand
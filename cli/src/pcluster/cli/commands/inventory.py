@@ -0,0 +1,114 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+# pylint: disable=import-outside-toplevel
+
+import json
+import logging
+import sys
+from functools import partial
+from typing import List
+
+from argparse import ArgumentParser, Namespace
+
+from pcluster.cli.commands.common import CliCommand, exit_msg
+from pcluster.constants import SUPPORTED_REGIONS
+
+LOGGER = logging.getLogger(__name__)
+
+CLUSTER_STATUSES = [
+    "CREATE_IN_PROGRESS",
+    "CREATE_FAILED",
+    "CREATE_COMPLETE",
+    "DELETE_IN_PROGRESS",
+    "DELETE_FAILED",
+    "UPDATE_IN_PROGRESS",
+    "UPDATE_COMPLETE",
+    "UPDATE_FAILED",
+]
+IMAGE_STATUSES = ["AVAILABLE", "PENDING", "FAILED"]
+
+
+def _to_region(in_str):
+    if in_str not in SUPPORTED_REGIONS:
+        exit_msg(f"Bad Request: invalid or unsupported region '{in_str}'")
+    return in_str
+
+
+def _print_region_inventory(region_inventory, resource_type):
+    """Print the resources of a region as soon as they are listed, on stderr so that the output can still be parsed."""
+    from pcluster.api import encoder
+
+    if not sys.stderr.isatty():
+        return
+    if region_inventory.error:
+        region_result = {"region": region_inventory.region, "message": str(region_inventory.error)}
+    else:
+        region_result = {"region": region_inventory.region, resource_type: region_inventory.items}
+    sys.stderr.write(f"{encoder.JSONEncoder().encode(region_result)}\n")
+
+
+class ListInventoryCommand(CliCommand):
+    """Implement pcluster list-inventory command."""
+
+    # CLI
+    name = "list-inventory"
+    help = "Retrieve the list of existing clusters or custom images in multiple AWS Regions, queried concurrently."
+    description = (
+        f"{help} When run in a terminal, the resources of each Region are also printed to stderr as soon as they are "
+        "listed."
+    )
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, region_arg=False, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "--regions", nargs="+", type=_to_region, required=True, help="AWS Regions to list the resources of."
+        )
+        parser.add_argument(
+            "--resource-type",
+            choices=["clusters", "images"],
+            default="clusters",
+            help="Type of the resources to list. (Defaults to 'clusters'.)",
+        )
+        parser.add_argument(
+            "--cluster-status",
+            nargs="+",
+            choices=CLUSTER_STATUSES,
+            help="Filter clusters by cluster status. (Defaults to all clusters.)",
+        )
+        parser.add_argument(
+            "--image-status",
+            choices=IMAGE_STATUSES,
+            default="AVAILABLE",
+            help="Filter images by image status. (Defaults to 'AVAILABLE'.)",
+        )
+
+    def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        from pcluster.api import encoder
+        from pcluster.api.controllers.cluster_operations_controller import list_region_clusters
+        from pcluster.api.controllers.image_operations_controller import list_region_images
+        from pcluster.models.inventory import Inventory
+
+        if args.resource_type == "clusters":
+            list_function = partial(list_region_clusters, cluster_status=args.cluster_status)
+        else:
+            list_function = partial(list_region_images, args.image_status)
+
+        inventory = Inventory(args.regions)
+        region_inventories = []
+        for region_inventory in inventory.iter_regions(list_function):
+            region_inventories.append(region_inventory)
+            _print_region_inventory(region_inventory, args.resource_type)
+
+        items, failures = inventory.merge(region_inventories)
+        result = {
+            args.resource_type: items,
+            "failures": [{"region": region, "message": message} for region, message in failures.items()],
+        }
+        return json.loads(encoder.JSONEncoder().encode(result))
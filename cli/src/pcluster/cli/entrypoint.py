@@ -12,7 +12,6 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
-import inspect
 import json
 import logging.config
 import os
@@ -23,17 +22,11 @@ from functools import partial
 import argparse
 from botocore.exceptions import NoCredentialsError  # TODO: remove
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller
-import pcluster.api.controllers.cluster_instances_controller
-import pcluster.api.controllers.cluster_operations_controller
-import pcluster.api.controllers.image_operations_controller
-import pcluster.api.errors
-import pcluster.cli.commands.commands as cli_commands
+# Controllers and CLI commands are imported on dispatch (see pcluster.cli.model.call and add_cli_commands) so that
+# only the modules required by the requested command are loaded.
 import pcluster.cli.logger as pcluster_logging
 import pcluster.cli.model
-from pcluster.api import encoder
-from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number
+from pcluster.cli.commands.common import exit_msg, to_bool, to_int, to_number
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 from pcluster.cli.logger import redirect_stdouterr_to_logger
 from pcluster.cli.middleware import add_additional_args, middleware_hooks
@@ -106,8 +99,12 @@ def dispatch(model, args):
         return dispatch_func(**kwargs)
 
 
-def gen_parser(model):
-    """Take a model and returns an ArgumentParser for CLI parsing."""
+def gen_parser(model, operations=None):
+    """Take a model and returns an ArgumentParser for CLI parsing.
+
+    Every operation gets a subparser, but only the ones listed in operations (all of them when None) get their
+    arguments, since building the arguments of every operation is wasted work when a single one is invoked.
+    """
     desc = (
         "pcluster is the AWS ParallelCluster CLI and permits "
         "launching and management of HPC clusters in the AWS cloud."
@@ -124,6 +121,8 @@ def gen_parser(model):
         op_help = operation.get("description", f"{op_name} command help")
         subparser = subparsers.add_parser(op_name, help=op_help, description=op_help)
         parser_map[op_name] = subparser
+        if operations is not None and op_name not in operations:
+            continue
 
         for param in operation["params"]:
             help = param.get("description", "")
@@ -165,18 +164,29 @@ def gen_parser(model):
     return parser, parser_map
 
 
-def add_cli_commands(parser_map):
-    """Add additional CLI arguments that don't belong to the API."""
+def add_cli_commands(parser_map, commands=None, operations=None):
+    """Add additional CLI arguments that don't belong to the API.
+
+    Commands are described by name, help and class name (see pcluster.cli.model.load_cli_commands); only the classes
+    of the commands listed in operations (all of them when None) are imported and instantiated.
+    """
     subparsers = parser_map["subparser"]
 
     # add all non-api commands via introspection
-    for _name, obj in inspect.getmembers(cli_commands):
-        if inspect.isclass(obj) and issubclass(obj, CliCommand) and not inspect.isabstract(obj):
-            obj(subparsers)
+    for command in commands if commands is not None else pcluster.cli.model.load_cli_commands():
+        if operations is None or command["name"] in operations:
+            pcluster.cli.model.get_function_from_name(command["class"])(subparsers)
+        else:
+            subparsers.add_parser(command["name"], help=command["help"])
 
     add_additional_args(parser_map)
 
 
+def _requested_operation(sys_args):
+    """Return the name of the requested operation, i.e. the first positional argument, if any."""
+    return next((arg for arg in sys_args if not arg.startswith("-")), None)
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
@@ -189,6 +199,9 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
+            import pcluster.api.errors  # pylint: disable=import-outside-toplevel
+            from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
             # format exception messages in the same manner as the api
             message = pcluster.api.errors.exception_message(e)
             error_encoded = encoder.JSONEncoder().encode(message)
@@ -198,10 +211,15 @@ def _run_operation(model, args, extra_args):
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
-    parser, parser_map = gen_parser(model)
-    add_cli_commands(parser_map)
+    commands = None
+    if not model:
+        cli_model = pcluster.cli.model.load_cli_model()
+        model, commands = cli_model["operations"], cli_model["commands"]
+
+    operation = _requested_operation(sys_args)
+    operations = [operation] if operation else []
+    parser, parser_map = gen_parser(model, operations)
+    add_cli_commands(parser_map, commands, operations)
     args, extra_args = parser.parse_known_args(sys_args)
 
     # some commands (e.g. ssh and those defined as CliCommand objects) require 'extra_args'
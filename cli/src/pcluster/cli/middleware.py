@@ -20,17 +20,22 @@ provided.
 """
 
 import logging
+import sys
 
 import argparse
-import boto3
 import jmespath
-from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
 from pcluster.cli.exceptions import APIOperationException, ParameterException
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum time in seconds to wait for a stack operation to complete
+STACK_WAIT_TIMEOUT = 60 * 60
+# Delays in seconds between two polls of the stack, never shorter than the one of the boto3 CloudFormation waiters
+STACK_WAIT_MIN_DELAY = 30
+STACK_WAIT_MAX_DELAY = 60
+
 
 def _cluster_status(cluster_name):
     controller = "cluster_operations_controller"
@@ -39,6 +44,26 @@ def _cluster_status(cluster_name):
     return pcluster.cli.model.call(full_func_name, cluster_name=cluster_name)
 
 
+def _wait_for_stack(stack_name):
+    """Wait for the stack operation to complete, returning the final status of the stack."""
+    # The waiter is only imported when waiting, to keep boto3 out of the CLI startup path
+    from pcluster.aws.cfn import CfnClient  # pylint: disable=import-outside-toplevel
+    from pcluster.aws.waiters import StackWaiter  # pylint: disable=import-outside-toplevel
+
+    def _print_event(event):
+        # Progress is shown on stderr, so that the output of the command can still be parsed
+        if sys.stderr.isatty():
+            sys.stderr.write(f"{CfnClient.format_event(event)}\n")
+
+    return StackWaiter(
+        stack_name,
+        on_event=_print_event,
+        timeout=STACK_WAIT_TIMEOUT,
+        min_delay=STACK_WAIT_MIN_DELAY,
+        max_delay=STACK_WAIT_MAX_DELAY,
+    ).wait()
+
+
 def add_additional_args(parser_map):
     """Add any additional arguments to parsers for individual operations.
 
@@ -76,13 +101,14 @@ def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_update_complete")
         try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
+            status = _wait_for_stack(kwargs["cluster_name"])
+        except Exception as e:
             LOGGER.error("Failed when waiting for cluster update with error: %s", e)
             raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
+        if status != "UPDATE_COMPLETE":
+            LOGGER.error("Cluster update completed with stack status %s", status)
+            raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
         ret = _cluster_status(kwargs["cluster_name"])
     return ret
 
@@ -92,13 +118,14 @@ def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_create_complete")
         try:
-            waiter.wait(StackName=body["clusterName"])
-        except WaiterError as e:
+            status = _wait_for_stack(body["clusterName"])
+        except Exception as e:
             LOGGER.error("Failed when waiting for cluster creation with error: %s", e)
             raise APIOperationException(_cluster_status(body["clusterName"]))
+        if status != "CREATE_COMPLETE":
+            LOGGER.error("Cluster creation completed with stack status %s", status)
+            raise APIOperationException(_cluster_status(body["clusterName"]))
         ret = _cluster_status(body["clusterName"])
     return ret
 
@@ -108,12 +135,12 @@ def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait:
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_delete_complete")
         try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
+            status = _wait_for_stack(kwargs["cluster_name"])
+        except Exception as e:
             LOGGER.error("Failed when waiting for cluster deletion with error: %s", e)
+            status = None
+        if status != "DELETE_COMPLETE":
             raise APIOperationException({"message": f"Failed when deleting cluster '{kwargs['cluster_name']}'."})
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
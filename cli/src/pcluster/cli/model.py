@@ -11,15 +11,19 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import hashlib
 import importlib
+import inspect
 import json
+import logging
+import os
+import tempfile
 
 import jmespath
-import yaml
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
 from pcluster.cli.exceptions import APIOperationException
-from pcluster.utils import to_kebab_case, to_snake_case
+from pcluster.utils import get_installed_version, to_kebab_case, to_snake_case
 
 # For importing package resources
 try:
@@ -27,6 +31,10 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+CLI_MODEL_CACHE_FILE = os.path.join("~", ".parallelcluster", "cache", "cli-model.json")
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -89,6 +97,8 @@ def _resolve_body(spec, operation):
 
 def package_spec():
     """Load the OpenAPI specification from the package."""
+    import yaml  # pylint: disable=import-outside-toplevel
+
     with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:
         return yaml.safe_load(spec_file.read())
 
@@ -151,6 +161,86 @@ def load_model(spec):
     return model
 
 
+def load_cli_commands():
+    """Return name, help and fully qualified class name of the CLI commands that don't belong to the API."""
+    import pcluster.cli.commands.commands as cli_commands  # pylint: disable=import-outside-toplevel
+    from pcluster.cli.commands.common import CliCommand  # pylint: disable=import-outside-toplevel
+
+    return [
+        {"name": obj.name, "help": obj.help, "class": f"{obj.__module__}.{obj.__name__}"}
+        for _name, obj in inspect.getmembers(cli_commands)
+        if inspect.isclass(obj) and issubclass(obj, CliCommand) and not inspect.isabstract(obj)
+    ]
+
+
+def _model_fingerprint():
+    """Compute the fingerprint of the sources the command model is generated from.
+
+    The fingerprint changes with the package version and whenever the OpenAPI specification or the CLI commands are
+    modified, so that a stale model is never used.
+    """
+    sources = [os.path.join(os.path.dirname(openapi.__file__), "openapi.yaml")]
+    commands_dir = os.path.join(os.path.dirname(__file__), "commands")
+    for root, _dirs, files in os.walk(commands_dir):
+        sources.extend(os.path.join(root, file) for file in files if file.endswith(".py"))
+
+    fingerprint = hashlib.sha256(get_installed_version().encode())
+    for source in sorted(sources):
+        stat = os.stat(source)
+        fingerprint.update(f"{source}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return fingerprint.hexdigest()
+
+
+def _cli_model_cache_file():
+    if os.environ.get("PCLUSTER_CACHE_DISABLED"):
+        return None
+    return os.path.expanduser(os.environ.get("PCLUSTER_CLI_MODEL_CACHE_FILE", CLI_MODEL_CACHE_FILE))
+
+
+def _write_cli_model(cache_file, cli_model):
+    """Atomically write the serialized command model, so that concurrent invocations never read a partial file."""
+    try:
+        cache_dir = os.path.dirname(cache_file)
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=cache_dir, delete=False, encoding="utf-8") as tmp_file:
+            json.dump(cli_model, tmp_file)
+        os.replace(tmp_file.name, cache_file)
+    except OSError as e:
+        LOGGER.debug("Unable to write CLI model cache file %s: %s", cache_file, e)
+
+
+def load_cli_model():
+    """Load the command model used by the CLI, generating and serializing it on first use.
+
+    Parsing the OpenAPI specification and importing the CLI commands are the most expensive steps of the CLI startup,
+    so their result is stored in a JSON file (~/.parallelcluster/cache/cli-model.json by default, see
+    PCLUSTER_CLI_MODEL_CACHE_FILE) and reused as long as its fingerprint matches the installed package.
+
+    The output data structure is a map with the following keys:
+     - operations: the API operations model, as returned by load_model
+     - commands: the CLI commands that don't belong to the API, as returned by load_cli_commands
+    """
+    fingerprint = _model_fingerprint()
+    cache_file = _cli_model_cache_file()
+    if cache_file:
+        try:
+            with open(cache_file, encoding="utf-8") as cache:
+                cli_model = json.load(cache)
+            if cli_model.get("fingerprint") == fingerprint:
+                return cli_model
+        except (OSError, ValueError) as e:
+            LOGGER.debug("Unable to read CLI model cache file %s: %s", cache_file, e)
+
+    cli_model = {
+        "fingerprint": fingerprint,
+        "operations": load_model(package_spec()),
+        "commands": load_cli_commands(),
+    }
+    if cache_file:
+        _write_cli_model(cache_file, cli_model)
+    return cli_model
+
+
 def get_function_from_name(function_name):
     """
     Get function by fully qualified name (e.g. "mymodule.myobj.myfunc").
@@ -206,6 +296,8 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
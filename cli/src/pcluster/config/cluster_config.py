@@ -1148,6 +1148,18 @@ class BaseClusterConfig(Resource):
             }
         )
 
+    @property
+    def instance_types(self) -> List[str]:
+        """Return the list of the instance types used by the head node and the compute resources."""
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            instance_types.extend(compute_resource.instance_type for compute_resource in queue.compute_resources)
+        return list(dict.fromkeys(instance_types))
+
+    def prefetch_instance_types_info(self):
+        """Retrieve in bulk the information of all the instance types used in the cluster, to have it cached."""
+        AWSApi.instance().ec2.get_instance_types_info(self.instance_types)
+
     @property
     def compute_security_groups(self):
         """Return the list of all compute security groups in the cluster."""
@@ -1349,6 +1361,21 @@ class AwsBatchClusterConfig(BaseClusterConfig):
                     architecture=self.head_node.architecture,
                 )
 
+    @property
+    def instance_types(self) -> List[str]:
+        """
+        Return the list of the instance types used by the head node and the compute resources.
+
+        Instance families and the "optimal" keyword supported by AWS Batch are not included.
+        """
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(
+                    instance_type for instance_type in compute_resource.instance_types if "." in instance_type
+                )
+        return list(dict.fromkeys(instance_types))
+
     @property
     def scheduler_resources(self):
         """Return scheduler specific resources."""
@@ -12,17 +12,29 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import copy
+import hashlib
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import List, Set
-
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from types import MappingProxyType
+from typing import Iterator, List, Set
+
+from pcluster.aws.common import PersistentCache
+from pcluster.constants import VALIDATION_RESULTS_CACHE_TTL, VALIDATORS_MAX_WORKERS
+from pcluster.utils import get_installed_version
 from pcluster.validators.common import FailureLevel, ValidationResult, Validator
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.s3_validators import UrlValidator
 
 LOGGER = logging.getLogger(__name__)
 
+VALIDATION_RESULTS_CACHE_NAME = "ValidatorScheduler.results"
+
 
 class ValidatorSuppressor(ABC):
     """Interface for a class that encapsulates the logic to suppress config validators."""
@@ -65,6 +77,114 @@ class TypeMatchValidatorsSuppressor(ValidatorSuppressor):
         return validator.type in self._validators_to_suppress
 
 
+class ValidatorScheduler:
+    """
+    Execute validators on a bounded thread pool.
+
+    Validators are submitted as (validator_class, validator_args) pairs and their results are returned in the same
+    order they were submitted, regardless of the order in which they complete.
+    The execution time of each validator is tracked to produce a timing report.
+    """
+
+    def __init__(self, max_workers: int = VALIDATORS_MAX_WORKERS):
+        self._max_workers = max(1, max_workers or 1)
+        self._timings = OrderedDict()
+
+    @property
+    def timings(self):
+        """Return the list of execution times in seconds of each validator type."""
+        return self._timings
+
+    def run(
+        self, validators: List, suppressors: List[ValidatorSuppressor] = None, skipped: Set[int] = None
+    ) -> List[List[ValidationResult]]:
+        """
+        Execute the given validators and return the list of failures of each of them.
+
+        Validators submitted more than once with the same arguments are executed only once.
+
+        :param skipped: positions of the validators not to execute, whose list of failures is empty
+        """
+        self._timings.clear()
+        skipped = skipped or set()
+        executions = []
+        execution_positions = {}
+        executions_by_key = {}
+        for position, (validator_class, validator_args) in enumerate(validators):
+            if position in skipped:
+                continue
+            key = get_validator_key(validator_class, validator_args)
+            if key is not None and key in executions_by_key:
+                execution_positions[position] = executions_by_key[key]
+                continue
+            execution_positions[position] = len(executions)
+            if key is not None:
+                executions_by_key[key] = len(executions)
+            executions.append((validator_class, validator_args, key))
+
+        if self._max_workers == 1 or len(executions) <= 1:
+            execution_results = [self._execute(*execution, suppressors) for execution in executions]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(executions))) as executor:
+                futures = [executor.submit(self._execute, *execution, suppressors) for execution in executions]
+                execution_results = [future.result() for future in futures]
+
+        results = []
+        timed_executions = set()
+        for position, (validator_class, _) in enumerate(validators):
+            execution = execution_positions.get(position)
+            if execution is None:
+                results.append([])
+                continue
+            failures, duration = execution_results[execution]
+            results.append(list(failures))
+            if duration is not None and execution not in timed_executions:
+                timed_executions.add(execution)
+                self._timings.setdefault(validator_class.__name__, []).append(duration)
+        return results
+
+    @staticmethod
+    def _execute(validator_class, validator_args, key, suppressors):
+        validator = validator_class()
+        if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
+            LOGGER.debug("Suppressing validator %s", validator_class.__name__)
+            return [], None
+        # Only the results of the validators not depending on the live state of the resources are persisted
+        persistent = validator_class.cacheable and key is not None and PersistentCache.is_enabled()
+        if persistent:
+            # Validators can change across ParallelCluster versions
+            key = [get_installed_version(), key]
+            found, failures = PersistentCache.get(
+                VALIDATION_RESULTS_CACHE_NAME, key, deserialize=_deserialize_validation_results
+            )
+            if found:
+                LOGGER.debug("Reusing persisted results of validator %s", validator_class.__name__)
+                return failures, None
+        LOGGER.debug("Executing validator %s", validator_class.__name__)
+        start_time = time.monotonic()
+        try:
+            failures = validator.execute(**validator_args)
+        except Exception as e:
+            # Unexpected errors are usually transient, so their results are not persisted
+            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)], time.monotonic() - start_time
+        if persistent:
+            PersistentCache.put(
+                VALIDATION_RESULTS_CACHE_NAME,
+                key,
+                failures,
+                serialize=_serialize_validation_results,
+                ttl=VALIDATION_RESULTS_CACHE_TTL,
+            )
+        return failures, time.monotonic() - start_time
+
+    def timing_report(self) -> str:
+        """Return a human readable report of the validators execution times, slowest validators first."""
+        lines = ["Validators timing report (validator: executions, total time, max time):"]
+        for validator_type, durations in sorted(self._timings.items(), key=lambda item: sum(item[1]), reverse=True):
+            lines.append(f"  {validator_type}: {len(durations)}, {sum(durations):.3f}s, {max(durations):.3f}s")
+        return "\n".join(lines)
+
+
 class Resource(ABC):
     """Represent an abstract Resource entity."""
 
@@ -78,6 +198,9 @@ class Resource(ABC):
         of resource class.
         """
 
+        # A configuration can contain thousands of parameters, slots avoid allocating a dict for each of them
+        __slots__ = ("__value", "__implied", "__default", "__update_policy")
+
         def __init__(self, value, default=None, update_policy=None):
 
             # If the value is None, it means that the value has not been specified in the configuration; hence it can
@@ -119,11 +242,13 @@ class Resource(ABC):
         def __repr__(self):
             return repr(self.value)
 
+    # Parameters registry, validators and validation failures are allocated on first use, resources without params or
+    # not validated yet share these empty class-level defaults
+    __params = MappingProxyType({})
+    _validation_failures = ()
+    _validators = ()
+
     def __init__(self, implied: bool = False):
-        # Parameters registry
-        self.__params = {}
-        self._validation_failures: List[ValidationResult] = []
-        self._validators: List = []
         self.implied = implied
 
     @property
@@ -150,6 +275,8 @@ class Resource(ABC):
             if isinstance(value, Resource.Param):
                 # If value is a param instance, register the Param and replace the value in the attribute
                 # Register in params dict
+                if "_Resource__params" not in self.__dict__:
+                    super().__setattr__("_Resource__params", {})
                 self.__params[key] = value
                 # Set parameter value as attribute value
                 value = value.value
@@ -162,22 +289,24 @@ class Resource(ABC):
 
         super().__setattr__(key, value)
 
+    def __copy__(self):
+        """
+        Return a shallow copy of the resource.
+
+        Nested resources and values are shared with the original resource, while the parameters registry is copied, so
+        that the attributes of the copy can be changed without affecting the original resource.
+        """
+        resource = self.__class__.__new__(self.__class__)
+        resource.__dict__.update(self.__dict__)
+        if "_Resource__params" in self.__dict__:
+            resource.__dict__["_Resource__params"] = {key: copy.copy(param) for key, param in self.__params.items()}
+        return resource
+
     @staticmethod
     def init_param(value, default=None, update_policy=None):
         """Create a resource attribute backed by a Configuration Parameter."""
         return Resource.Param(value, default=default, update_policy=update_policy)
 
-    def _validator_execute(self, validator_class, validator_args, suppressors):
-        validator = validator_class()
-        if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
-            LOGGER.debug("Suppressing validator %s", validator_class.__name__)
-            return []
-        LOGGER.debug("Executing validator %s", validator_class.__name__)
-        try:
-            return validator.execute(**validator_args)
-        except Exception as e:
-            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
-
     def _nested_resources(self):
         nested_resources = []
         for attr, value in self.__dict__.items():
@@ -187,22 +316,77 @@ class Resource(ABC):
                 nested_resources.extend(item for item in self.__getattribute__(attr) if isinstance(item, Resource))
         return nested_resources
 
-    def validate(self, suppressors: List[ValidatorSuppressor] = None) -> List[ValidationResult]:
-        """Execute registered validators."""
-        # Cleanup failures and validators
-        self._validation_failures.clear()
+    def _collect_validators(self) -> List:
+        """
+        Register the validators of this resource and of all the nested resources.
 
-        # Call validators for nested resources
+        Validators are returned in depth-first order, nested resources first, which is the order failures are reported.
+        """
+        validators = []
         for nested_resource in self._nested_resources():
-            self._validation_failures.extend(nested_resource.validate(suppressors))
+            validators.extend(nested_resource._collect_validators())
 
-        # Update validators to be executed according to current status of the model and order by priority
-        self._validators.clear()
+        # Update validators to be executed according to current status of the model
+        self._validators = []
         self._register_validators()
-        for validator in self._validators:
-            self._validation_failures.extend(self._validator_execute(*validator, suppressors))
+        validators.extend(self._validators)
+        return validators
 
-        return self._validation_failures
+    def _assign_validation_failures(self, results: Iterator[List[ValidationResult]]) -> List[ValidationResult]:
+        """
+        Distribute validators results across the resource tree, following the order of _collect_validators.
+
+        Validators are released once their results are assigned, only resources with failures keep a list of them.
+        """
+        validation_failures = []
+        for nested_resource in self._nested_resources():
+            validation_failures.extend(nested_resource._assign_validation_failures(results))
+        for _ in self.__dict__.pop("_validators", ()):
+            validation_failures.extend(next(results))
+        if validation_failures:
+            self._validation_failures = validation_failures
+        else:
+            self.__dict__.pop("_validation_failures", None)
+        return validation_failures
+
+    def validate(
+        self,
+        suppressors: List[ValidatorSuppressor] = None,
+        max_workers: int = VALIDATORS_MAX_WORKERS,
+        baseline: "Resource" = None,
+    ) -> List[ValidationResult]:
+        """
+        Execute registered validators of the resource and of all the nested resources.
+
+        Validators are collected from the whole resource tree before being executed concurrently, so that the time
+        spent waiting for AWS calls is not serialized. Failures are returned in the same order of a sequential run.
+
+        :param baseline: an already validated version of this resource, f.i. the configuration of a cluster being
+        updated. Validators registered by the baseline with the same arguments are not executed, unless global.
+        """
+        validators = self._collect_validators()
+        skipped = self._get_unchanged_validators(validators, baseline) if baseline else set()
+        scheduler = ValidatorScheduler(max_workers=max_workers)
+        results = scheduler.run(validators, suppressors, skipped)
+        LOGGER.debug(scheduler.timing_report())
+        return self._assign_validation_failures(iter(results))
+
+    @staticmethod
+    def _get_unchanged_validators(validators: List, baseline: "Resource") -> Set[int]:
+        """Return the positions of the non global validators registered by the baseline with the same arguments."""
+        try:
+            baseline_keys = {get_validator_key(*validator) for validator in baseline._collect_validators()}
+        except Exception as e:
+            LOGGER.warning("Unable to compare validators with the baseline, running all of them: %s", e)
+            return set()
+        skipped = {
+            position
+            for position, (validator_class, validator_args) in enumerate(validators)
+            if not validator_class.is_global
+            and get_validator_key(validator_class, validator_args) in baseline_keys - {None}
+        }
+        LOGGER.info("Skipping %s of %s validators with unchanged arguments", len(skipped), len(validators))
+        return skipped
 
     def _register_validators(self):
         """
@@ -214,6 +398,8 @@ class Resource(ABC):
 
     def _register_validator(self, validator_class, **validator_args):
         """Execute the validator."""
+        if "_validators" not in self.__dict__:
+            self._validators = []
         self._validators.append((validator_class, validator_args))
 
     def __repr__(self):
@@ -224,6 +410,61 @@ class Resource(ABC):
         )
 
 
+def _serialize_validation_results(results: List[ValidationResult]):
+    return [
+        {"message": result.message, "level": result.level.name, "validator_type": result.validator_type}
+        for result in results
+    ]
+
+
+def _deserialize_validation_results(results) -> List[ValidationResult]:
+    return [
+        ValidationResult(result["message"], FailureLevel[result["level"]], result["validator_type"])
+        for result in results
+    ]
+
+
+def _canonical_value(value, in_progress=None):
+    """Convert the given validator argument to a JSON serializable value, including all the nested resources."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Enum):
+        return _canonical_value(value.value)
+    in_progress = in_progress or set()
+    if id(value) in in_progress:
+        raise ValueError(f"Circular reference in {type(value).__name__}")
+    in_progress = in_progress | {id(value)}
+    if isinstance(value, (list, tuple, set)):
+        items = [_canonical_value(item, in_progress) for item in value]
+        return sorted(items, key=json.dumps) if isinstance(value, set) else items
+    if isinstance(value, dict):
+        return {str(key): _canonical_value(item, in_progress) for key, item in value.items()}
+    if isinstance(value, Resource):
+        # Attributes starting with an underscore are internal state, e.g. the registered validators
+        attributes = {
+            key: _canonical_value(item, in_progress) for key, item in vars(value).items() if not key.startswith("_")
+        }
+        return {"__resource__": type(value).__name__, **attributes}
+    raise TypeError(f"Unsupported validator argument type: {type(value).__name__}")
+
+
+def get_validator_key(validator_class, validator_args: dict):
+    """
+    Return a hash identifying the execution of the validator with the given arguments.
+
+    None is returned if the arguments cannot be converted to a canonical form, meaning that the execution cannot be
+    identified.
+    """
+    try:
+        canonical_args = json.dumps(_canonical_value(validator_args), sort_keys=True)
+    except (TypeError, ValueError) as e:
+        LOGGER.debug("Unable to compute the key of validator %s: %s", validator_class.__name__, e)
+        return None
+    return hashlib.sha256(
+        f"{validator_class.__module__}.{validator_class.__name__}:{canonical_args}".encode()
+    ).hexdigest()
+
+
 # ------------ Common resources between ImageBuilder an Cluster models ----------- #
 
 
@@ -13,7 +13,8 @@ import logging
 import re
 import sys
 from collections import namedtuple
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.schemas.cluster_schema import ClusterSchema
@@ -31,6 +32,43 @@ if sys.version_info <= (3, 7):
 LOGGER = logging.getLogger(__name__)
 
 
+class ClusterStateSnapshot:
+    """
+    Live state of a cluster, used by the update policies to check the changes of a ConfigPatch.
+
+    Every value is retrieved from the cluster at most once. The values required by a patch can be retrieved
+    concurrently in advance through prefetch().
+    """
+
+    _GETTERS = {
+        "has_running_capacity": lambda cluster: cluster.has_running_capacity(),
+        "running_capacity": lambda cluster: cluster.get_running_capacity(),
+        "head_node_state": lambda cluster: cluster.head_node_instance.state,
+    }
+
+    def __init__(self, cluster):
+        self._cluster = cluster
+        self._values = {}
+
+    def get(self, name: str):
+        """Return the value with the given name, retrieving it from the cluster if not already done."""
+        if name not in self._values:
+            self._values[name] = self._GETTERS[name](self._cluster)
+        return self._values[name]
+
+    def prefetch(self, names):
+        """Retrieve the values with the given names concurrently."""
+        missing_names = [name for name in sorted(names) if name not in self._values]
+        if len(missing_names) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing_names)) as executor:
+                futures = {name: executor.submit(self._GETTERS[name], self._cluster) for name in missing_names}
+                for name, future in futures.items():
+                    self._values[name] = future.result()
+        else:
+            for name in missing_names:
+                self.get(name)
+
+
 class ConfigPatch:
     """
     Represents the Diff Patch between two PclusterConfig instances.
@@ -56,16 +94,17 @@ class ConfigPatch:
         """
         Create a ConfigPatch.
 
+        The configurations are neither copied nor modified, so they must not be changed while the patch is in use.
+
         :param base_config: The base configuration, f.i. from S3 bucket
         :param target_config: The target configuration, f.i. as loaded from configuration file
         """
         self.cluster = cluster
-        # Cached condition results
-        self.condition_results = {}
+        # Live cluster state shared by the condition checks of all the changes
+        self.cluster_state = ClusterStateSnapshot(cluster)
 
-        # Make a deep copy of the basic and target configurations to avoid changing the original ones
-        self.base_config = copy.deepcopy(base_config)
-        self.target_config = copy.deepcopy(target_config)
+        self.base_config = base_config
+        self.target_config = target_config
 
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
@@ -88,112 +127,88 @@ class ConfigPatch:
         All detected changes are added to the internal changes list, ready to be checked  through the public check()
         method.
         """
-        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=[])
+        self._compare_section(self.base_config, self.target_config, self.cluster_schema, param_path=())
 
-    def _compare_section(self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: List):
+    def _add_change(self, param_path: Tuple, key, old_value, new_value, update_policy, is_list):
+        self.changes.append(Change(list(param_path), key, old_value, new_value, update_policy, is_list=is_list))
+
+    def _compare_section(self, base_section: dict, target_section: dict, section_schema: BaseSchema, param_path: Tuple):
         """
         Compare the provided base and target sections and append the detected changes to the internal changes list.
 
+        Identical sections are skipped without visiting their fields.
+
         :param base_section: The section in the base configuration
         :param target_section: The corresponding section in the target configuration
         :param section_schema: schema corresponding to the section to be analyzed (contains all the resources/params)
-        :param param_path: A list on which the items correspond to the path of the param in the configuration schema
+        :param param_path: A tuple on which the items correspond to the path of the param in the configuration schema
         """
-        for _, field_obj in section_schema.declared_fields.items():
+        if base_section == target_section:
+            return
+
+        for field_obj in section_schema.declared_fields.values():
             data_key = field_obj.data_key
-            is_nested_section = hasattr(field_obj, "nested")
-            is_list = hasattr(field_obj, "many") and field_obj.many
+            target_value = target_section.get(data_key, None)
+            base_value = base_section.get(data_key, None)
+            if target_value == base_value:
+                continue
 
             change_update_policy = field_obj.metadata.get("update_policy", UpdatePolicy.UNSUPPORTED)
 
-            if is_nested_section:
-                if is_list:
+            if hasattr(field_obj, "nested"):
+                if getattr(field_obj, "many", False):
                     self._compare_list(
-                        base_section, target_section, param_path, data_key, field_obj, change_update_policy
+                        base_value or [], target_value or [], param_path, data_key, field_obj, change_update_policy
+                    )
+                elif target_value and base_value:
+                    # Compare nested sections and params
+                    self._compare_section(base_value, target_value, field_obj.schema, param_path + (data_key,))
+                elif target_value or base_value:
+                    # One section has been added or removed, add section change information
+                    self._add_change(
+                        param_path,
+                        data_key,
+                        base_value if base_value else "-",
+                        target_value if target_value else "-",
+                        change_update_policy,
+                        is_list=False,
                     )
-                else:
-                    # Single nested section
-                    target_value = target_section.get(data_key, None)
-                    base_value = base_section.get(data_key, None)
-
-                    if target_value and base_value:
-                        # Compare nested sections and params
-                        nested_path = copy.deepcopy(param_path)
-                        nested_path.append(data_key)
-                        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
-                    elif target_value or base_value:
-                        # One section has been added or removed, add section change information
-                        self.changes.append(
-                            Change(
-                                param_path,
-                                data_key,
-                                base_value if base_value else "-",
-                                target_value if target_value else "-",
-                                change_update_policy,
-                                is_list=False,
-                            )
-                        )
             else:
                 # Simple param
-                target_value = target_section.get(data_key, None)
-                base_value = base_section.get(data_key, None)
+                self._add_change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
 
-                if target_value != base_value:
-                    # Add param change information
-                    self.changes.append(
-                        Change(param_path, data_key, base_value, target_value, change_update_policy, is_list=False)
-                    )
-
-    def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
+    def _compare_list(self, base_list, target_list, param_path, data_key, field_obj, change_update_policy):
         """
         Compare list of nested section (e.g. list of queues) by comparing the items with the same update_key.
 
-        If update_key is not set we're considering Name as identifier.
+        Base items are indexed by their update_key value, so that each target item is matched in constant time.
+        If the value is repeated, target items are compared with the first base item having it.
         """
         update_key = field_obj.metadata.get("update_key")
 
-        # Compare items in the list by searching the right item to compare through update_key value
-        # First, compare all sections from target vs base config and mark visited base sections.
-        for target_nested_section in target_section.get(data_key, []):
+        base_index = {}
+        for position, base_nested_section in enumerate(base_list):
+            base_index.setdefault(base_nested_section.get(update_key), position)
+
+        # First, compare all sections from target vs base config and record the matched base sections.
+        matched_positions = set()
+        for target_nested_section in target_list:
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
-            if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
-                self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
-            else:
-                self.changes.append(
-                    Change(
-                        param_path,
-                        data_key,
-                        None,
-                        target_nested_section,
-                        change_update_policy,
-                        is_list=True,
-                    )
-                )
-        # Then, compare all non visited base sections vs target config.
-        for base_nested_section in base_section.get(data_key, []):
-            if not base_nested_section.get("visited", False):
-                update_key_value = base_nested_section.get(update_key)
-                self.changes.append(
-                    Change(
-                        param_path,
-                        data_key,
-                        base_nested_section,
-                        None,
-                        change_update_policy,
-                        is_list=True,
-                    )
+            position = base_index.get(update_key_value)
+            if position is not None:
+                self._compare_section(
+                    base_list[position],
+                    target_nested_section,
+                    field_obj.schema,
+                    param_path + (f"{data_key}[{update_key_value}]",),
                 )
+                matched_positions.add(position)
+            else:
+                self._add_change(param_path, data_key, None, target_nested_section, change_update_policy, is_list=True)
+        # Then, report all the base sections that have not been matched as removed.
+        for position, base_nested_section in enumerate(base_list):
+            if position not in matched_positions:
+                self._add_change(param_path, data_key, base_nested_section, None, change_update_policy, is_list=True)
 
     @property
     def update_policy_level(self):
@@ -223,6 +238,7 @@ class ConfigPatch:
         rows = [["param_path", "parameter", "old value", "new value", "check", "reason", "action_needed"]]
 
         patch_allowed = True
+        self.cluster_state.prefetch({name for change in self.changes for name in change.update_policy.required_state})
 
         for change in self.changes:
             check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
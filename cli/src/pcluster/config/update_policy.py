@@ -31,18 +31,22 @@ class UpdatePolicy:
         action_needed=None,
         condition_checker=None,
         print_succeeded=True,
+        required_state=None,
     ):
         self.fail_reason = None
         self.action_needed = None
         self.condition_checker = None
         self.print_succeeded = print_succeeded
         self.level = 0
+        # Names of the ClusterStateSnapshot values used by the condition checker, fail reason and action needed
+        self.required_state = ()
 
         if base_policy:
             self.fail_reason = base_policy.fail_reason
             self.action_needed = base_policy.action_needed
             self.condition_checker = base_policy.condition_checker
             self.level = base_policy.level
+            self.required_state = base_policy.required_state
 
         if level:
             self.level = level
@@ -52,6 +56,8 @@ class UpdatePolicy:
             self.action_needed = action_needed
         if condition_checker:
             self.condition_checker = condition_checker
+        if required_state:
+            self.required_state = tuple(required_state)
 
     def check(self, change, patch):
         """
@@ -136,11 +142,12 @@ UpdatePolicy.SUPPORTED = UpdatePolicy(level=0, fail_reason="-", condition_checke
 UpdatePolicy.AWSBATCH_CE_MAX_RESIZE = UpdatePolicy(
     level=1,
     fail_reason=lambda change, patch: "Max vCPUs can not be lower than the current Desired vCPUs ({0})".format(
-        patch.cluster.get_running_capacity()
+        patch.cluster_state.get("running_capacity")
     ),
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.get_running_capacity()
+    condition_checker=lambda change, patch: patch.cluster_state.get("running_capacity")
     <= patch.target_config["Scheduling"]["AwsBatchQueues"][0]["ComputeResources"][0]["MaxvCpus"],
+    required_state=["running_capacity"],
 )
 
 # Checks resize of max_count
@@ -148,9 +155,10 @@ UpdatePolicy.MAX_COUNT = UpdatePolicy(
     level=1,
     fail_reason=lambda change, patch: "Shrinking a queue requires the compute fleet to be stopped first",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: not patch.cluster.has_running_capacity()
+    condition_checker=lambda change, patch: not patch.cluster_state.get("has_running_capacity")
     or (change.new_value if change.new_value is not None else DEFAULT_MAX_COUNT)
     >= (change.old_value if change.old_value is not None else DEFAULT_MAX_COUNT),
+    required_state=["has_running_capacity"],
 )
 
 # Update supported only with all compute nodes down
@@ -158,7 +166,8 @@ UpdatePolicy.COMPUTE_FLEET_STOP = UpdatePolicy(
     level=10,
     fail_reason="All compute nodes must be stopped",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: not patch.cluster.has_running_capacity(),
+    condition_checker=lambda change, patch: not patch.cluster_state.get("has_running_capacity"),
+    required_state=["has_running_capacity"],
 )
 
 # Update supported only with head node down
@@ -166,7 +175,8 @@ UpdatePolicy.HEAD_NODE_STOP = UpdatePolicy(
     level=20,
     fail_reason="To perform this update action, the head node must be in a stopped state",
     action_needed=UpdatePolicy.ACTIONS_NEEDED["pcluster_stop"],
-    condition_checker=lambda change, patch: patch.cluster.head_node_instance.state == "stopped",
+    condition_checker=lambda change, patch: patch.cluster_state.get("head_node_state") == "stopped",
+    required_state=["head_node_state"],
 )
 
 # Expected Behavior:
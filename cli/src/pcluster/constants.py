@@ -62,6 +62,29 @@ DEFAULT_MIN_COUNT = 0
 MAX_NUMBER_OF_QUEUES = 10
 MAX_NUMBER_OF_COMPUTE_RESOURCES = 5
 
+# Maximum number of validators executed concurrently when validating a configuration
+VALIDATORS_MAX_WORKERS = 10
+# Time-to-live in seconds of the validation results persisted when PCLUSTER_PERSISTENT_CACHE is enabled
+VALIDATION_RESULTS_CACHE_TTL = 15 * 60
+# Maximum number of concurrent dry-run RunInstances calls performed by a single launch template validator
+DRYRUN_MAX_WORKERS = 5
+# Maximum number of regions queried concurrently when listing resources across regions
+INVENTORY_MAX_WORKERS = 8
+# Maximum number of log streams downloaded concurrently when exporting logs
+LOGS_EXPORT_MAX_WORKERS = 8
+# Maximum number of artifacts uploaded concurrently to the S3 bucket of a cluster or image
+S3_UPLOAD_MAX_WORKERS = 8
+# Maximum number of concurrent TerminateInstances calls, and their rate per second, when terminating cluster nodes
+TERMINATION_MAX_WORKERS = 8
+TERMINATION_REQUEST_RATE = 5
+# Maximum number of instances terminated by a single TerminateInstances call
+TERMINATION_BATCH_SIZE = 100
+# Interval between checks, and maximum time to wait, in seconds, when waiting for instances to be terminated
+TERMINATION_POLL_INTERVAL = 5
+TERMINATION_WAIT_TIMEOUT = 600
+# Time-to-live in seconds of the describe_cluster responses shared by the requests served by the API process
+DESCRIBE_CLUSTER_CACHE_TTL = 10
+
 MAX_STORAGE_COUNT = {"ebs": 5, "efs": 1, "fsx": 1, "raid": 1}
 
 COOKBOOK_PACKAGES_VERSIONS = {
@@ -17,21 +17,27 @@ import json
 import logging
 import os
 import tempfile
-import time
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from typing import List, Optional, Set, Tuple
 from urllib.request import urlopen
 
 import pkg_resources
-import yaml
 from jinja2 import BaseLoader
 from jinja2.sandbox import SandboxedEnvironment
 from marshmallow import ValidationError
 
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, BadRequestError, LimitExceededError, StackNotFoundError, get_region
+from pcluster.aws.common import (
+    AWSClientError,
+    BadRequestError,
+    Cache,
+    LimitExceededError,
+    StackNotFoundError,
+    get_region,
+)
+from pcluster.aws.waiters import StackWaiter
 from pcluster.config.cluster_config import BaseClusterConfig, SchedulerPluginScheduling, SlurmScheduling, Tag
 from pcluster.config.common import ValidatorSuppressor
 from pcluster.config.config_patch import ConfigPatch
@@ -41,6 +47,7 @@ from pcluster.constants import (
     PCLUSTER_QUEUE_NAME_TAG,
     PCLUSTER_S3_ARTIFACTS_DICT,
     PCLUSTER_VERSION_TAG,
+    S3_UPLOAD_MAX_WORKERS,
     STACK_EVENTS_LOG_STREAM_NAME_FORMAT,
 )
 from pcluster.models.cluster_resources import (
@@ -63,10 +70,16 @@ from pcluster.models.common import (
     upload_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
+from pcluster.models.instance_termination import InstanceTerminator, TerminationReport
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url, parse_bucket_url
 from pcluster.schemas.cluster_schema import ClusterSchema
-from pcluster.templates.cdk_builder import CDKTemplateBuilder
-from pcluster.utils import datetime_to_epoch, generate_random_name_with_prefix, get_attr, get_installed_version, grouper
+from pcluster.utils import (
+    datetime_to_epoch,
+    generate_random_name_with_prefix,
+    get_attr,
+    get_installed_version,
+    yaml_load,
+)
 from pcluster.validators.common import FailureLevel, ValidationResult
 
 # pylint: disable=C0302
@@ -164,6 +177,8 @@ class Cluster:
         self.__bucket = None
         self.template_body = None
         self.__config = None
+        self.__config_dump = None
+        self.__schema = None
         self.__s3_artifact_dir = None
 
         self.__has_running_capacity = None
@@ -256,6 +271,26 @@ class Cluster:
     @config.setter
     def config(self, value):
         self.__config = value
+        self.__config_dump = None
+
+    @property
+    def schema(self) -> ClusterSchema:
+        """Return the schema used to load and dump the cluster configuration, shared by all the operations."""
+        if not self.__schema:
+            self.__schema = ClusterSchema(cluster_name=self.name)
+        return self.__schema
+
+    @property
+    def config_dump(self) -> dict:
+        """
+        Return the cluster configuration serialized by the cluster schema, including the default values.
+
+        The configuration is serialized once and shared by the artifacts generated from it, so the returned dict must
+        not be modified; the cached value is discarded when the configuration is replaced or its tags are changed.
+        """
+        if self.__config_dump is None:
+            self.__config_dump = self.schema.dump(self.config)
+        return self.__config_dump
 
     @property
     def config_presigned_url(self) -> str:
@@ -354,8 +389,12 @@ class Cluster:
 
             # Create template if not provided by the user
             if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                from pcluster.templates.cdk_builder import CDKTemplateBuilder  # pylint: disable=import-outside-toplevel
+
                 self.template_body = CDKTemplateBuilder().build_cluster_template(
-                    cluster_config=self.config, bucket=self.bucket, stack_name=self.stack_name
+                    cluster_config=self.config,
+                    bucket=self.bucket,
+                    stack_name=self.stack_name,
                 )
 
             # upload cluster artifacts and generated template
@@ -384,7 +423,7 @@ class Cluster:
     def _load_config(self, cluster_config: dict) -> BaseClusterConfig:
         """Load the config and catch / translate any errors that occur during loading."""
         try:
-            return ClusterSchema(cluster_name=self.name).load(cluster_config)
+            return self.schema.load(cluster_config)
         except ValidationError as e:
             # syntactic failure
             data = str(sorted(e.messages.items()) if isinstance(e.messages, dict) else e)
@@ -405,11 +444,14 @@ class Cluster:
         if AWSApi.instance().cfn.stack_exists(self.stack_name):
             raise BadRequestClusterActionError(f"Cluster {self.name} already exists.")
 
-    def _validate_and_parse_config(self, validator_suppressors, validation_failure_level, config_text=None):
+    def _validate_and_parse_config(
+        self, validator_suppressors, validation_failure_level, config_text=None, baseline_config=None
+    ):
         """
         Perform syntactic and semantic validation and return parsed config.
 
         :param config_text: config to parse, self.source_config_text will be used if not specified.
+        :param baseline_config: already validated config, validators with unchanged arguments are not executed.
         """
         cluster_config_dict = parse_config(config_text or self.source_config_text)
 
@@ -417,7 +459,8 @@ class Cluster:
             LOGGER.info("Validating cluster configuration...")
             Cluster._load_additional_instance_type_data(cluster_config_dict)
             config = self._load_config(cluster_config_dict)
-            validation_failures = config.validate(validator_suppressors)
+            Cluster._prefetch_instance_types_info(config)
+            validation_failures = config.validate(validator_suppressors, baseline=baseline_config)
             if any(f.level.value >= FailureLevel(validation_failure_level).value for f in validation_failures):
                 raise ConfigValidationError("Invalid cluster configuration.", validation_failures=validation_failures)
             LOGGER.info("Validation succeeded.")
@@ -428,6 +471,14 @@ class Cluster:
 
         return config, validation_failures
 
+    @staticmethod
+    def _prefetch_instance_types_info(config: BaseClusterConfig):
+        """Retrieve in bulk the instance types information, so that validators do not describe them one by one."""
+        try:
+            config.prefetch_instance_types_info()
+        except AWSClientError as e:
+            LOGGER.warning("Unable to retrieve instance types information in bulk: %s", e)
+
     @staticmethod
     def _load_additional_instance_type_data(cluster_config_dict):
         if "DevSettings" in cluster_config_dict:
@@ -435,6 +486,8 @@ class Cluster:
             if instance_types_data:
                 # Set additional instance types data in AWSApi. Schema load will use the information.
                 AWSApi.instance().ec2.additional_instance_types_data = json.loads(instance_types_data)
+                # Discard instance type information cached before the additional data was available
+                Cache.clear_all()
 
     def _upload_config(self):
         """Upload source config and save config version."""
@@ -443,7 +496,7 @@ class Cluster:
             # Upload config with default values and sections
             if self.config:
                 result = self.bucket.upload_config(
-                    config=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
+                    config=self.config_dump,
                     config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("config_name"),
                 )
 
@@ -464,7 +517,7 @@ class Cluster:
                 e, f"Unable to upload cluster config to the S3 bucket {self.bucket.name} due to exception: {e}"
             )
 
-    def _upload_artifacts(self):
+    def _upload_artifacts(self, skip_unchanged_resources=False):
         """
         Upload cluster specific resources and cluster template.
 
@@ -472,30 +525,54 @@ class Cluster:
         {bucket_name}/parallelcluster/{version}/clusters/{cluster_name}/{resource_dir}/artifacts.zip.
         All files contained in root dir will be uploaded to
         {bucket_name}/parallelcluster/{version}/clusters/{cluster_name}/{resource_dir}/artifact.
+        Artifacts are uploaded concurrently. If skip_unchanged_resources is True, e.g. when updating the cluster, the
+        resources already stored with the same content are not uploaded again.
         """
         self._check_bucket_existence()
         try:
-            resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
-            self.bucket.upload_resources(
-                resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
-            )
-            if self.config.scheduler_resources:
-                self.bucket.upload_resources(
-                    resource_dir=self.config.scheduler_resources,
-                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
-                )
+            with ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS) as executor:
+                resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
+                futures = [
+                    executor.submit(
+                        self.bucket.upload_resources,
+                        resource_dir=resources,
+                        custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name"),
+                        skip_unchanged=skip_unchanged_resources,
+                    )
+                ]
+                if self.config.scheduler_resources:
+                    futures.append(
+                        executor.submit(
+                            self.bucket.upload_resources,
+                            resource_dir=self.config.scheduler_resources,
+                            custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                            skip_unchanged=skip_unchanged_resources,
+                        )
+                    )
+
+                # Upload template
+                if self.template_body:
+                    futures.append(
+                        executor.submit(
+                            self.bucket.upload_cfn_template,
+                            self.template_body,
+                            PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"),
+                        )
+                    )
 
-            # Upload template
-            if self.template_body:
-                self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
+                if isinstance(self.config.scheduling, (SlurmScheduling, SchedulerPluginScheduling)):
+                    # upload instance types data
+                    futures.append(
+                        executor.submit(
+                            self.bucket.upload_config,
+                            self.config.get_instance_types_data(),
+                            PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
+                            format=S3FileFormat.JSON,
+                        )
+                    )
 
-            if isinstance(self.config.scheduling, (SlurmScheduling, SchedulerPluginScheduling)):
-                # upload instance types data
-                self.bucket.upload_config(
-                    self.config.get_instance_types_data(),
-                    PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
-                    format=S3FileFormat.JSON,
-                )
+                for future in futures:
+                    future.result()
 
             if isinstance(self.config.scheduling, SchedulerPluginScheduling):
                 self._render_and_upload_scheduler_plugin_template()
@@ -540,7 +617,7 @@ class Cluster:
             )
             template = environment.from_string(file_content)
             rendered_template = template.render(
-                cluster_configuration=ClusterSchema(cluster_name=self.name).dump(deepcopy(self.config)),
+                cluster_configuration=self.config_dump,
                 cluster_name=self.name,
                 instance_types_info=self.config.get_instance_types_data(),
             )
@@ -594,13 +671,6 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Unable to persist logs on cluster deletion, failed with error: {e}.")
 
-    def _get_updated_stack_status(self):
-        """Return updated status of the stack."""
-        try:
-            return AWSApi.instance().cfn.describe_stack(self.stack_name).get("StackStatus")
-        except AWSClientError as e:
-            raise _cluster_error_mapper(e, f"Unable to retrieve status of stack {self.stack_name}. {e}")
-
     def _update_stack_template(self, template_url):
         """Update template of the running stack according to updated template."""
         try:
@@ -613,35 +683,42 @@ class Cluster:
 
     def _wait_for_stack_update(self):
         """Wait for the given stack to be finished updating."""
-        while self._get_updated_stack_status() == "UPDATE_IN_PROGRESS":
-            time.sleep(5)
-        while self._get_updated_stack_status() == "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS":
-            time.sleep(2)
+        try:
+            StackWaiter(self.stack_name).wait(
+                waiting_states=["UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS"]
+            )
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Unable to retrieve status of stack {self.stack_name}. {e}")
 
     def _get_stack_template(self):
         """Return the template body of the stack."""
         try:
-            return yaml.safe_load(AWSApi.instance().cfn.get_stack_template(self.stack_name))
+            return yaml_load(AWSApi.instance().cfn.get_stack_template(self.stack_name))
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Unable to retrieve template for stack {self.stack_name}. {e}")
 
-    def terminate_nodes(self):
-        """Terminate all compute nodes of a cluster."""
+    def terminate_nodes(self, wait: bool = False) -> TerminationReport:
+        """
+        Terminate all compute nodes of a cluster.
+
+        :param wait: wait for the compute nodes to reach the terminated state
+        """
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
             filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
-
-            for instance_ids in grouper(instances, 100):
-                LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
-
-            LOGGER.info("Compute fleet cleaned up.")
+            report = InstanceTerminator().terminate(filters, wait=wait)
         except Exception as e:
             LOGGER.error("Failed when checking for running EC2 instances with error: %s", str(e))
             raise _cluster_error_mapper(e, f"Unable to delete running EC2 instances with error: {e}")
 
+        if report.errors:
+            error = report.errors[0]
+            raise _cluster_error_mapper(
+                error, f"Unable to delete {report.failed} of {report.requested} EC2 instances with error: {error}"
+            )
+        LOGGER.info("Compute fleet cleaned up.")
+        return report
+
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
@@ -785,12 +862,25 @@ class Cluster:
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
         force: bool = False,
         dry_run: bool = False,
+        full_validation: bool = False,
     ):
-        """Validate a cluster update request."""
+        """
+        Validate a cluster update request.
+
+        Only the validators whose arguments changed with respect to the current cluster configuration are executed,
+        together with the global ones. All the validators are executed if full_validation is True or the
+        PCLUSTER_FULL_UPDATE_VALIDATION environment variable is set to true.
+        """
         self._validate_cluster_exists()
         self._validate_stack_status_not_in_progress()
+        full_validation = (
+            full_validation or os.environ.get("PCLUSTER_FULL_UPDATE_VALIDATION", "false").lower() == "true"
+        )
         target_config, ignored_validation_failures = self._validate_and_parse_config(
-            validator_suppressors, validation_failure_level, target_source_config
+            validator_suppressors,
+            validation_failure_level,
+            target_source_config,
+            baseline_config=None if full_validation else self._get_baseline_config(),
         )
         changes = self._validate_patch(force, target_config)
 
@@ -801,6 +891,14 @@ class Cluster:
 
         return target_config, changes, ignored_validation_failures
 
+    def _get_baseline_config(self):
+        """Return the current cluster configuration, or None if it cannot be loaded."""
+        try:
+            return self.config
+        except Exception as e:
+            LOGGER.warning("Unable to load the current cluster configuration, running all validators: %s", e)
+            return None
+
     def _validate_patch(self, force, target_config):
         patch = ConfigPatch(
             cluster=self, base_config=self.config.source_config, target_config=target_config.source_config
@@ -827,6 +925,7 @@ class Cluster:
         validator_suppressors: Set[ValidatorSuppressor] = None,
         validation_failure_level: FailureLevel = FailureLevel.ERROR,
         force: bool = False,
+        full_validation: bool = False,
     ):
         """
         Update cluster.
@@ -837,7 +936,11 @@ class Cluster:
         """
         try:
             target_config, changes, ignored_validation_failures = self.validate_update_request(
-                target_source_config, validator_suppressors, validation_failure_level, force
+                target_source_config,
+                validator_suppressors,
+                validation_failure_level,
+                force,
+                full_validation=full_validation,
             )
 
             self.config = target_config
@@ -848,6 +951,8 @@ class Cluster:
 
             # Create template if not provided by the user
             if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                from pcluster.templates.cdk_builder import CDKTemplateBuilder  # pylint: disable=import-outside-toplevel
+
                 self.template_body = CDKTemplateBuilder().build_cluster_template(
                     cluster_config=self.config,
                     bucket=self.bucket,
@@ -855,8 +960,8 @@ class Cluster:
                     log_group_name=self.stack.log_group_name,
                 )
 
-            # upload cluster artifacts and generated template
-            self._upload_artifacts()
+            # upload cluster artifacts and generated template, reusing the resources stored by previous operations
+            self._upload_artifacts(skip_unchanged_resources=True)
 
             LOGGER.info("Updating stack named: %s", self.stack_name)
             AWSApi.instance().cfn.update_stack_from_url(
@@ -888,6 +993,7 @@ class Cluster:
         self.config.tags = [tag for tag in self.config.tags if tag.key != PCLUSTER_VERSION_TAG]
         # Add PCLUSTER_VERSION_TAG
         self.config.tags.append(Tag(key=PCLUSTER_VERSION_TAG, value=get_installed_version()))
+        self.__config_dump = None
 
     def _get_cfn_tags(self):
         """Return tag list in the format expected by CFN."""
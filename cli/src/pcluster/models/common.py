@@ -14,17 +14,19 @@ import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List
 
 import configparser
-import yaml
 
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.utils import datetime_to_epoch, to_utc_datetime
+from pcluster.constants import LOGS_EXPORT_MAX_WORKERS
+from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +58,7 @@ class NotFound(Exception):
 def parse_config(config: str) -> dict:
     """Parse a YAML configuration into a dictionary."""
     try:
-        config_dict = yaml.safe_load(config)
+        config_dict = yaml_load(config)
         if not isinstance(config_dict, dict):
             LOGGER.error("Failed: parsed config is not a dict")
             raise Exception("parsed config is not a dict")
@@ -138,6 +140,13 @@ class LogsExporterError(Exception):
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
+    # Size of the chunks exported logs are decompressed by, to bound the memory used by large log streams
+    DECOMPRESSION_CHUNK_SIZE = 1024 * 1024
+    # Polling interval of the export task status, increasing from the min to the max one
+    TASK_POLL_MIN_INTERVAL = 1
+    TASK_POLL_MAX_INTERVAL = 10
+    TASK_POLL_BACKOFF_FACTOR = 1.5
+
     def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
         # check bucket
         bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
@@ -213,37 +222,61 @@ class CloudWatchLogsExporter:
 
     @staticmethod
     def _wait_for_task_completion(task_id):
-        """Wait for the CloudWatch logs export task given by task_id to finish."""
+        """Wait for the CloudWatch logs export task given by task_id to finish, polling its status with backoff."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
         status = "PENDING"
         still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
+        poll_interval = CloudWatchLogsExporter.TASK_POLL_MIN_INTERVAL
+        start_time = time.monotonic()
         while status in still_running_statuses:
-            time.sleep(1)
+            time.sleep(poll_interval)
+            poll_interval = min(
+                poll_interval * CloudWatchLogsExporter.TASK_POLL_BACKOFF_FACTOR,
+                CloudWatchLogsExporter.TASK_POLL_MAX_INTERVAL,
+            )
             status = AWSApi.instance().logs.get_export_task_status(task_id)
+            LOGGER.info(
+                "Log export task %s status: %s (%d seconds elapsed)", task_id, status, time.monotonic() - start_time
+            )
         return status
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir.
+
+        Each log stream is exported to one or more gzipped objects, that are decompressed while being downloaded and
+        appended to the log stream file. Log streams are downloaded concurrently.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        keys_by_path = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
-
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
-            )
-
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+            keys_by_path.setdefault(decompressed_path, []).append(archive_object.key)
+
+        downloaded_objects = 0
+        total_objects = sum(len(keys) for keys in keys_by_path.values())
+        with ThreadPoolExecutor(max_workers=LOGS_EXPORT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self._download_log_stream, sorted(keys), path) for path, keys in keys_by_path.items()
+            ]
+            for future in as_completed(futures):
+                downloaded_objects += future.result()
+                LOGGER.info("Downloaded %s of %s exported log objects", downloaded_objects, total_objects)
+
+    def _download_log_stream(self, keys, decompressed_path):
+        """Download and decompress the given objects of a log stream into decompressed_path, chunk by chunk."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        with open(decompressed_path, "wb") as outfile:
+            for key in keys:
+                LOGGER.debug("Downloading object with key=%s to %s", key, decompressed_path)
+                body = AWSApi.instance().s3.get_object(bucket_name=self.bucket, key=key)["Body"]
+                with gzip.GzipFile(fileobj=body) as gfile:
+                    shutil.copyfileobj(gfile, outfile, self.DECOMPRESSION_CHUNK_SIZE)
+        return len(keys)
 
 
 def export_stack_events(stack_name: str, output_file: str):
@@ -271,10 +304,9 @@ def create_logs_archive(directory: str, output_file: str = None):
 
 def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
     archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
     bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
+    with open(archive_path, "rb") as archive_file:
+        AWSApi.instance().s3.put_object(bucket, archive_file, bucket_path)
     return f"s3://{bucket}/{bucket_path}"
 
 
@@ -9,7 +9,6 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-import time
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -17,6 +16,7 @@ from boto3.dynamodb.conditions import Attr
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
+from pcluster.aws.waiters import Waiter, WaiterTimeoutError
 from pcluster.constants import PCLUSTER_DYNAMODB_PREFIX
 
 LOGGER = logging.getLogger(__name__)
@@ -161,18 +161,17 @@ class ComputeFleetStatusManager:
             )
         LOGGER.info("Compute fleet status updated successfully.")
 
-    def _wait_for_status_transition(self, wait_on_status, timeout=300, retry_every_seconds=15):
-        current_status = self.get_status()
-        start_time = time.time()
-        while current_status == wait_on_status and not self._timeout_expired(start_time, timeout):
+    def _wait_for_status_transition(self, wait_on_status, timeout=300, max_delay=15):
+        current_status = None
+
+        def _poll():
+            nonlocal current_status
             current_status = self.get_status()
-            time.sleep(retry_every_seconds)
+            return current_status != wait_on_status, False
 
-        if current_status == wait_on_status:
+        try:
+            Waiter(min_delay=min(5, max_delay), max_delay=max_delay, timeout=timeout).wait(_poll)
+        except WaiterTimeoutError:
             raise TimeoutError("Timeout expired while waiting for status transition.")
 
         return current_status
-
-    @staticmethod
-    def _timeout_expired(start_time, timeout):
-        return (time.time() - start_time) > timeout
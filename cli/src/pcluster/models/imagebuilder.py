@@ -72,7 +72,6 @@ from pcluster.models.imagebuilder_resources import (
 )
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url
 from pcluster.schemas.imagebuilder_schema import ImageBuilderSchema
-from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.utils import datetime_to_epoch, generate_random_name_with_prefix, get_installed_version, get_partition
 from pcluster.validators.common import FailureLevel, ValidationResult
 
@@ -461,6 +460,8 @@ class ImageBuilder:
             LOGGER.info("Building ParallelCluster image: %s", self.image_id)
 
             # Generate cdk cfn template
+            from pcluster.templates.cdk_builder import CDKTemplateBuilder  # pylint: disable=import-outside-toplevel
+
             self.template_body = CDKTemplateBuilder().build_imagebuilder_template(
                 image_config=self.config, image_id=self.image_id, bucket=self.bucket
             )
@@ -0,0 +1,124 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, TokenBucket
+from pcluster.constants import (
+    TERMINATION_BATCH_SIZE,
+    TERMINATION_MAX_WORKERS,
+    TERMINATION_POLL_INTERVAL,
+    TERMINATION_REQUEST_RATE,
+    TERMINATION_WAIT_TIMEOUT,
+)
+from pcluster.utils import grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# States of the instances that are not terminated yet
+_NON_TERMINAL_STATES = ["pending", "running", "shutting-down", "stopping", "stopped"]
+
+
+class TerminationReport:
+    """Outcome of a bulk termination."""
+
+    def __init__(self):
+        self.requested = 0
+        self.terminated = 0
+        self.failed = 0
+        # Instances not terminated yet when the wait ended, None if termination was not awaited
+        self.remaining = None
+        self.errors: List[Exception] = []
+
+    def __str__(self):
+        summary = f"requested: {self.requested}, terminated: {self.terminated}, failed: {self.failed}"
+        return summary if self.remaining is None else f"{summary}, remaining: {self.remaining}"
+
+
+class InstanceTerminator:
+    """
+    Terminate large numbers of instances with concurrent, rate-limited TerminateInstances calls.
+
+    Instance ids are grouped in batches as the pages of the DescribeInstances results are retrieved, so that the
+    termination of the first batches starts before the listing is complete. TerminateInstances calls are limited to the
+    given rate by a token bucket, while the throttled calls are retried by botocore as configured by the RetryPolicy.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = TERMINATION_MAX_WORKERS,
+        request_rate: float = TERMINATION_REQUEST_RATE,
+        batch_size: int = TERMINATION_BATCH_SIZE,
+    ):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self._bucket = TokenBucket(rate=request_rate, capacity=max_workers)
+
+    def terminate(
+        self, filters: List[Dict], wait: bool = False, timeout: int = TERMINATION_WAIT_TIMEOUT
+    ) -> TerminationReport:
+        """
+        Terminate the instances matching the given DescribeInstances filters.
+
+        :param filters: filters selecting the instances to terminate
+        :param wait: wait for the instances to reach the terminated state
+        :param timeout: maximum time to wait, in seconds
+        :return: the counts of the requested, terminated and failed terminations
+        """
+        report = TerminationReport()
+        ec2 = AWSApi.instance().ec2
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._terminate_batch, list(instance_ids))
+                for instance_ids in grouper(ec2.iter_instance_ids(filters), self.batch_size)
+            ]
+            for future in futures:
+                count, error = future.result()
+                report.requested += count
+                if error:
+                    report.failed += count
+                    report.errors.append(error)
+                else:
+                    report.terminated += count
+
+        if wait and report.terminated:
+            report.remaining = self._wait_for_termination(filters, timeout)
+        LOGGER.info("Instance termination completed (%s)", report)
+        return report
+
+    def _terminate_batch(self, instance_ids: List[str]) -> Tuple[int, Exception]:
+        """Terminate a batch of instances, returning the number of instances and the error, if any."""
+        LOGGER.info("Terminating following instances: %s", instance_ids)
+        self._bucket.acquire()
+        try:
+            # Throttled calls are already retried by botocore, up to the max attempts of the RetryPolicy
+            AWSApi.instance().ec2.terminate_instances(instance_ids)
+            return len(instance_ids), None
+        except AWSClientError as e:
+            LOGGER.error("Failed when terminating instances %s with error: %s", instance_ids, e)
+            return len(instance_ids), e
+
+    @staticmethod
+    def _wait_for_termination(filters: List[Dict], timeout: int) -> int:
+        """Wait for the matching instances to be terminated, returning the number of the ones still alive."""
+        # Look for the instances in any non terminal state, including the shutting-down ones
+        filters = [f for f in filters if f["Name"] != "instance-state-name"]
+        filters.append({"Name": "instance-state-name", "Values": _NON_TERMINAL_STATES})
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = len(AWSApi.instance().ec2.list_instance_ids(filters))
+            if not remaining or time.monotonic() >= deadline:
+                return remaining
+            LOGGER.info("Waiting for %s instances to be terminated", remaining)
+            time.sleep(TERMINATION_POLL_INTERVAL)
@@ -0,0 +1,110 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import region_scope
+from pcluster.constants import INVENTORY_MAX_WORKERS
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RegionInventory:
+    """Resources listed in a region, or the error raised while listing them."""
+
+    def __init__(self, region: str, items: List = None, error: Exception = None):
+        self.region = region
+        self.items = items or []
+        self.error = error
+
+
+class Inventory:
+    """
+    Inventory of the resources deployed to multiple regions.
+
+    Regions are queried concurrently: each query runs within the region_scope of its region, so that every AWS call
+    it performs targets that region.
+    """
+
+    def __init__(self, regions: List[str], max_workers: int = INVENTORY_MAX_WORKERS):
+        # Remove duplicates, preserving the order
+        self.regions = list(dict.fromkeys(regions))
+        self.max_workers = max_workers
+
+    def iter_regions(self, list_function: Callable[[str], List]) -> Iterator[RegionInventory]:
+        """
+        Yield the inventory of each region as soon as it is available.
+
+        :param list_function: function receiving the region and returning the list of its resources
+        """
+        if not self.regions:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.regions))) as executor:
+            futures = [executor.submit(self._list_region, region, list_function) for region in self.regions]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def collect(self, list_function: Callable[[str], List]) -> Tuple[List, Dict[str, str]]:
+        """
+        Merge the resources of all the regions into a single list, following the order of the regions.
+
+        :param list_function: function receiving the region and returning the list of its resources
+        :return: a tuple with the list of the resources and the error messages by region
+        """
+        return self.merge(self.iter_regions(list_function))
+
+    def merge(self, region_inventories: Iterable[RegionInventory]) -> Tuple[List, Dict[str, str]]:
+        """
+        Merge the given inventories of the regions into a single list, following the order of the regions.
+
+        :return: a tuple with the list of the resources and the error messages by region
+        """
+        inventories = {inventory.region: inventory for inventory in region_inventories}
+
+        items = []
+        failures = {}
+        for region in self.regions:
+            inventory = inventories[region]
+            if inventory.error:
+                failures[region] = str(inventory.error)
+            items.extend(inventory.items)
+        return items, failures
+
+    @staticmethod
+    def _list_region(region: str, list_function: Callable[[str], List]) -> RegionInventory:
+        with region_scope(region):
+            try:
+                items = list_function(region)
+                LOGGER.info("Listed %s resources in region %s", len(items), region)
+                return RegionInventory(region, items=items)
+            except Exception as e:
+                LOGGER.error("Unable to list resources in region %s: %s", region, e)
+                return RegionInventory(region, error=e)
+
+
+def list_cluster_stacks() -> List[Dict]:
+    """Return all the cluster stacks of the current region, going through all the pages."""
+    return _list_all_pages(AWSApi.instance().cfn.list_pcluster_stacks)
+
+
+def list_imagebuilder_stacks() -> List[Dict]:
+    """Return all the image builder stacks of the current region, going through all the pages."""
+    return _list_all_pages(AWSApi.instance().cfn.get_imagebuilder_stacks)
+
+
+def _list_all_pages(list_function) -> List:
+    items, next_token = list_function()
+    while next_token:
+        page, next_token = list_function(next_token=next_token)
+        items.extend(page)
+    return items
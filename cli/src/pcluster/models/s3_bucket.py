@@ -17,14 +17,13 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
-import yaml
-
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.constants import PCLUSTER_S3_BUCKET_VERSION
-from pcluster.utils import get_partition, zip_dir
+from pcluster.constants import PCLUSTER_S3_BUCKET_VERSION, S3_UPLOAD_MAX_WORKERS
+from pcluster.utils import get_partition, yaml_dump, yaml_load, zip_dir
 
 LOGGER = logging.getLogger(__name__)
 
@@ -46,7 +45,14 @@ class S3FileType(Enum):
 
 
 class S3Bucket:
-    """Represent the s3 bucket configuration."""
+    """
+    Represent the s3 bucket configuration.
+
+    Artifacts are uploaded with the SHA-256 of their content in the object metadata, so that the upload of an artifact
+    already stored with the same content is skipped.
+    """
+
+    CHECKSUM_METADATA_KEY = "sha256"
 
     def __init__(
         self,
@@ -206,27 +212,52 @@ class S3Bucket:
             file_type=S3FileType.TEMPLATES, content=template_body, file_name=template_name, format=format
         )
 
-    def upload_resources(self, resource_dir, custom_artifacts_name):
+    def upload_resources(self, resource_dir, custom_artifacts_name, skip_unchanged=False):
         """
         Upload custom resources to S3 bucket.
 
+        Dirs are uploaded as zip archives and files as they are. Resources are uploaded concurrently.
+
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
+        :param skip_unchanged: skip the resources already stored with the same content, e.g. when the artifact
+        directory was populated by a previous operation
+        :return: the number of uploaded resources
         """
-        for res in os.listdir(resource_dir):
+        paths_by_name = {}
+        for res in sorted(os.listdir(resource_dir)):
             path = os.path.join(resource_dir, res)
             if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
-                )
+                paths_by_name[custom_artifacts_name] = path
             elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
+                paths_by_name[res] = path
+
+        with ThreadPoolExecutor(max_workers=S3_UPLOAD_MAX_WORKERS) as executor:
+            return sum(
+                executor.map(
+                    lambda name: self._upload_resource(paths_by_name[name], name, skip_unchanged), paths_by_name
                 )
+            )
+
+    def _upload_resource(self, path, resource_name, skip_unchanged):
+        """Upload the given file or dir, as zip archive, unless skip_unchanged and already stored with same content."""
+        key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, resource_name)
+        if os.path.isdir(path):
+            file_obj = zip_dir(path)
+            checksum = hashlib.sha256(file_obj.getbuffer()).hexdigest()
+        else:
+            file_obj = None
+            checksum = _get_file_checksum(path)
+
+        if skip_unchanged and self._is_stored(key, checksum):
+            LOGGER.info("Skipping upload of %s, already stored with the same content", key)
+            return 0
+        metadata = {self.CHECKSUM_METADATA_KEY: checksum}
+        if file_obj:
+            AWSApi.instance().s3.upload_fileobj(file_obj=file_obj, bucket_name=self.name, key=key, metadata=metadata)
+        else:
+            AWSApi.instance().s3.upload_file(file_path=path, bucket_name=self.name, key=key, metadata=metadata)
+        return 1
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -263,26 +294,28 @@ class S3Bucket:
     # --------------------------------------- S3 private functions --------------------------------------- #
 
     def _upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML):
-        """Upload file to S3 bucket."""
+        """
+        Upload file to S3 bucket.
+
+        Files are always uploaded, so that every upload creates a new version of the object, e.g. of the cluster config.
+        """
         if format == S3FileFormat.YAML:
-            result = AWSApi.instance().s3.put_object(
-                bucket_name=self.name,
-                body=yaml.dump(content),
-                key=self.get_object_key(file_type, file_name),
-            )
+            body = yaml_dump(content)
         elif format == S3FileFormat.JSON:
-            result = AWSApi.instance().s3.put_object(
-                bucket_name=self.name,
-                body=json.dumps(content),
-                key=self.get_object_key(file_type, file_name),
-            )
+            body = json.dumps(content)
         else:
-            result = AWSApi.instance().s3.put_object(
-                bucket_name=self.name,
-                body=content,
-                key=self.get_object_key(file_type, file_name),
-            )
-        return result
+            body = content
+        return AWSApi.instance().s3.put_object(
+            bucket_name=self.name, body=body, key=self.get_object_key(file_type, file_name)
+        )
+
+    def _is_stored(self, key, checksum):
+        """Tell if the object with the given key is stored with the given checksum."""
+        try:
+            stored_object = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key)
+        except AWSClientError:
+            return False
+        return stored_object.get("Metadata", {}).get(self.CHECKSUM_METADATA_KEY) == checksum
 
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
         """Get file from S3 bucket."""
@@ -293,7 +326,7 @@ class S3Bucket:
         file_content = result["Body"].read().decode("utf-8")
 
         if format == S3FileFormat.YAML:
-            file = yaml.safe_load(file_content)
+            file = yaml_load(file_content)
         elif format == S3FileFormat.JSON:
             file = json.loads(file_content)
         else:
@@ -389,6 +422,15 @@ class S3BucketFactory:
             raise e
 
 
+def _get_file_checksum(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 of the content of the given file, read in chunks."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
 def parse_bucket_url(url):
     """
     Parse s3 url to get bucket name and object name.
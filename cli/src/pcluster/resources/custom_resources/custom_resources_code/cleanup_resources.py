@@ -9,7 +9,9 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.config import Config
@@ -19,6 +21,41 @@ helper = CfnResource(json_logging=False, log_level="INFO", boto_level="ERROR", s
 logger = logging.getLogger(__name__)
 boto3_config = Config(retries={"max_attempts": 60})
 
+# Maximum number of concurrent TerminateInstances calls, and their rate per second
+TERMINATE_MAX_WORKERS = 8
+TERMINATE_REQUEST_RATE = 5
+# Interval in seconds between checks of the instances still alive
+TERMINATE_POLL_INTERVAL = 5
+# Limits of a single ChangeResourceRecordSets request: ResourceRecord elements and characters of their values
+ROUTE53_MAX_RECORDS_PER_CHANGE = 1000
+ROUTE53_MAX_CHARS_PER_CHANGE = 32000
+# Maximum number of concurrent ChangeResourceRecordSets calls, and their rate per second
+ROUTE53_MAX_WORKERS = 4
+ROUTE53_REQUEST_RATE = 5
+# Maximum interval in seconds between GetChange calls when waiting for the changes to be applied
+ROUTE53_MAX_POLL_INTERVAL = 10
+
+
+class _TokenBucket:
+    """Token bucket allowing a given rate of requests per second, with bursts up to the bucket capacity."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait_time:
+            time.sleep(wait_time)
+
 
 def _delete_dns_records(event):
     """Delete all DNS entries from the private Route53 hosted zone created within the cluster."""
@@ -32,23 +69,16 @@ def _delete_dns_records(event):
     try:
         logger.info("Deleting DNS records from %s", hosted_zone_id)
         route53 = boto3.client("route53", config=boto3_config)
-
-        completed_successfully = False
-        while not completed_successfully:
-            completed_successfully = True
-            for changes in _list_resource_record_sets_iterator(hosted_zone_id, domain_name):
-                if changes:
-                    try:
-                        route53.change_resource_record_sets(
-                            HostedZoneId=hosted_zone_id, ChangeBatch={"Changes": changes}
-                        )
-                    except Exception as e:
-                        logger.error("Failed when deleting DNS records from %s with error %s", hosted_zone_id, e)
-                        completed_successfully = False
-                        continue
-                else:
-                    logger.info("No DNS records to delete from %s.", hosted_zone_id)
-
+        token_bucket = _TokenBucket(ROUTE53_REQUEST_RATE, ROUTE53_MAX_WORKERS)
+
+        # The zone is listed again only to retry the records whose deletion failed
+        while True:
+            change_ids, failed = _submit_dns_records_deletion(route53, hosted_zone_id, domain_name, token_bucket)
+            if not change_ids and not failed:
+                logger.info("No DNS records to delete from %s.", hosted_zone_id)
+            _wait_for_dns_changes(route53, change_ids)
+            if not failed:
+                break
             logger.info("Sleeping for 5 seconds before retrying DNS records deletion.")
             time.sleep(5)
 
@@ -58,18 +88,77 @@ def _delete_dns_records(event):
         raise
 
 
+def _submit_dns_records_deletion(route53, hosted_zone_id, domain_name, token_bucket):
+    """
+    Delete the DNS records with concurrent rate-limited ChangeResourceRecordSets calls.
+
+    :return: the ids of the submitted changes and the number of failed change batches
+    """
+    with ThreadPoolExecutor(max_workers=ROUTE53_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_change_resource_record_sets, route53, hosted_zone_id, changes, token_bucket)
+            for changes in _record_sets_deletion_batches(hosted_zone_id, domain_name)
+        ]
+        change_ids = [future.result() for future in futures]
+    return [change_id for change_id in change_ids if change_id], change_ids.count(None)
+
+
+def _change_resource_record_sets(route53, hosted_zone_id, changes, token_bucket):
+    """Submit a batch of changes, returning the id of the change or None if it failed."""
+    token_bucket.acquire()
+    try:
+        response = route53.change_resource_record_sets(HostedZoneId=hosted_zone_id, ChangeBatch={"Changes": changes})
+        logger.info("Deleting %s DNS records from %s", len(changes), hosted_zone_id)
+        return response["ChangeInfo"]["Id"]
+    except Exception as e:
+        logger.error("Failed when deleting DNS records from %s with error %s", hosted_zone_id, e)
+        return None
+
+
+def _wait_for_dns_changes(route53, change_ids):
+    """Wait for the changes to be applied, polling GetChange with increasing intervals."""
+    poll_interval = 1
+    while change_ids:
+        change_ids = [
+            change_id
+            for change_id in change_ids
+            if route53.get_change(Id=change_id)["ChangeInfo"]["Status"] != "INSYNC"
+        ]
+        if change_ids:
+            logger.info("Waiting for %s DNS changes to be applied", len(change_ids))
+            time.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, ROUTE53_MAX_POLL_INTERVAL)
+
+
+def _record_sets_deletion_batches(hosted_zone_id, domain_name):
+    """Yield batches of DELETE changes, each within the limits of a single ChangeResourceRecordSets request."""
+    changes, records, chars = [], 0, 0
+    for record_set in _list_resource_record_sets_iterator(hosted_zone_id, domain_name):
+        values = [record["Value"] for record in record_set.get("ResourceRecords", [])]
+        record_count, char_count = max(len(values), 1), sum(len(value) for value in values)
+        if changes and (
+            records + record_count > ROUTE53_MAX_RECORDS_PER_CHANGE or chars + char_count > ROUTE53_MAX_CHARS_PER_CHANGE
+        ):
+            yield changes
+            changes, records, chars = [], 0, 0
+        changes.append({"Action": "DELETE", "ResourceRecordSet": record_set})
+        records += record_count
+        chars += char_count
+    if changes:
+        yield changes
+
+
 def _list_resource_record_sets_iterator(hosted_zone_id, domain_name):
     route53 = boto3.client("route53", config=boto3_config)
-    pagination_config = {"PageSize": 100}
+    # Maximum page size supported by ListResourceRecordSets
+    pagination_config = {"PageSize": 300}
 
     paginator = route53.get_paginator("list_resource_record_sets")
+    logger.info(f"Deleting ResourceRecordSets end with {domain_name}")
     for page in paginator.paginate(HostedZoneId=hosted_zone_id, PaginationConfig=pagination_config):
-        changes = []
-        logger.info(f"Deleting ResourceRecordSets end with {domain_name}")
         for record_set in page.get("ResourceRecordSets", []):
             if record_set.get("Type") == "A" and record_set.get("Name").endswith(domain_name):
-                changes.append({"Action": "DELETE", "ResourceRecordSet": record_set})
-        yield changes
+                yield record_set
 
 
 def _delete_s3_artifacts(event):
@@ -104,25 +193,18 @@ def _terminate_cluster_nodes(event):
         logger.info("Compute fleet clean-up: STARTED")
         stack_name = event["ResourceProperties"]["StackName"]
         ec2 = boto3.client("ec2", config=boto3_config)
-
-        completed_successfully = False
-        while not completed_successfully:
-            completed_successfully = True
-            for instance_ids in _describe_instance_ids_iterator(stack_name):
-                logger.info("Terminating instances %s", instance_ids)
-                if instance_ids:
-                    try:
-                        ec2.terminate_instances(InstanceIds=instance_ids)
-                    except Exception as e:
-                        logger.error("Failed when terminating instances with error %s", e)
-                        completed_successfully = False
-                        continue
-            logger.info("Sleeping for 10 seconds to allow all instances to initiate shut-down")
-            time.sleep(10)
-
-        while _has_shuttingdown_instances(stack_name):
-            logger.info("Waiting for all nodes to shut-down...")
-            time.sleep(10)
+        token_bucket = _TokenBucket(TERMINATE_REQUEST_RATE, TERMINATE_MAX_WORKERS)
+
+        # Instances still active, including the ones whose termination failed, are terminated again at every check
+        while True:
+            requested, failed = _terminate_instances(ec2, stack_name, token_bucket)
+            if requested:
+                logger.info("Requested termination of %s instances, %s failed", requested, failed)
+            elif _has_shuttingdown_instances(stack_name):
+                logger.info("Waiting for all nodes to shut-down...")
+            else:
+                break
+            time.sleep(TERMINATE_POLL_INTERVAL)
 
         # Sleep for 30 more seconds to give PlacementGroups the time to update
         time.sleep(30)
@@ -133,6 +215,35 @@ def _terminate_cluster_nodes(event):
         raise
 
 
+def _terminate_instances(ec2, stack_name, token_bucket):
+    """
+    Terminate the active instances of the cluster with concurrent rate-limited batches.
+
+    Batches are submitted as the pages of the instances are retrieved.
+    :return: the number of instances whose termination was requested and the number of the failed ones
+    """
+    with ThreadPoolExecutor(max_workers=TERMINATE_MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(_terminate_batch, ec2, instance_ids, token_bucket)
+            for instance_ids in _describe_instance_ids_iterator(stack_name)
+            if instance_ids
+        ]
+        results = [future.result() for future in futures]
+    return sum(count for count, _ in results), sum(count for count, succeeded in results if not succeeded)
+
+
+def _terminate_batch(ec2, instance_ids, token_bucket):
+    """Terminate a batch of instances, throttled calls are retried by botocore."""
+    token_bucket.acquire()
+    logger.info("Terminating instances %s", instance_ids)
+    try:
+        ec2.terminate_instances(InstanceIds=instance_ids)
+        return len(instance_ids), True
+    except Exception as e:
+        logger.error("Failed when terminating instances with error %s", e)
+        return len(instance_ids), False
+
+
 def _has_shuttingdown_instances(stack_name):
     ec2 = boto3.client("ec2", config=boto3_config)
     filters = [
@@ -484,7 +484,7 @@ class SharedStorageSchema(BaseSchema):
     @pre_dump
     def restore_child(self, data, **kwargs):
         """Restore back the child in the schema."""
-        adapted_data = copy.deepcopy(data)
+        adapted_data = copy.copy(data)
         # Move SharedXxx as a child to be automatically managed by marshmallow, see post_load action
         if adapted_data.shared_storage_type == "efs":
             storage_type = "efs"
@@ -1596,7 +1596,7 @@ class SchedulingSchema(BaseSchema):
     @pre_dump
     def restore_child(self, data, **kwargs):
         """Restore back the child in the schema, see post_load action."""
-        adapted_data = copy.deepcopy(data)
+        adapted_data = copy.copy(data)
         if adapted_data.scheduler == "awsbatch":
             scheduler_prefix = "aws_batch"
         elif adapted_data.scheduler == "plugin":
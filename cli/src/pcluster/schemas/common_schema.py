@@ -92,14 +92,16 @@ class BaseSchema(Schema):
     @pre_dump
     def prepare_objects(self, data, **kwargs):
         """Prepare objects to be ready for yaml conversion."""
-        adapted_data = copy.deepcopy(data)
+        # A shallow copy is enough since only the attributes of the copy are changed, nested resources are prepared
+        # by their own schemas
+        adapted_data = copy.copy(data)
         if self.context.get("delete_defaults_when_dump"):
             for key, value in vars(adapted_data).copy().items():
                 # Remove value implied by the code. i.e., only keep parameters that were specified in the yaml file
                 if _is_implied(adapted_data, key, value):
                     delattr(adapted_data, key)
-                if isinstance(value, list):
-                    value[:] = [v for v in value if not _is_implied(adapted_data, key, v)]
+                elif isinstance(value, list):
+                    setattr(adapted_data, key, [v for v in value if not _is_implied(adapted_data, key, v)])
 
         for key, value in vars(adapted_data).items():
             # Unwrap "param" attributes
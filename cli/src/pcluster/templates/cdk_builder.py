@@ -18,6 +18,7 @@ import tempfile
 from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
 from pcluster.models.s3_bucket import S3Bucket
+from pcluster.templates.synthesis_worker import SynthesisWorkerPool
 from pcluster.utils import load_yaml_dict
 
 
@@ -29,31 +30,55 @@ class CDKTemplateBuilder:
         cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
     ):
         """Build template for the given cluster and return as output in Yaml format."""
-        from aws_cdk.core import App  # pylint: disable=C0415
-
-        from pcluster.templates.cluster_stack import ClusterCdkStack  # pylint: disable=C0415
-
-        with tempfile.TemporaryDirectory() as tempdir:
-            output_file = str(stack_name)
-            app = App(outdir=str(tempdir))
-            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
-            app.synth()
-            generated_template = load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
-
-        return generated_template
+        return _synthesize_template(
+            "cluster",
+            cluster_config=cluster_config,
+            bucket=bucket,
+            stack_name=stack_name,
+            log_group_name=log_group_name,
+        )
 
     @staticmethod
     def build_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
         """Build template for the given imagebuilder and return as output in Yaml format."""
-        from aws_cdk.core import App  # pylint: disable=C0415
+        return _synthesize_template("imagebuilder", image_config=image_config, image_id=image_id, bucket=bucket)
+
+
+def synthesize_cluster_template(
+    cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
+):
+    """Synthesize the template of the given cluster with CDK."""
+    from aws_cdk.core import App  # pylint: disable=C0415
+
+    from pcluster.templates.cluster_stack import ClusterCdkStack  # pylint: disable=C0415
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        output_file = str(stack_name)
+        app = App(outdir=str(tempdir))
+        ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
+        app.synth()
+        return load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
+
+
+def synthesize_imagebuilder_template(image_config: ImageBuilderConfig, image_id: str, bucket: S3Bucket):
+    """Synthesize the template of the given image with CDK."""
+    from aws_cdk.core import App  # pylint: disable=C0415
+
+    from pcluster.templates.imagebuilder_stack import ImageBuilderCdkStack  # pylint: disable=C0415
 
-        from pcluster.templates.imagebuilder_stack import ImageBuilderCdkStack  # pylint: disable=C0415
+    with tempfile.TemporaryDirectory() as tempdir:
+        output_file = "imagebuilder"
+        app = App(outdir=str(tempdir))
+        ImageBuilderCdkStack(app, output_file, image_config, image_id, bucket)
+        app.synth()
+        return load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
 
-        with tempfile.TemporaryDirectory() as tempdir:
-            output_file = "imagebuilder"
-            app = App(outdir=str(tempdir))
-            ImageBuilderCdkStack(app, output_file, image_config, image_id, bucket)
-            app.synth()
-            generated_template = load_yaml_dict(os.path.join(tempdir, f"{output_file}.template.json"))
 
-        return generated_template
+def _synthesize_template(template_type: str, **kwargs):
+    """Synthesize the template in a worker of the SynthesisWorkerPool, if enabled, or in the current process."""
+    pool = SynthesisWorkerPool.instance()
+    if pool:
+        return pool.synthesize(template_type, **kwargs)
+    if template_type == "cluster":
+        return synthesize_cluster_template(**kwargs)
+    return synthesize_imagebuilder_template(**kwargs)
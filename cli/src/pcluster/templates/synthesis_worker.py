@@ -0,0 +1,337 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+# This module contains the long-lived worker processes used to synthesize CDK templates.
+#
+# Importing aws_cdk starts the jsii runtime, a Node.js process loading the CDK libraries, which is the most expensive
+# part of a synthesis. Workers pay that cost once and then synthesize templates for many requests.
+# Requests and responses are exchanged as length-prefixed pickles over the stdin and stdout pipes of the worker:
+# pipes are used instead of multiprocessing since its synchronization primitives are not available in AWS Lambda.
+#
+import logging
+import os
+import pickle  # nosec nosemgrep - only used to exchange data with the worker processes spawned by this module
+import queue
+import select
+import struct
+import subprocess  # nosec
+import sys
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">Q")
+
+
+class SynthesisWorkerError(Exception):
+    """Represent an error in the communication with a synthesis worker or an error not transferable from it."""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+def _write_message(stream, message):
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(_HEADER.pack(len(payload)))
+    stream.write(payload)
+    stream.flush()
+
+
+def _read_exactly(stream, size):
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            raise EOFError("Synthesis worker pipe closed")
+        data += chunk
+    return data
+
+
+def _read_message(stream):
+    (size,) = _HEADER.unpack(_read_exactly(stream, _HEADER.size))
+    return pickle.loads(_read_exactly(stream, size))  # nosec nosemgrep - data comes from the worker process
+
+
+class SynthesisWorker:
+    """A Python process, started from this module, synthesizing the templates requested through its stdin."""
+
+    def __init__(self):
+        # A nosec comment is appended to the following line in order to disable the B603 check.
+        # [B603:subprocess_without_shell_equals_true] the command only contains the current interpreter and module
+        self._process = subprocess.Popen(  # nosec nosemgrep
+            [sys.executable, "-m", __name__], stdin=subprocess.PIPE, stdout=subprocess.PIPE, shell=False
+        )
+        self.last_used = time.monotonic()
+        LOGGER.info("Started CDK synthesis worker with pid %s", self._process.pid)
+
+    @property
+    def pid(self):
+        """Return the process id of the worker."""
+        return self._process.pid
+
+    def is_alive(self):
+        """Tell if the worker process is running."""
+        return self._process.poll() is None
+
+    def request(self, action: str, timeout: float = None, **kwargs):
+        """
+        Send a request to the worker and return its result.
+
+        Exceptions raised by the worker are raised again in the caller; if the whole reply is not received within
+        timeout seconds or the worker process terminates, the worker is stopped and a SynthesisWorkerError is raised.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        try:
+            _write_message(self._process.stdin, {"action": action, "environ": _worker_environ(), "kwargs": kwargs})
+            (size,) = _HEADER.unpack(self._read_reply(_HEADER.size, deadline, timeout))
+            status, result = pickle.loads(  # nosec nosemgrep - data comes from the worker process
+                self._read_reply(size, deadline, timeout)
+            )
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, SynthesisWorkerError) as e:
+            self.stop()
+            raise e if isinstance(e, SynthesisWorkerError) else SynthesisWorkerError(f"Synthesis worker failure: {e}")
+        finally:
+            self.last_used = time.monotonic()
+        if status == "error":
+            raise _load_exception(result)
+        return result
+
+    def _read_reply(self, size: int, deadline: float, timeout: float):
+        """Read size bytes of the reply from the stdout of the worker, waiting up to the deadline."""
+        # The pipe is read through its file descriptor, so that no data is held in a buffer unseen by select
+        fd = self._process.stdout.fileno()
+        data = b""
+        while len(data) < size:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                    raise SynthesisWorkerError(f"Synthesis worker {self.pid} did not reply within {timeout} seconds")
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                raise EOFError("Synthesis worker pipe closed")
+            data += chunk
+        return data
+
+    def ping(self, timeout: float):
+        """Check that the worker is able to serve requests."""
+        return self.request("ping", timeout=timeout) == "pong"
+
+    def stop(self):
+        """Terminate the worker process."""
+        if self.is_alive():
+            LOGGER.info("Stopping CDK synthesis worker with pid %s", self.pid)
+            self._process.stdin.close()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+    def kill(self):
+        """Kill the worker process, without waiting for the request in progress, if any, to complete."""
+        if self.is_alive():
+            LOGGER.info("Killing CDK synthesis worker with pid %s", self.pid)
+            self._process.kill()
+            self._process.wait()
+
+
+class SynthesisWorkerPool:
+    """
+    Pool of synthesis workers, limiting the number of templates synthesized concurrently.
+
+    Workers are started on demand, up to max_workers, and reused by the following requests. Workers idle for more
+    than HEALTH_CHECK_INTERVAL seconds are pinged before being reused and replaced if unresponsive; a synthesis not
+    completed within SYNTHESIS_TIMEOUT seconds stops its worker. The pool used by CDKTemplateBuilder is enabled by
+    setting the PCLUSTER_CDK_WORKERS environment variable to the number of workers.
+    """
+
+    HEALTH_CHECK_INTERVAL = 60
+    HEALTH_CHECK_TIMEOUT = 10
+    SYNTHESIS_TIMEOUT = 600
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._idle_workers = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        # All the workers started by the pool, idle or busy
+        self._workers = set()
+        self._workers_lock = threading.Lock()
+
+    @staticmethod
+    def get_max_workers():
+        """Return the number of workers configured through PCLUSTER_CDK_WORKERS, 0 if the pool is disabled."""
+        try:
+            return max(int(os.environ.get("PCLUSTER_CDK_WORKERS", "0")), 0)
+        except ValueError:
+            LOGGER.warning("Ignoring invalid value of PCLUSTER_CDK_WORKERS: %s", os.environ["PCLUSTER_CDK_WORKERS"])
+            return 0
+
+    @classmethod
+    def instance(cls):
+        """Return the pool shared by the process, or None if the pool is disabled."""
+        max_workers = cls.get_max_workers()
+        if not max_workers:
+            return None
+        with cls._instance_lock:
+            if not cls._instance or cls._instance.max_workers != max_workers:
+                if cls._instance:
+                    cls._instance.shutdown()
+                cls._instance = SynthesisWorkerPool(max_workers)
+            return cls._instance
+
+    def _acquire_worker(self):
+        while True:
+            try:
+                worker = self._idle_workers.get_nowait()
+            except queue.Empty:
+                worker = SynthesisWorker()
+                with self._workers_lock:
+                    self._workers.add(worker)
+                return worker
+            if self._is_healthy(worker):
+                return worker
+            self._discard(worker)
+
+    def _is_healthy(self, worker: SynthesisWorker):
+        """Tell if the worker is running and, if it has been idle for a while, still responsive."""
+        if not worker.is_alive():
+            LOGGER.warning("CDK synthesis worker with pid %s terminated, replacing it", worker.pid)
+            return False
+        if time.monotonic() - worker.last_used < self.HEALTH_CHECK_INTERVAL:
+            return True
+        try:
+            return worker.ping(self.HEALTH_CHECK_TIMEOUT)
+        except SynthesisWorkerError as e:
+            LOGGER.warning("CDK synthesis worker health check failed, replacing it: %s", e)
+            return False
+
+    def _discard(self, worker: SynthesisWorker):
+        worker.stop()
+        with self._workers_lock:
+            self._workers.discard(worker)
+
+    def submit(self, action: str, timeout: float = None, **kwargs):
+        """
+        Run the given action in a worker, waiting for a worker to be available if all of them are busy.
+
+        :param timeout: maximum time in seconds to wait for the result, after which the worker is stopped
+        """
+        with self._slots:
+            worker = self._acquire_worker()
+            try:
+                return worker.request(action, timeout=timeout, **kwargs)
+            finally:
+                if worker.is_alive():
+                    self._idle_workers.put(worker)
+                else:
+                    self._discard(worker)
+
+    def synthesize(self, template_type: str, **kwargs):
+        """Synthesize the template of the given type ("cluster" or "imagebuilder") in a worker."""
+        return self.submit(f"synthesize_{template_type}_template", timeout=self.SYNTHESIS_TIMEOUT, **kwargs)
+
+    def shutdown(self):
+        """Stop the idle workers and kill the busy ones, whose pending requests fail with a SynthesisWorkerError."""
+        idle_workers = set()
+        while True:
+            try:
+                idle_workers.add(self._idle_workers.get_nowait())
+            except queue.Empty:
+                break
+        with self._workers_lock:
+            busy_workers = self._workers - idle_workers
+            self._workers.clear()
+        for worker in idle_workers:
+            worker.stop()
+        for worker in busy_workers:
+            worker.kill()
+
+
+def _worker_environ():
+    """Return the environment variables the worker needs to reproduce the AWS context of the caller."""
+    from pcluster.aws.common import AWSClientError, get_region  # pylint: disable=import-outside-toplevel
+
+    environ = {key: value for key, value in os.environ.items() if key.startswith(("AWS_", "PCLUSTER_"))}
+    try:
+        # The region may be overridden for the current thread by region_scope
+        environ["AWS_DEFAULT_REGION"] = get_region()
+    except AWSClientError:
+        pass
+    return environ
+
+
+def _handle_request(request):
+    from pcluster.aws.common import Cache  # pylint: disable=import-outside-toplevel
+    from pcluster.templates import cdk_builder  # pylint: disable=import-outside-toplevel
+
+    for key in [key for key in os.environ if key.startswith(("AWS_", "PCLUSTER_"))]:
+        del os.environ[key]
+    os.environ.update(request["environ"])
+    # AWS data cached by previous requests may be stale, apart from immutable data with a time-to-live
+    Cache.clear_all(preserve_ttl=True)
+
+    action = request["action"]
+    if action == "ping":
+        return "pong"
+    if action == "synthesize_cluster_template":
+        return cdk_builder.synthesize_cluster_template(**request["kwargs"])
+    if action == "synthesize_imagebuilder_template":
+        return cdk_builder.synthesize_imagebuilder_template(**request["kwargs"])
+    raise SynthesisWorkerError(f"Unknown synthesis worker action: {action}")
+
+
+def serve(input_stream, output_stream):
+    """Serve the requests read from input_stream until it is closed."""
+    while True:
+        try:
+            request = _read_message(input_stream)
+        except EOFError:
+            return
+        try:
+            response = ("ok", _handle_request(request))
+        except Exception as e:
+            response = ("error", _dump_exception(e))
+        try:
+            _write_message(output_stream, response)
+        except Exception as e:
+            _write_message(output_stream, ("error", _dump_exception(e)))
+
+
+def _dump_exception(exception):
+    """Serialize the exception, with a description to raise in its place if it cannot be pickled or unpickled."""
+    try:
+        pickled_exception = pickle.dumps(exception)
+    except Exception:
+        pickled_exception = None
+    return {"exception": pickled_exception, "message": f"{type(exception).__name__}: {exception}"}
+
+
+def _load_exception(error):
+    try:
+        return pickle.loads(error["exception"])  # nosec nosemgrep - data comes from the worker process
+    except Exception:
+        return SynthesisWorkerError(error["message"])
+
+
+def main():
+    # Keep the original stdout for the responses and send anything else written to it, by this process or by the
+    # jsii runtime, to stderr
+    output_stream = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    serve(sys.stdin.buffer, output_stream)
+
+
+if __name__ == "__main__":
+    main()
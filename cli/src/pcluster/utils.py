@@ -17,8 +17,6 @@ import random
 import re
 import string
 import sys
-import time
-import urllib.request
 import zipfile
 from io import BytesIO
 from shlex import quote
@@ -26,16 +24,29 @@ from typing import NoReturn
 from urllib.parse import urlparse
 
 import dateutil.parser
-import pkg_resources
 import yaml
-from pkg_resources import packaging
 
-from pcluster.aws.common import get_region
 from pcluster.constants import SUPPORTED_OSES_FOR_ARCHITECTURE, SUPPORTED_OSES_FOR_SCHEDULER
 
+try:
+    # The LibYAML bindings are several times faster than the pure Python implementation
+    from yaml import CDumper as YamlDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import Dumper as YamlDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
 LOGGER = logging.getLogger(__name__)
 
 
+def get_region():
+    """Get region used internally for all the AWS calls."""
+    # Imported on use to keep boto3 out of the import path of lightweight CLI commands
+    from pcluster.aws.common import get_region as aws_get_region  # pylint: disable=import-outside-toplevel
+
+    return aws_get_region()
+
+
 def get_partition():
     """Get partition for the region set in the environment."""
     return next(("aws-" + partition for partition in ["us-gov", "cn"] if get_region().startswith(partition)), "aws")
@@ -83,6 +94,7 @@ def _add_file_to_zip(zip_file, path, arcname):
     :param arcname: string; filename to put bytes from path under in created archive
     """
     with open(path, "rb") as input_file:
+        # The default date_time of ZipInfo (1980-01-01) is used instead of the file modification time
         zinfo = zipfile.ZipInfo(filename=arcname)
         zinfo.external_attr = 0o644 << 16
         zip_file.writestr(zinfo, input_file.read())
@@ -93,13 +105,16 @@ def zip_dir(path):
     Create a zip archive containing all files and dirs rooted in path.
 
     The archive is created in memory and a file handler is returned by the function.
+    Files are added in a deterministic order with a fixed timestamp, so that the archive of the same content is always
+    identical and can be compared by checksum.
     :param path: directory containing the resources to archive.
     :return: file handler pointing to the compressed archive.
     """
     file_out = BytesIO()
     with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
-        for root, _, files in os.walk(path):
-            for file in files:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file in sorted(files):
                 _add_file_to_zip(
                     ziph,
                     os.path.join(root, file),
@@ -213,19 +228,17 @@ def verify_stack_status(stack_name, waiting_states, successful_states):
     :param successful_states: list of final status considered as successful
     :return: True if the final status is in the successful_states list, False otherwise.
     """
-    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+    from pcluster.aws.waiters import StackWaiter  # pylint: disable=import-outside-toplevel
 
-    status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
     resource_status = ""
-    while status in waiting_states:
-        status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
-        events = AWSApi.instance().cfn.get_stack_events(stack_name)["StackEvents"][0]
-        resource_status = ("Status: %s - %s" % (events.get("LogicalResourceId"), events.get("ResourceStatus"))).ljust(
-            80
-        )
+
+    def _print_event(event):
+        nonlocal resource_status
+        resource_status = ("Status: %s - %s" % (event.get("LogicalResourceId"), event.get("ResourceStatus"))).ljust(80)
         sys.stdout.write("\r%s" % resource_status)
         sys.stdout.flush()
-        time.sleep(5)
+
+    status = StackWaiter(stack_name, on_event=_print_event).wait(waiting_states)
     # print the last status update in the logs
     if resource_status != "":
         LOGGER.debug(resource_status)
@@ -244,13 +257,29 @@ def get_templates_bucket_path():
 
 def get_installed_version(base_version_only: bool = False):
     """Get the version of the installed aws-parallelcluster package."""
-    pkg_distribution = pkg_resources.get_distribution("aws-parallelcluster")
-    return pkg_distribution.version if not base_version_only else pkg_distribution.parsed_version.base_version
+    # pkg_resources is slow to import, so it is only used when needed or when importlib.metadata is not available
+    try:
+        from importlib.metadata import version as distribution_version  # pylint: disable=import-outside-toplevel
+
+        version = distribution_version("aws-parallelcluster")
+    except ImportError:  # Python < 3.8
+        import pkg_resources  # pylint: disable=import-outside-toplevel
+
+        version = pkg_resources.get_distribution("aws-parallelcluster").version
+    if base_version_only:
+        from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
+        return packaging.version.parse(version).base_version
+    return version
 
 
 def check_if_latest_version():
     """Check if the current package version is the latest one."""
     try:
+        import urllib.request  # pylint: disable=import-outside-toplevel
+
+        from pkg_resources import packaging  # pylint: disable=import-outside-toplevel
+
         pypi_url = "https://pypi.python.org/pypi/aws-parallelcluster/json"
         with urllib.request.urlopen(pypi_url) as url:  # nosec nosemgrep
             latest = json.loads(url.read())["info"]["version"]
@@ -309,10 +338,20 @@ def get_url_scheme(url):
     return urlparse(url).scheme
 
 
+def yaml_load(stream):
+    """Parse a YAML document like yaml.safe_load, using the LibYAML bindings when available."""
+    return yaml.load(stream, Loader=YamlSafeLoader)  # nosec nosemgrep - the loader is a safe loader
+
+
+def yaml_dump(data, stream=None, **kwargs):
+    """Serialize data into a YAML document like yaml.dump, using the LibYAML bindings when available."""
+    return yaml.dump(data, stream, Dumper=YamlDumper, **kwargs)
+
+
 def load_yaml_dict(file_path):
     """Read the content of a yaml file."""
     with open(file_path, encoding="utf-8") as conf_file:
-        yaml_content = yaml.safe_load(conf_file)
+        yaml_content = yaml_load(conf_file)
 
     # TODO use from cfn_flip import load_yaml
     return yaml_content
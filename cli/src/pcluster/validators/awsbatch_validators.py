@@ -26,6 +26,8 @@ class AwsBatchRegionValidator(Validator):
     Validate if the region is supported by AWS Batch.
     """
 
+    cacheable = True
+
     def _validate(self, region: str):
         # TODO use dryrun
         if region in ["ap-northeast-3"]:
@@ -39,6 +41,8 @@ class AwsBatchComputeResourceSizeValidator(Validator):
     Validate min, desired and max vCPUs combination.
     """
 
+    cacheable = True
+
     def _validate(self, min_vcpus: int, desired_vcpus: int, max_vcpus: int):
         if desired_vcpus < min_vcpus:
             self._add_failure(
@@ -159,6 +163,8 @@ class AwsBatchInstancesArchitectureCompatibilityValidator(Validator):
     With AWS Batch, compute instance type can contain a CSV list.
     """
 
+    cacheable = True
+
     def _validate(self, instance_types: List[str], architecture: str):
         for instance_type in instance_types:
             # When awsbatch is used as the scheduler instance families can be used.
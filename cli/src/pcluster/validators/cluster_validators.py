@@ -8,8 +8,11 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import os
 import re
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 from pcluster.aws.aws_api import AWSApi
@@ -17,6 +20,7 @@ from pcluster.aws.common import AWSClientError
 from pcluster.cli.commands.dcv_util import get_supported_dcv_os
 from pcluster.constants import (
     CIDR_ALL_IPS,
+    DRYRUN_MAX_WORKERS,
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_NAME_MAX_LENGTH,
     PCLUSTER_NAME_REGEX,
@@ -63,6 +67,8 @@ CLUSTER_NAME_AND_CUSTOM_DOMAIN_NAME_MAX_LENGTH = 255 - HOST_NAME_MAX_LENGTH - 1
 class ClusterNameValidator(Validator):
     """Cluster name validator."""
 
+    cacheable = True
+
     def _validate(self, name):
         if not re.match(PCLUSTER_NAME_REGEX % (PCLUSTER_NAME_MAX_LENGTH - 1), name):
             self._add_failure(
@@ -78,6 +84,8 @@ class ClusterNameValidator(Validator):
 class RegionValidator(Validator):
     """Region validator."""
 
+    cacheable = True
+
     def _validate(self, region):
         if region not in SUPPORTED_REGIONS:
             self._add_failure(
@@ -92,6 +100,8 @@ class SchedulerOsValidator(Validator):
     Validate os and scheduler combination.
     """
 
+    cacheable = True
+
     def _validate(self, os, scheduler):
         supported_os = get_supported_os_for_scheduler(scheduler)
         if os not in supported_os:
@@ -149,6 +159,8 @@ class ComputeResourceSizeValidator(Validator):
     Validate min count and max count combinations.
     """
 
+    cacheable = True
+
     def _validate(self, min_count, max_count):
         if max_count < min_count:
             self._add_failure("Max count must be greater than or equal to min count.", FailureLevel.ERROR)
@@ -161,6 +173,8 @@ class DisableSimultaneousMultithreadingArchitectureValidator(Validator):
     Validate Simultaneous Multithreading and architecture combination.
     """
 
+    cacheable = True
+
     def _validate(self, disable_simultaneous_multithreading, architecture: str):
         supported_architectures = ["x86_64"]
         if disable_simultaneous_multithreading and architecture not in supported_architectures:
@@ -174,6 +188,8 @@ class DisableSimultaneousMultithreadingArchitectureValidator(Validator):
 class EfaOsArchitectureValidator(Validator):
     """OS and architecture combination validator if EFA is enabled."""
 
+    cacheable = True
+
     def _validate(self, efa_enabled: bool, os: str, architecture: str):
         if efa_enabled and os in EFA_UNSUPPORTED_ARCHITECTURES_OSES.get(architecture):
             self._add_failure(
@@ -188,6 +204,8 @@ class ArchitectureOsValidator(Validator):
     ARM AMIs are only available for a subset of the supported OSes.
     """
 
+    cacheable = True
+
     def _validate(self, os: str, architecture: str, custom_ami: str, ami_search_filters):
         allowed_oses = get_supported_os_for_architecture(architecture)
         if os not in allowed_oses:
@@ -212,6 +230,8 @@ class InstanceArchitectureCompatibilityValidator(Validator):
     Verify that head node and compute instance types imply compatible architectures.
     """
 
+    cacheable = True
+
     def _validate(self, instance_type, architecture: str):
         head_node_architecture = architecture
         compute_architectures = AWSApi.instance().ec2.get_supported_architectures(instance_type)
@@ -228,6 +248,8 @@ class InstanceArchitectureCompatibilityValidator(Validator):
 class NameValidator(Validator):
     """Validate queue name length and format."""
 
+    cacheable = True
+
     def _validate(self, name):
         match = re.match(NAME_REGEX, name)
         if not match:
@@ -251,6 +273,8 @@ class NameValidator(Validator):
 class MaxCountValidator(Validator):
     """Validate whether the number of resource exceeds the limits."""
 
+    cacheable = True
+
     def _validate(self, resources_length, max_length, resource_name):
 
         if resources_length > max_length:
@@ -269,6 +293,8 @@ class MaxCountValidator(Validator):
 class EfaValidator(Validator):
     """Check if EFA and EFA GDR are supported features in the given instance type."""
 
+    cacheable = True
+
     def _validate(self, instance_type, efa_enabled, gdr_support):
 
         instance_type_supports_efa = AWSApi.instance().ec2.get_instance_type_info(instance_type).is_efa_supported()
@@ -285,6 +311,8 @@ class EfaValidator(Validator):
 class EfaPlacementGroupValidator(Validator):
     """Validate placement group if EFA is enabled."""
 
+    cacheable = True
+
     def _validate(self, efa_enabled, placement_group_enabled, placement_group_config_implicit):
         if efa_enabled and placement_group_config_implicit:
             self._add_failure(
@@ -462,6 +490,8 @@ class FsxArchitectureOsValidator(Validator):
     Validate file system mount point according to the head node subnet.
     """
 
+    cacheable = True
+
     def _validate(self, architecture: str, os):
 
         if architecture not in FSX_SUPPORTED_ARCHITECTURES_OSES:
@@ -511,6 +541,8 @@ class DuplicateMountDirValidator(Validator):
     Verify if there are duplicated mount dirs between shared storage and ephemeral volumes.
     """
 
+    cacheable = True
+
     def _validate(self, mount_dir_list):
         duplicated_mount_dirs = _find_duplicate_params(mount_dir_list)
         if duplicated_mount_dirs:
@@ -531,6 +563,8 @@ class OverlappingMountDirValidator(Validator):
     Two mount dirs are overlapped if one is contained into the other.
     """
 
+    cacheable = True
+
     def _validate(self, mount_dir_list):
         overlapping_mount_dirs = _find_overlapping_paths(mount_dir_list)
         if overlapping_mount_dirs:
@@ -550,6 +584,8 @@ class NumberOfStorageValidator(Validator):
     Validate the number of storage specified is lower than maximum supported.
     """
 
+    cacheable = True
+
     def _validate(self, storage_type: str, max_number: int, storage_count: int):
         if storage_count > max_number:
             self._add_failure(
@@ -592,6 +628,8 @@ class SharedStorageNameValidator(Validator):
     Since the storage name is used as a tag, the provided name must comply with the tag pattern.
     """
 
+    cacheable = True
+
     def _validate(self, name: str):
         if not re.match(PCLUSTER_TAG_VALUE_REGEX, name):
             self._add_failure(
@@ -623,6 +661,8 @@ class DcvValidator(Validator):
     Validate instance type, architecture and os when DCV is enabled.
     """
 
+    cacheable = True
+
     def _validate(self, instance_type, dcv_enabled, allowed_ips, port, os, architecture: str):
         if dcv_enabled:
             allowed_oses = get_supported_dcv_os(architecture)
@@ -653,6 +693,8 @@ class DcvValidator(Validator):
 class IntelHpcOsValidator(Validator):
     """Intel HPC OS validator."""
 
+    cacheable = True
+
     def _validate(self, os: str):
         allowed_oses = ["centos7"]
         if os not in allowed_oses:
@@ -666,6 +708,8 @@ class IntelHpcOsValidator(Validator):
 class IntelHpcArchitectureValidator(Validator):
     """Intel HPC architecture validator."""
 
+    cacheable = True
+
     def _validate(self, architecture: str):
         allowed_architectures = ["x86_64"]
         if architecture not in allowed_architectures:
@@ -686,6 +730,8 @@ class DuplicateNameValidator(Validator):
     Verify if there are duplicated names.
     """
 
+    cacheable = True
+
     def _validate(self, name_list, resource_name):
         duplicated_names = _find_duplicate_params(name_list)
         if duplicated_names:
@@ -710,6 +756,8 @@ class QueuesSecurityGroupOverwriteStatus(Enum):
 class MixedSecurityGroupOverwriteValidator(Validator):
     """Warn if some nodes are using custom security groups while others are using managed security groups."""
 
+    cacheable = True
+
     def _validate(self, head_node_security_groups, queues):
         compute_security_group_overwrite_status = self._get_queues_security_group_overwrite_status(queues)
         if (
@@ -889,6 +937,8 @@ class HeadNodeImdsValidator(Validator):
     Verify if the Head Node IMDs configuration is compatible with other configurations.
     """
 
+    cacheable = True
+
     def _validate(self, imds_secured: bool, scheduler: str):
         if scheduler is None:
             self._add_failure("Cannot validate IMDS configuration if scheduler is not set.", FailureLevel.ERROR)
@@ -903,12 +953,22 @@ class HeadNodeImdsValidator(Validator):
 
 
 class ComputeResourceLaunchTemplateValidator(_LaunchTemplateValidator):
-    """Try to launch the requested instances (in dry-run mode) to verify configuration parameters."""
+    """
+    Try to launch the requested instances (in dry-run mode) to verify configuration parameters.
+
+    By default only the "best" compute resource of the queue is tested in its first subnet.
+    When the PCLUSTER_DRYRUN_ALL_COMPUTE_RESOURCES environment variable is set to true, every compute resource is tested
+    in every subnet of the queue; identical launch requests are tested only once and the dry-run calls are executed
+    concurrently on a bounded pool of workers.
+    """
 
-    def _validate(self, queue, ami_id, tags):
+    def _validate(self, queue, ami_id, tags, test_all_compute_resources: bool = None):
+        if test_all_compute_resources is None:
+            test_all_compute_resources = (
+                os.environ.get("PCLUSTER_DRYRUN_ALL_COMPUTE_RESOURCES", "false").lower() == "true"
+            )
         try:
             # Retrieve network parameters
-            queue_subnet_id = queue.networking.subnet_ids[0]
             queue_security_groups = []
             if queue.networking.security_groups:
                 queue_security_groups.extend(queue.networking.security_groups)
@@ -919,31 +979,75 @@ class ComputeResourceLaunchTemplateValidator(_LaunchTemplateValidator):
             queue_placement_group_id = queue.networking.placement_group.id if queue.networking.placement_group else None
             queue_placement_group = {"GroupName": queue_placement_group_id} if queue_placement_group_id else {}
 
-            # Select the "best" compute resource to run dryrun tests against.
-            # Resources with multiple NICs are preferred among others.
-            # Temporarily limiting dryrun tests to 1 per queue to save boto3 calls.
-            dry_run_compute_resource = next(
-                (compute_res for compute_res in queue.compute_resources if compute_res.max_network_interface_count > 1),
-                queue.compute_resources[0],
-            )
-            self._test_compute_resource(
-                compute_resource=dry_run_compute_resource,
-                use_public_ips=bool(queue.networking.assign_public_ip),
-                ami_id=ami_id,
-                subnet_id=queue_subnet_id,
-                security_groups_ids=queue_security_groups,
-                placement_group=queue_placement_group,
-                tags=tags,
-            )
+            if test_all_compute_resources:
+                compute_resources = queue.compute_resources
+                subnet_ids = queue.networking.subnet_ids
+            else:
+                # Select the "best" compute resource to run dryrun tests against.
+                # Resources with multiple NICs are preferred among others.
+                compute_resources = [
+                    next(
+                        (
+                            compute_res
+                            for compute_res in queue.compute_resources
+                            if compute_res.max_network_interface_count > 1
+                        ),
+                        queue.compute_resources[0],
+                    )
+                ]
+                subnet_ids = queue.networking.subnet_ids[:1]
+
+            launch_requests = {}
+            for compute_resource in compute_resources:
+                for subnet_id in subnet_ids:
+                    launch_request = self._build_compute_resource_launch_request(
+                        compute_resource=compute_resource,
+                        use_public_ips=bool(queue.networking.assign_public_ip),
+                        ami_id=ami_id,
+                        subnet_id=subnet_id,
+                        security_groups_ids=queue_security_groups,
+                        placement_group=queue_placement_group,
+                        tags=tags,
+                    )
+                    # Deduplicate identical launch requests, e.g. compute resources with the same instance type
+                    launch_requests.setdefault(json.dumps(launch_request, sort_keys=True), launch_request)
+            self._test_launch_requests(list(launch_requests.values()))
         except Exception as e:
             self._add_failure(
                 f"Unable to validate configuration parameters for queue {queue.name}. {str(e)}", FailureLevel.ERROR
             )
 
-    def _test_compute_resource(
+    def _test_launch_requests(self, launch_requests):
+        """
+        Execute the dry-run launch requests and collect their failures in the order of the requests.
+
+        Each request is tested by a dedicated validator instance, so that failures can be collected concurrently.
+        """
+        if len(launch_requests) <= 1:
+            for launch_request in launch_requests:
+                self._test_launch_request(launch_request)
+            return
+
+        def _test(launch_request):
+            validator = ComputeResourceLaunchTemplateValidator()
+            validator._test_launch_request(launch_request)
+            return validator._failures
+
+        with ThreadPoolExecutor(max_workers=min(DRYRUN_MAX_WORKERS, len(launch_requests))) as executor:
+            for failures in executor.map(_test, launch_requests):
+                self._failures.extend(failures)
+
+    def _test_launch_request(self, launch_request):
+        """Test Compute Resource Instance Configuration."""
+        subnet_id = launch_request["NetworkInterfaces"][0]["SubnetId"]
+        self._ec2_run_instance(
+            availability_zone=AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id), DryRun=True, **launch_request
+        )
+
+    def _build_compute_resource_launch_request(
         self, compute_resource, use_public_ips, ami_id, subnet_id, security_groups_ids, placement_group, tags
     ):
-        """Test Compute Resource Instance Configuration."""
+        """Build the RunInstances parameters to test the Compute Resource Instance Configuration."""
         compute_cpu_options = (
             {"CoreCount": compute_resource.vcpus, "ThreadsPerCore": 1}
             if compute_resource.disable_simultaneous_multithreading_via_cpu_options
@@ -956,8 +1060,7 @@ class ComputeResourceLaunchTemplateValidator(_LaunchTemplateValidator):
             subnet_id,
             use_public_ips,
         )
-        self._ec2_run_instance(
-            availability_zone=AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id),
+        return dict(
             InstanceType=compute_resource.instance_type,
             MinCount=1,
             MaxCount=1,
@@ -965,7 +1068,6 @@ class ComputeResourceLaunchTemplateValidator(_LaunchTemplateValidator):
             CpuOptions=compute_cpu_options,
             Placement=placement_group,
             NetworkInterfaces=network_interfaces,
-            DryRun=True,
             TagSpecifications=self._generate_tag_specifications(tags),
         )
 
@@ -38,7 +38,18 @@ class ValidationResult:
 
 
 class Validator(ABC):
-    """Abstract validator. The children must implement the validate method."""
+    """
+    Abstract validator. The children must implement the validate method.
+
+    Validators whose result depends on more than their arguments, and that must be executed even when their arguments
+    did not change since the last validation of the configuration, must set is_global to True.
+    Validators whose result depends only on their arguments, or on static data like the instance type details, can set
+    cacheable to True to have their results persisted across commands. Validators checking the live state of resources
+    or the available capacity must not be cached.
+    """
+
+    is_global = False
+    cacheable = False
 
     def __init__(self):
         self._failures = []
@@ -18,6 +18,8 @@ from pcluster.validators.common import FailureLevel, Validator
 class DomainAddrValidator(Validator):
     """Domain address validator."""
 
+    cacheable = True
+
     def _validate(self, domain_addr, additional_sssd_configs):
         """Warn user when ldap is used for the protocol instead of ldaps."""
         domain_addr_scheme = urlparse(domain_addr).scheme
@@ -51,6 +53,8 @@ class DomainAddrValidator(Validator):
 class LdapTlsReqCertValidator(Validator):
     """LDAP TLS require certificate parameter validator."""
 
+    cacheable = True
+
     def _validate(self, ldap_tls_reqcert):
         """Warn user of potentially insecure configurations."""
         values_requiring_cert_validation = ("hard", "demand")
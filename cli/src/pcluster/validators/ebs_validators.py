@@ -44,6 +44,8 @@ class EbsVolumeTypeSizeValidator(Validator):
     The volume sizes of st1 and sc1 range from 500 GiB - 16 TiB(16384 GiB)
     """
 
+    cacheable = True
+
     def _validate(self, volume_type: str, volume_size: int):
         if volume_type in EBS_VOLUME_TYPE_TO_VOLUME_SIZE_BOUNDS:
             min_size, max_size = EBS_VOLUME_TYPE_TO_VOLUME_SIZE_BOUNDS.get(volume_type)
@@ -66,6 +68,8 @@ class EbsVolumeThroughputValidator(Validator):
     Validate gp3 throughput.
     """
 
+    cacheable = True
+
     def _validate(self, volume_type, volume_throughput):
         if volume_type == "gp3":
             min_throughput, max_throughput = 125, 1000
@@ -84,6 +88,8 @@ class EbsVolumeThroughputIopsValidator(Validator):
     Validate gp3 throughput.
     """
 
+    cacheable = True
+
     def _validate(self, volume_type, volume_iops, volume_throughput):
         volume_throughput_to_iops_ratio = 0.25
         if volume_type == "gp3":
@@ -103,6 +109,8 @@ class EbsVolumeIopsValidator(Validator):
     Validate IOPS value in respect of volume type.
     """
 
+    cacheable = True
+
     def _validate(self, volume_type, volume_size, volume_iops):
         if volume_type in EBS_VOLUME_IOPS_BOUNDS:
             min_iops, max_iops = EBS_VOLUME_IOPS_BOUNDS.get(volume_type)
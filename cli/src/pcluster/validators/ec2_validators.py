@@ -21,6 +21,8 @@ class InstanceTypeValidator(Validator):
     Verify the given instance type is a supported one.
     """
 
+    cacheable = True
+
     def _validate(self, instance_type: str):
         if instance_type not in AWSApi.instance().ec2.list_instance_types():
             self._add_failure(f"The instance type '{instance_type}' is not supported.", FailureLevel.ERROR)
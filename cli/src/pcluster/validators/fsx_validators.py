@@ -22,6 +22,8 @@ class FsxS3Validator(Validator):
     Verify compatibility of given S3 options for FSX.
     """
 
+    cacheable = True
+
     def _validate(
         self,
         import_path,
@@ -55,6 +57,8 @@ class FsxPersistentOptionsValidator(Validator):
     Verify compatibility of given persistent options for FSX.
     """
 
+    cacheable = True
+
     def _validate(self, deployment_type, kms_key_id, per_unit_storage_throughput):
         if deployment_type == "PERSISTENT_1":
             if not per_unit_storage_throughput:
@@ -78,6 +82,8 @@ class FsxPersistentOptionsValidator(Validator):
 class FsxBackupOptionsValidator(Validator):
     """FSX backup options validator."""
 
+    cacheable = True
+
     def _validate(
         self,
         automatic_backup_retention_days,
@@ -117,6 +123,8 @@ class FsxBackupOptionsValidator(Validator):
 class FsxStorageTypeOptionsValidator(Validator):
     """FSX storage type options validator."""
 
+    cacheable = True
+
     def _validate(
         self,
         fsx_storage_type,
@@ -155,6 +163,8 @@ class FsxStorageTypeOptionsValidator(Validator):
 class FsxStorageCapacityValidator(Validator):
     """FSX storage capacity validator."""
 
+    cacheable = True
+
     def _validate(
         self,
         storage_capacity,
@@ -33,6 +33,8 @@ class AMIVolumeSizeValidator(Validator):
 class ComponentsValidator(Validator):
     """Components number validator."""
 
+    cacheable = True
+
     def _validate(self, components: list):
         """Validate the number of components is not greater than 15."""
         if components and len(components) > 15:
@@ -46,6 +48,8 @@ class ComponentsValidator(Validator):
 class SecurityGroupsAndSubnetValidator(Validator):
     """Security Groups and Subnet validator."""
 
+    cacheable = True
+
     def _validate(self, security_group_ids: list, subnet_id: str):
         """Validate security groups is required if subnet is specified."""
         if subnet_id:
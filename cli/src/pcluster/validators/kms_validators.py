@@ -31,6 +31,8 @@ class KmsKeyIdEncryptedValidator(Validator):
     Validate KmsKeyId value based on encrypted value.
     """
 
+    cacheable = True
+
     def _validate(self, kms_key_id, encrypted):
         if kms_key_id and not encrypted:
             self._add_failure(
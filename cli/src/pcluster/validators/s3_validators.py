@@ -101,6 +101,9 @@ class S3BucketUriValidator(Validator):
 class S3BucketValidator(Validator):
     """S3 Bucket Validator."""
 
+    # The versioning of the bucket can be changed at any time, and the artifacts of every update are stored in it
+    is_global = True
+
     def _validate(self, bucket):
         try:
             AWSApi.instance().s3.head_bucket(bucket_name=bucket)
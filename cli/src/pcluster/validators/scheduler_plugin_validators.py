@@ -20,6 +20,8 @@ from pcluster.validators.common import FailureLevel, Validator
 class SudoPrivilegesValidator(Validator):
     """Sudo Privileges Validator."""
 
+    cacheable = True
+
     def _validate(self, grant_sudo_privileges: bool, requires_sudo_privileges: bool):
         if requires_sudo_privileges and not grant_sudo_privileges:
             self._add_failure(
@@ -32,6 +34,8 @@ class SudoPrivilegesValidator(Validator):
 class SchedulerPluginOsArchitectureValidator(Validator):
     """Verify that head node architecture and os combination is supported by the scheduler plugin."""
 
+    cacheable = True
+
     def _validate(self, os, architecture: str, supported_x86, supported_arm64):
         oss_and_supported_architectures_mapping = {"x86_64": supported_x86, "arm64": supported_arm64}
         supported_oss = oss_and_supported_architectures_mapping.get(architecture)
@@ -47,6 +51,8 @@ class SchedulerPluginOsArchitectureValidator(Validator):
 class SchedulerPluginRegionValidator(Validator):
     """Verify that the region is supported by the scheduler plugin."""
 
+    cacheable = True
+
     def _validate(self, region, supported_regions):
         if supported_regions and region not in supported_regions:
             self._add_failure(
@@ -64,6 +70,8 @@ class SupportedVersionsValidator(Validator):
     Example: "3.0.0, 3.0.1" or ">=3.1.0, <=3.1.0"
     """
 
+    cacheable = True
+
     def _validate(self, installed_version, supported_versions_string):
         if supported_versions_string:
             supported_versions_list = [version.strip() for version in supported_versions_string.split(",")]
@@ -29,12 +29,36 @@ def clear_env():
         del os.environ["AWS_DEFAULT_REGION"]
 
 
+@pytest.fixture(autouse=True)
+def cli_model_cache_file(tmp_path_factory, monkeypatch):
+    """Store the serialized CLI command model in a temporary directory shared by the tests of the session."""
+    cache_file = tmp_path_factory.getbasetemp() / "cli-model.json"
+    monkeypatch.setenv("PCLUSTER_CLI_MODEL_CACHE_FILE", str(cache_file))
+    return cache_file
+
+
+@pytest.fixture(autouse=True)
+def reset_node_js_check():
+    """Reset the cached result of the Node.js check to remove dependencies between tests."""
+    from pcluster.api.util import assert_valid_node_js
+
+    assert_valid_node_js.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_cluster_descriptions():
+    """Remove the cluster descriptions cached by previous tests, which may have used different mocked AWS responses."""
+    from pcluster.api.controllers.common import _cluster_descriptions
+
+    _cluster_descriptions.clear()
+
+
 @pytest.fixture(autouse=True)
 def reset_aws_api():
     """Reset AWSApi singleton to remove dependencies between tests."""
     from pcluster.aws.aws_api import AWSApi
 
-    AWSApi._instance = None
+    AWSApi.reset()
 
 
 @pytest.fixture
@@ -92,6 +116,7 @@ def boto3_stubber(mocker, boto3_stubber_path):
     # use **kwargs to skip parameters passed to the boto3.client other than the "service"
     # e.g. boto3.client("ec2", region_name=region, ...) --> x = ec2
     mocked_client_factory.client.side_effect = lambda x, **kwargs: mocked_clients[x]
+    mocked_client_factory.session.Session.return_value.client.side_effect = lambda x, **kwargs: mocked_clients[x]
 
     def _boto3_stubber(service, mocked_requests):
         if "AWS_DEFAULT_REGION" not in os.environ:
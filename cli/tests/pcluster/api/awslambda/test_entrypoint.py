@@ -5,7 +5,9 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import importlib
 import json
+import os
 
 import pytest
 from assertpy import assert_that
@@ -96,3 +98,23 @@ def test_lambda_handler(apigw_event, lambda_context, mocker):
 
     assert_that(ret["statusCode"]).is_equal_to(200)
     assert_that(data).contains_key("clusters")
+
+
+def test_lambda_init_phase(set_env, mocker):
+    from pcluster.api.awslambda import entrypoint
+
+    flask_app_mock = mocker.patch("pcluster.api.flask_app.ParallelClusterFlaskApp")
+    flask_app_mock.return_value.init_phases = {"load_spec": 0.1}
+    try:
+        set_env("AWS_LAMBDA_FUNCTION_NAME", "test")
+        importlib.reload(entrypoint)
+        # The Flask application is built when the module is loaded, before any request
+        assert_that(entrypoint.pcluster_api).is_same_as(flask_app_mock.return_value)
+
+        set_env("PCLUSTER_API_EAGER_INIT", "false")
+        importlib.reload(entrypoint)
+        assert_that(entrypoint.pcluster_api).is_none()
+    finally:
+        mocker.stopall()
+        del os.environ["AWS_LAMBDA_FUNCTION_NAME"]
+        importlib.reload(entrypoint)
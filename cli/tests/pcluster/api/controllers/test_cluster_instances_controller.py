@@ -215,12 +215,12 @@ class TestDeleteClusterInstances:
                 side_effect=StackNotFoundError(function_name="describestack", stack_name="stack_name"),
             )
         instance_ids = ["fakeinstanceid1", "fakeinstanceid2"]
-        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=instance_ids)
+        mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instance_ids", return_value=instance_ids)
         terminate_instance_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances")
         response = self._send_test_request(client, force=force)
         with soft_assertions():
             assert_that(response.status_code).is_equal_to(202)
-            terminate_instance_mock.assert_called_with(tuple(instance_ids))
+            terminate_instance_mock.assert_called_with(instance_ids)
 
     @pytest.mark.parametrize(
         "stack_param, force, expected_response",
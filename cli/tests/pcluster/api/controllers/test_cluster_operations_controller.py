@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import threading
 from datetime import datetime
 
 import pytest
@@ -13,7 +14,7 @@ from assertpy import assert_that, soft_assertions
 from marshmallow.exceptions import ValidationError
 
 from pcluster.api.controllers.cluster_operations_controller import _cluster_update_change_succeded
-from pcluster.api.controllers.common import get_validator_suppressors
+from pcluster.api.controllers.common import get_validator_suppressors, invalidate_cluster_description
 from pcluster.api.models import CloudFormationStackStatus
 from pcluster.api.models.cluster_status import ClusterStatus
 from pcluster.api.models.validation_level import ValidationLevel
@@ -752,6 +753,38 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(400)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_concurrent_lookups_and_cache(self, mocker, client):
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack", return_value=cfn_describe_stack_mock_response()
+        )
+        # The lookups following the stack description must all be in progress at the same time
+        all_lookups_started = threading.Barrier(3, timeout=10)
+
+        def _lookup(value):
+            def _wait(*_):
+                all_lookups_started.wait()
+                return value
+
+            return _wait
+
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", side_effect=_lookup(([], "")))
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = _lookup(ComputeFleetStatus.RUNNING)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).side_effect = _lookup("presigned-url")
+
+        responses = [self._send_test_request(client) for _ in range(2)]
+        # Responses are cached until the cluster is changed by another operation
+        invalidate_cluster_description("clustername")
+        responses.append(self._send_test_request(client))
+
+        assert_that([response.status_code for response in responses]).is_equal_to([200, 200, 200])
+        assert_that(responses[1].get_json()).is_equal_to(responses[0].get_json())
+        assert_that(responses[0].get_json()["clusterConfiguration"]).is_equal_to({"url": "presigned-url"})
+        assert_that(describe_stack_mock.call_count).is_equal_to(2)
+
     def test_cluster_not_found(self, client, mocker):
         mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=StackNotFoundError("func", "stack"))
 
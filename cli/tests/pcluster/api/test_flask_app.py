@@ -13,7 +13,7 @@ from connexion.exceptions import BadRequestProblem
 from werkzeug.exceptions import InternalServerError, MethodNotAllowed
 
 from pcluster.api.errors import BadRequestException, InternalServiceException
-from pcluster.api.flask_app import ParallelClusterFlaskApp
+from pcluster.api.flask_app import ParallelClusterFlaskApp, load_openapi_spec
 from pcluster.aws.common import AWSClientError
 
 
@@ -52,6 +52,16 @@ class TestParallelClusterFlaskApp:
         else:
             assert_that(caplog.records[1].exc_info).is_false()
 
+    def test_init_phases(self):
+        app = ParallelClusterFlaskApp()
+        assert_that(app.init_phases).contains_only("node_js_check", "load_spec", "add_api")
+        assert_that(app.flask_app.url_map.bind("").match("/v3/clusters", method="GET")).is_not_none()
+
+    def test_load_openapi_spec(self):
+        spec = load_openapi_spec()
+        assert_that(spec).contains_key("openapi", "paths", "components")
+        assert_that(spec["paths"]).contains_key("/v3/clusters")
+
     def test_handle_http_exception(self, caplog, flask_app_with_error_route):
         with flask_app_with_error_route(MethodNotAllowed()).test_client() as client:
             response = client.get("/error")
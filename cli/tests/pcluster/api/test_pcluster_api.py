@@ -0,0 +1,55 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+from assertpy import assert_that
+
+from pcluster.api.pcluster_api import InventoryInfo, PclusterApi
+from pcluster.aws.common import AWSClientError, get_region
+
+REGIONS = ["eu-west-1", "us-west-2", "us-east-1"]
+
+
+def _list_region_resources(resources_by_region):
+    """Return a function listing the resources of the region targeted by the current thread."""
+
+    def _list_resources(*_):
+        region = get_region()
+        if region == "us-west-2":
+            raise AWSClientError("describe_stacks", "Access denied")
+        return resources_by_region[region]
+
+    return _list_resources
+
+
+def test_list_clusters_in_regions(mocker):
+    stacks = {
+        region: [{"StackName": f"cluster{index}-{region}", "StackStatus": "CREATE_COMPLETE"} for index in range(2)]
+        for region in REGIONS
+    }
+    mocker.patch("pcluster.api.pcluster_api.list_cluster_stacks", side_effect=_list_region_resources(stacks))
+
+    inventory = PclusterApi.list_clusters_in_regions(REGIONS + ["eu-west-1"])
+
+    # Clusters are merged following the order of the regions, each one reporting the region it was listed in
+    assert_that(inventory).is_instance_of(InventoryInfo)
+    assert_that([(cluster.name, cluster.region) for cluster in inventory.items]).is_equal_to(
+        [(f"cluster{index}-{region}", region) for region in ["eu-west-1", "us-east-1"] for index in range(2)]
+    )
+    assert_that(inventory.failures).is_equal_to({"us-west-2": "Access denied"})
+
+
+def test_list_images_in_regions(mocker):
+    mocker.patch("pcluster.api.pcluster_api.list_imagebuilder_stacks", return_value=[])
+    mocker.patch(
+        "pcluster.api.pcluster_api.PclusterApi._get_images_info",
+        side_effect=_list_region_resources({region: [f"image-{region}"] for region in REGIONS}),
+    )
+
+    inventory = PclusterApi.list_images_in_regions(REGIONS)
+
+    assert_that(inventory.items).is_equal_to(["image-eu-west-1", "image-us-east-1"])
+    assert_that(inventory.failures).is_equal_to({"us-west-2": "Access denied"})
@@ -42,3 +42,19 @@ class TestParallelClusterApiUtil:
                 check_output_mock.assert_called_once_with(
                     (["node", "--version"]), stderr=subprocess.STDOUT, encoding="utf-8", shell=False
                 )
+
+
+def test_assert_valid_node_js_is_cached(mocker):
+    which_mock = mocker.patch("pcluster.api.util.shutil.which", return_value=None)
+    check_output_mock = mocker.patch("pcluster.api.util.subprocess.check_output", return_value="14.0.0")
+
+    # Failures are not cached
+    for _ in range(2):
+        with pytest.raises(Exception, match="Unable to find node executable"):
+            util.assert_valid_node_js()
+    assert_that(which_mock.call_count).is_equal_to(2)
+
+    which_mock.return_value = "/usr/bin/node"
+    util.assert_valid_node_js()
+    util.assert_valid_node_js()
+    assert_that(check_output_mock.call_count).is_equal_to(1)
@@ -105,6 +105,9 @@ class _DummyEc2Client(Ec2Client):
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
 
+    def get_instance_types_info(self, instance_types):
+        return {instance_type: self.get_instance_type_info(instance_type) for instance_type in instance_types}
+
     def describe_subnets(self, subnet_ids):
         return [
             {
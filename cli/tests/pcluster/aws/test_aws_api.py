@@ -12,10 +12,13 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import os
+
 import pytest
 from assertpy import assert_that
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, RetryPolicy, StackNotFoundError
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -70,7 +73,7 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     def describe_stack_resources(client):
         client.describe_stack_resources(StackName=FAKE_NAME)
 
-    sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
     mocked_requests = [
         MockedBoto3Request(
             method="describe_stack_resources",
@@ -90,4 +93,23 @@ def test_retry_on_boto3_throttling(boto3_stubber, mocker):
     ]
     client = boto3_stubber("cloudformation", mocked_requests)
     describe_stack_resources(client)
-    sleep_mock.assert_called_with(5)
+    sleep_mock.assert_called()
+    assert_that(sleep_mock.call_args.args[0]).is_less_than_or_equal_to(RetryPolicy.MAX_BACKOFF)
+
+
+def test_aws_api_instance(set_env):
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    instance = AWSApi.instance()
+    cfn = instance.cfn
+    assert_that(AWSApi.instance()).is_same_as(instance)
+    assert_that(instance.aws_region).is_equal_to("eu-west-1")
+
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    other_region_instance = AWSApi.instance()
+    assert_that(other_region_instance).is_not_same_as(instance)
+    assert_that(other_region_instance.aws_region).is_equal_to(os.environ["AWS_DEFAULT_REGION"])
+
+    # Instance and client wrappers are reused when switching back to a region
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    assert_that(AWSApi.instance()).is_same_as(instance)
+    assert_that(AWSApi.instance().cfn).is_same_as(cfn)
@@ -12,7 +12,7 @@ from assertpy import assert_that
 
 from pcluster import utils as utils
 from pcluster.aws.cfn import CfnClient
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, RetryPolicy
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
 
@@ -22,7 +22,158 @@ def boto3_stubber_path():
     return "pcluster.aws.common.boto3"
 
 
+def _tagging_access_denied_request(tag):
+    return MockedBoto3Request(
+        method="get_resources",
+        response="User is not authorized to perform: tag:GetResources",
+        expected_params={
+            "TagFilters": [{"Key": tag}],
+            "ResourceTypeFilters": ["cloudformation:stack"],
+            "ResourcesPerPage": 100,
+        },
+        generate_error=True,
+        error_code="AccessDeniedException",
+    )
+
+
+def _stack_summary(name, stack_id, **kwargs):
+    return {
+        "StackId": stack_id,
+        "StackName": name,
+        "CreationTime": datetime.now(),
+        "StackStatus": "CREATE_IN_PROGRESS",
+        **kwargs,
+    }
+
+
 class TestCfnClient:
+    @pytest.mark.parametrize("next_token", [None, "tagging_token"])
+    def test_list_pcluster_stacks_by_tag(self, set_env, boto3_stubber, mocker, next_token):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch.object(CfnClient, "DESCRIBE_STACKS_MAX_WORKERS", 1)
+        expected_get_resources_params = {
+            "TagFilters": [{"Key": "parallelcluster:version"}],
+            "ResourceTypeFilters": ["cloudformation:stack"],
+            "ResourcesPerPage": 100,
+        }
+        if next_token:
+            expected_get_resources_params["PaginationToken"] = next_token
+        stacks = {
+            "cluster": {"Tags": [{"Key": "parallelcluster:version", "Value": "3.1.0"}]},
+            "nested": {"Tags": [{"Key": "parallelcluster:version", "Value": "3.1.0"}], "ParentId": "cluster"},
+            "image": {
+                "Tags": [
+                    {"Key": "parallelcluster:version", "Value": "3.1.0"},
+                    {"Key": "parallelcluster:image_id", "Value": "image"},
+                ]
+            },
+            "deleted": {
+                "Tags": [{"Key": "parallelcluster:version", "Value": "3.1.0"}],
+                "StackStatus": "DELETE_COMPLETE",
+            },
+        }
+        stack_names = list(stacks) + ["missing"]
+        stack_arns = [f"arn:aws:cloudformation:us-east-1:123:stack/{name}/id" for name in stack_names]
+        boto3_stubber(
+            "resourcegroupstaggingapi",
+            MockedBoto3Request(
+                method="get_resources",
+                response={
+                    "ResourceTagMappingList": [{"ResourceARN": arn} for arn in stack_arns],
+                    "PaginationToken": "next_tagging_token",
+                },
+                expected_params=expected_get_resources_params,
+            ),
+        )
+        cfn_requests = []
+        expected_stacks = ["cluster"]
+        if not next_token:
+            # The stacks being created, possibly missing from the Tagging API results, are merged into the first page
+            new_stack_arn = "arn:aws:cloudformation:us-east-1:123:stack/new/id"
+            cfn_requests.append(
+                MockedBoto3Request(
+                    method="list_stacks",
+                    response={
+                        "StackSummaries": [
+                            _stack_summary("cluster", stack_arns[0]),
+                            _stack_summary("new", new_stack_arn),
+                            _stack_summary("nested-new", "nested-new-arn", ParentId="new"),
+                        ]
+                    },
+                    expected_params={"StackStatusFilter": ["CREATE_IN_PROGRESS"]},
+                )
+            )
+            stacks["new"] = {"Tags": [{"Key": "parallelcluster:version", "Value": "3.1.0"}]}
+            stack_names.append("new")
+            stack_arns.append(new_stack_arn)
+            expected_stacks.append("new")
+        for name, arn in zip(stack_names, stack_arns):
+            if name == "missing":
+                cfn_requests.append(
+                    MockedBoto3Request(
+                        method="describe_stacks",
+                        response="Stack with id missing does not exist",
+                        expected_params={"StackName": arn},
+                        generate_error=True,
+                        error_code="ValidationError",
+                    )
+                )
+            else:
+                cfn_requests.append(
+                    MockedBoto3Request(
+                        method="describe_stacks",
+                        response={
+                            "Stacks": [
+                                {
+                                    "StackName": name,
+                                    "CreationTime": datetime.now(),
+                                    "StackStatus": "CREATE_COMPLETE",
+                                    **stacks[name],
+                                }
+                            ]
+                        },
+                        expected_params={"StackName": arn},
+                    )
+                )
+        boto3_stubber("cloudformation", cfn_requests)
+
+        stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(expected_stacks)
+        assert_that(next_token).is_equal_to("next_tagging_token")
+
+    @pytest.mark.parametrize(
+        "error_code, expected_fallback", [("AccessDeniedException", True), ("ThrottlingException", False)]
+    )
+    def test_list_pcluster_stacks_tagging_api_errors(self, set_env, boto3_stubber, error_code, expected_fallback):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        set_env("PCLUSTER_AWS_MAX_ATTEMPTS", "1")
+        boto3_stubber(
+            "resourcegroupstaggingapi",
+            MockedBoto3Request(
+                method="get_resources",
+                response="error",
+                expected_params={
+                    "TagFilters": [{"Key": "parallelcluster:version"}],
+                    "ResourceTypeFilters": ["cloudformation:stack"],
+                    "ResourcesPerPage": 100,
+                },
+                generate_error=True,
+                error_code=error_code,
+            ),
+        )
+        if expected_fallback:
+            boto3_stubber(
+                "cloudformation",
+                MockedBoto3Request(method="describe_stacks", response={"Stacks": []}, expected_params={}),
+            )
+            assert_that(CfnClient().list_pcluster_stacks()).is_equal_to(([], None))
+        else:
+            boto3_stubber("cloudformation", [])
+            # Transient errors, e.g. throttling, are raised instead of falling back to describing all the stacks
+            with pytest.raises(AWSClientError) as e:
+                CfnClient().list_pcluster_stacks()
+            assert_that(e.value.error_code).is_equal_to(error_code)
+
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
         [
@@ -88,10 +239,19 @@ class TestCfnClient:
             )
         ]
         boto3_stubber("cloudformation", mocked_requests)
+        if next_token:
+            # Stacks listed through describe_stacks are paginated by prefixed tokens
+            next_token = CfnClient.DESCRIBE_STACKS_TOKEN_PREFIX + next_token
+        else:
+            # Stacks are listed through describe_stacks when the Tagging API is not available
+            boto3_stubber("resourcegroupstaggingapi", _tagging_access_denied_request("parallelcluster:version"))
 
         if not generate_error:
             stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
+            expected_next_token = describe_stacks_response.get("NextToken")
+            assert_that(next_token).is_equal_to(
+                CfnClient.DESCRIBE_STACKS_TOKEN_PREFIX + expected_next_token if expected_next_token else None
+            )
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
@@ -117,7 +277,8 @@ class TestCfnClient:
         ]
         boto3_stubber("cloudformation", mocked_requests)
         assert_that(CfnClient().get_stack_events(FAKE_NAME)["StackEvents"]).is_equal_to(expected_events)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called()
+        assert_that(sleep_mock.call_args.args[0]).is_less_than_or_equal_to(RetryPolicy.MAX_BACKOFF)
 
     def test_get_stack_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
@@ -139,14 +300,21 @@ class TestCfnClient:
         boto3_stubber("cloudformation", mocked_requests)
         stack = CfnClient().describe_stack(FAKE_NAME)
         assert_that(stack).is_equal_to(expected_stack)
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called()
+        assert_that(sleep_mock.call_args.args[0]).is_less_than_or_equal_to(RetryPolicy.MAX_BACKOFF)
 
     def test_verify_stack_status_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         mocker.patch(
             "pcluster.aws.cfn.CfnClient.describe_stack",
-            side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_FAILED"}],
+            return_value={"StackStatus": "CREATE_IN_PROGRESS"},
         )
+        failure_event = {
+            **_generate_stack_event(),
+            "EventId": "failure",
+            "LogicalResourceId": FAKE_NAME,
+            "ResourceStatus": "CREATE_FAILED",
+        }
         mocked_requests = [
             MockedBoto3Request(
                 method="describe_stack_events",
@@ -160,11 +328,17 @@ class TestCfnClient:
                 response={"StackEvents": [_generate_stack_event()]},
                 expected_params={"StackName": FAKE_NAME},
             ),
+            MockedBoto3Request(
+                method="describe_stack_events",
+                response={"StackEvents": [failure_event, _generate_stack_event()]},
+                expected_params={"StackName": FAKE_NAME},
+            ),
         ]
         boto3_stubber("cloudformation", mocked_requests)
         verified = utils.verify_stack_status(FAKE_NAME, ["CREATE_IN_PROGRESS"], "CREATE_COMPLETE")
         assert_that(verified).is_false()
-        sleep_mock.assert_called_with(5)
+        sleep_mock.assert_called()
+        assert_that(sleep_mock.call_args.args[0]).is_less_than_or_equal_to(RetryPolicy.MAX_BACKOFF)
 
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -233,10 +407,19 @@ class TestCfnClient:
             )
         ]
         boto3_stubber("cloudformation", mocked_requests)
+        if next_token:
+            # Stacks listed through describe_stacks are paginated by prefixed tokens
+            next_token = CfnClient.DESCRIBE_STACKS_TOKEN_PREFIX + next_token
+        else:
+            # Stacks are listed through describe_stacks when the Tagging API is not available
+            boto3_stubber("resourcegroupstaggingapi", _tagging_access_denied_request("parallelcluster:image_id"))
 
         if not generate_error:
             stacks, next_token = CfnClient().get_imagebuilder_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
+            expected_next_token = describe_stacks_response.get("NextToken")
+            assert_that(next_token).is_equal_to(
+                CfnClient.DESCRIBE_STACKS_TOKEN_PREFIX + expected_next_token if expected_next_token else None
+            )
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
@@ -0,0 +1,186 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+
+import boto3
+import pytest
+from assertpy import assert_that
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from pcluster.aws.common import (
+    AWSExceptionHandler,
+    Boto3ClientFactory,
+    LimitExceededError,
+    RetryPolicy,
+    TokenBucket,
+    region_scope,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_policy_stats():
+    RetryPolicy.reset_stats()
+
+
+def _throttling_error(code="Throttling", retry_attempts=0):
+    return ClientError(
+        {"Error": {"Code": code, "Message": "Rate exceeded"}, "ResponseMetadata": {"RetryAttempts": retry_attempts}},
+        "DescribeStacks",
+    )
+
+
+@pytest.mark.parametrize(
+    "error_code, max_attempts, expected_calls, expected_error",
+    [
+        ("Throttling", 5, 3, None),
+        ("ThrottlingException", 5, 3, None),
+        ("RequestLimitExceeded", 2, 2, "Rate exceeded"),
+        ("ValidationError", 5, 1, "Rate exceeded"),
+    ],
+)
+def test_retry_on_boto3_throttling(mocker, set_env, error_code, max_attempts, expected_calls, expected_error):
+    set_env("PCLUSTER_AWS_MAX_ATTEMPTS", str(max_attempts))
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    function = mocker.MagicMock(side_effect=[_throttling_error(error_code), _throttling_error(error_code), "result"])
+    function.__name__ = "function"
+    decorated_function = AWSExceptionHandler.retry_on_boto3_throttling(function)
+
+    if expected_error:
+        with pytest.raises(ClientError, match=expected_error):
+            decorated_function()
+    else:
+        assert_that(decorated_function()).is_equal_to("result")
+    assert_that(function.call_count).is_equal_to(expected_calls)
+    assert_that(sleep_mock.call_count).is_equal_to(expected_calls - 1)
+    for call, attempt in zip(sleep_mock.call_args_list, range(1, expected_calls)):
+        assert_that(call.args[0]).is_between(0, RetryPolicy.BACKOFF_BASE * 2 ** (attempt - 1))
+
+
+@pytest.mark.parametrize("retry_attempts, expected_calls", [(4, 1), (2, 2)])
+def test_retry_on_boto3_throttling_after_botocore_retries(mocker, retry_attempts, expected_calls):
+    """Verify that the attempts made by botocore count towards the max attempts of the RetryPolicy."""
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    function = mocker.MagicMock(side_effect=_throttling_error(retry_attempts=retry_attempts))
+    function.__name__ = "function"
+
+    with pytest.raises(ClientError, match="Rate exceeded"):
+        AWSExceptionHandler.retry_on_boto3_throttling(function)()
+    assert_that(function.call_count).is_equal_to(expected_calls)
+    assert_that(sleep_mock.call_count).is_equal_to(expected_calls - 1)
+
+
+def test_backoff_delay_is_bounded():
+    for attempt in range(1, 20):
+        assert_that(RetryPolicy.get_backoff_delay(attempt)).is_between(0, RetryPolicy.MAX_BACKOFF)
+
+
+def test_token_bucket(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
+    mocker.patch("pcluster.aws.common.time.monotonic", return_value=100)
+    bucket = TokenBucket(rate=2)
+
+    # Burst up to capacity, then wait for tokens to be refilled
+    assert_that([bucket.acquire() for _ in range(4)]).is_equal_to([0, 0, 0.5, 1.0])
+    assert_that(sleep_mock.call_count).is_equal_to(2)
+
+
+def test_botocore_config(set_env):
+    set_env("PCLUSTER_AWS_MAX_ATTEMPTS", "7")
+    set_env("PCLUSTER_AWS_RETRY_MODE", "adaptive")
+    config = RetryPolicy.get_botocore_config({"s3": {"addressing_style": "virtual"}})
+    assert_that(config.retries).is_equal_to({"total_max_attempts": 7, "mode": "adaptive"})
+    assert_that(config.s3).is_equal_to({"addressing_style": "virtual"})
+
+
+@pytest.mark.parametrize("max_attempts", ["invalid", "0"])
+def test_invalid_max_attempts(set_env, caplog, max_attempts):
+    set_env("PCLUSTER_AWS_MAX_ATTEMPTS", max_attempts)
+    assert_that(RetryPolicy.get_max_attempts()).is_equal_to(RetryPolicy.DEFAULT_MAX_ATTEMPTS)
+    assert_that(caplog.text).contains("Ignoring invalid value of PCLUSTER_AWS_MAX_ATTEMPTS")
+
+
+def test_retry_policy_stats(mocker, set_env):
+    set_env("PCLUSTER_AWS_MAX_REQUEST_RATE", "10")
+    client = boto3.client("cloudformation", region_name="eu-west-1")
+    RetryPolicy.register(client, "cloudformation")
+    acquire_mock = mocker.patch("pcluster.aws.common.TokenBucket.acquire", return_value=0.1)
+
+    stubber = Stubber(client)
+    stubber.add_response("describe_stacks", {"Stacks": [], "ResponseMetadata": {"RetryAttempts": 2}})
+    stubber.add_client_error("describe_stacks", service_error_code="Throttling", service_message="Rate exceeded")
+    with stubber:
+        client.describe_stacks()
+        with pytest.raises(ClientError):
+            client.describe_stacks()
+    # Requests are sent only when not stubbed: emit the event to verify the rate limiter
+    client.meta.events.emit("before-send.cloudformation.DescribeStacks", request=None)
+
+    acquire_mock.assert_called_once()
+    assert_that(RetryPolicy.stats()["cloudformation/eu-west-1"]).is_equal_to(
+        {
+            "requests": 1,
+            "retries": 2,
+            "throttled_requests": 0,
+            "throttling_errors": 1,
+            "rate_limited_waits": 1,
+            "rate_limited_time": 0.1,
+        }
+    )
+
+
+def test_throttling_is_mapped_to_limit_exceeded():
+    @AWSExceptionHandler.handle_client_exception
+    def _throttled_function():
+        raise _throttling_error()
+
+    with pytest.raises(LimitExceededError, match="Rate exceeded"):
+        _throttled_function()
+
+
+def test_boto3_client_factory(mocker, set_env, caplog):
+    session_mock = mocker.spy(boto3.session, "Session")
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    client = Boto3ClientFactory.get_client("cloudformation")
+    assert_that(Boto3ClientFactory.get_client("cloudformation")).is_same_as(client)
+    assert_that(Boto3ClientFactory.get_client("s3")).is_not_same_as(client)
+    assert_that(
+        Boto3ClientFactory.get_client("cloudformation", botocore_config_kwargs={"max_pool_connections": 1})
+    ).is_not_same_as(client)
+    assert_that(client.meta.config.max_pool_connections).is_equal_to(Boto3ClientFactory.MAX_POOL_CONNECTIONS)
+    assert_that(Boto3ClientFactory.get_resource("s3")).is_not_same_as(Boto3ClientFactory.get_resource("s3"))
+    assert_that(session_mock.call_count).is_equal_to(1)
+
+    # A new session is created when region or credentials change
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    other_region_client = Boto3ClientFactory.get_client("cloudformation")
+    assert_that(other_region_client.meta.region_name).is_equal_to("us-east-1")
+    set_env("AWS_ACCESS_KEY_ID", "other-access-key")
+    set_env("AWS_SECRET_ACCESS_KEY", "other-secret-key")
+    assert_that(Boto3ClientFactory.get_client("cloudformation")).is_not_same_as(other_region_client)
+    assert_that(session_mock.call_count).is_equal_to(3)
+
+    # Calls are logged with the region of the client
+    caplog.set_level(logging.INFO)
+    with Stubber(client) as stubber:
+        stubber.add_response("describe_stacks", {"Stacks": []})
+        client.describe_stacks(StackName="stack")
+    assert_that(caplog.text).contains("region=eu-west-1, service=cloudformation, operation=DescribeStacks")
+
+
+def test_region_scope(set_env):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    with region_scope("eu-west-1"):
+        assert_that(Boto3ClientFactory.get_client("cloudformation").meta.region_name).is_equal_to("eu-west-1")
+        with region_scope("us-west-2"):
+            assert_that(Boto3ClientFactory.session_key()[0]).is_equal_to("us-west-2")
+        assert_that(Boto3ClientFactory.session_key()[0]).is_equal_to("eu-west-1")
+    assert_that(Boto3ClientFactory.get_client("cloudformation").meta.region_name).is_equal_to("us-east-1")
@@ -85,6 +85,71 @@ def test_list_instance_types(boto3_stubber, generate_error):
         assert_that(return_value).is_equal_to(dummy_instance_types)
 
 
+def test_iter_instance_ids(boto3_stubber):
+    """Verify that the errors raised while the pages are retrieved are converted to AWSClientError."""
+    filters = [{"Name": "tag:parallelcluster:cluster-name", "Values": ["cluster"]}]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instances",
+            expected_params={"Filters": filters},
+            response={
+                "Reservations": [{"Instances": [{"InstanceId": "i-1"}, {"InstanceId": "i-2"}]}],
+                "NextToken": "t",
+            },
+        ),
+        MockedBoto3Request(
+            method="describe_instances",
+            expected_params={"Filters": filters, "NextToken": "t"},
+            response="Unauthorized",
+            generate_error=True,
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    instance_ids = Ec2Client().iter_instance_ids(filters)
+
+    assert_that([next(instance_ids), next(instance_ids)]).is_equal_to(["i-1", "i-2"])
+    with pytest.raises(AWSClientError, match="Unauthorized") as error:
+        next(instance_ids)
+    assert_that(error.value.function_name).is_equal_to("iter_instance_ids")
+
+
+def test_get_instance_types_info(boto3_stubber):
+    """Verify that instance types are described in batches and that results are cached."""
+    instance_types = [f"c5.{size}xlarge" for size in range(102)]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            expected_params={"InstanceTypes": [instance_types[0]]},
+            response={"InstanceTypes": [{"InstanceType": instance_types[0]}]},
+        ),
+        MockedBoto3Request(
+            method="describe_instance_types",
+            expected_params={"InstanceTypes": instance_types[1:101]},
+            response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in instance_types[1:101]]},
+        ),
+        MockedBoto3Request(
+            method="describe_instance_types",
+            expected_params={"InstanceTypes": instance_types[101:]},
+            response="Invalid instance type",
+            generate_error=True,
+            error_code="InvalidInstanceType",
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    ec2_client = Ec2Client()
+    ec2_client.additional_instance_types_data = {"custom.type": {"InstanceType": "custom.type"}}
+
+    # Already cached instance types are not described again
+    ec2_client.get_instance_type_info(instance_types[0])
+    result = ec2_client.get_instance_types_info(instance_types + ["custom.type", instance_types[0]])
+
+    assert_that(result).is_length(102)
+    assert_that(result).does_not_contain_key(instance_types[101])
+    assert_that(result["custom.type"].instance_type()).is_equal_to("custom.type")
+    for instance_type in instance_types[:101]:
+        assert_that(ec2_client.get_instance_type_info(instance_type).instance_type()).is_equal_to(instance_type)
+
+
 @pytest.mark.parametrize(
     "instance_type, supported_architectures, error_message",
     [
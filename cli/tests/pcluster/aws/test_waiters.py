@@ -0,0 +1,118 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.waiters import StackWaiter, Waiter, WaiterCancelledError, WaiterTimeoutError
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+STACK_NAME = "cluster"
+STACK_ID = "arn:aws:cloudformation:us-east-1:123456789012:stack/cluster/1"
+
+
+def _stack_event(event_id, status, logical_id=STACK_NAME, resource_type="AWS::CloudFormation::Stack"):
+    return {
+        "EventId": event_id,
+        "LogicalResourceId": logical_id,
+        "ResourceType": resource_type,
+        "ResourceStatus": status,
+    }
+
+
+def test_waiter_adaptive_delay(mocker):
+    sleep_mock = mocker.patch("pcluster.aws.waiters.time.sleep")
+    # (done, progressed) results of the polls
+    poll = mocker.Mock(side_effect=[(False, False)] * 4 + [(False, True)] * 2 + [(True, False)])
+
+    Waiter(min_delay=2, max_delay=10).wait(poll)
+
+    # The delay doubles up to the maximum without progress and is halved when progress is observed
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([4, 8, 10, 10, 5, 2.5])
+
+
+def test_waiter_timeout(mocker):
+    mocker.patch("pcluster.aws.waiters.time.sleep")
+    mocker.patch("pcluster.aws.waiters.time.monotonic", side_effect=[0, 10, 20, 30])
+    poll = mocker.Mock(return_value=(False, False))
+
+    with pytest.raises(WaiterTimeoutError, match="within 25 seconds"):
+        Waiter(min_delay=10, max_delay=10, timeout=25).wait(poll)
+    assert_that(poll.call_count).is_equal_to(3)
+
+
+def test_waiter_cancellation():
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    with pytest.raises(WaiterCancelledError):
+        Waiter(min_delay=10, max_delay=10, cancel_event=cancel_event).wait(lambda: (False, False))
+
+
+def test_stack_waiter(mocker):
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.aws.waiters.time.sleep")
+    describe_stack_mock = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.describe_stack",
+        return_value={"StackId": STACK_ID, "StackName": STACK_NAME, "StackStatus": "UPDATE_IN_PROGRESS"},
+    )
+    old_events = [_stack_event("2", "UPDATE_IN_PROGRESS"), _stack_event("1", "CREATE_COMPLETE")]
+    resource_events = [
+        _stack_event("4", "UPDATE_COMPLETE", "HeadNode", "AWS::EC2::Instance"),
+        _stack_event("3", "UPDATE_IN_PROGRESS", "HeadNode", "AWS::EC2::Instance"),
+    ]
+    get_stack_events_mock = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.get_stack_events",
+        side_effect=[
+            # Events present when the wait starts: only the first page is retrieved
+            {"StackEvents": old_events[:1], "NextToken": "token"},
+            # No new events
+            {"StackEvents": old_events[:1], "NextToken": "token"},
+            # New events spanning two pages
+            {"StackEvents": resource_events[:1], "NextToken": "token1"},
+            {"StackEvents": resource_events[1:] + old_events[:1], "NextToken": "token2"},
+            # Final event of the stack
+            {"StackEvents": [_stack_event("5", "UPDATE_COMPLETE")] + resource_events, "NextToken": "token3"},
+        ],
+    )
+    reported_events = []
+
+    status = StackWaiter(STACK_NAME, on_event=reported_events.append).wait()
+
+    assert_that(status).is_equal_to("UPDATE_COMPLETE")
+    assert_that([event["EventId"] for event in reported_events]).is_equal_to(["2", "3", "4", "5"])
+    # The events are tailed by stack id, so that they are still available after the stack deletion
+    assert_that([call.args for call in get_stack_events_mock.call_args_list]).contains_only((STACK_ID,))
+    assert_that([call.kwargs["next_token"] for call in get_stack_events_mock.call_args_list[2:4]]).is_equal_to(
+        [None, "token1"]
+    )
+    describe_stack_mock.assert_called_once()
+
+
+def test_stack_waiter_status_fallback(mocker):
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.aws.waiters.time.sleep")
+    mocker.patch(
+        "pcluster.aws.cfn.CfnClient.describe_stack",
+        side_effect=[
+            {"StackId": STACK_ID, "StackName": STACK_NAME, "StackStatus": "DELETE_IN_PROGRESS"},
+            StackNotFoundError("describe_stack", STACK_ID),
+        ],
+    )
+    get_stack_events_mock = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.get_stack_events", return_value={"StackEvents": [_stack_event("1", "X")]}
+    )
+
+    # The stack status is described again after three polls without new events
+    assert_that(StackWaiter(STACK_NAME).wait(["DELETE_IN_PROGRESS"])).is_equal_to("DELETE_COMPLETE")
+    assert_that(get_stack_events_mock.call_count).is_equal_to(4)
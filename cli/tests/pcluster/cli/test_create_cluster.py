@@ -100,7 +100,8 @@ class TestCreateClusterCommand:
         describe_cluster_mock = mocker.patch(
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        stack_waiter_mock = mocker.patch("pcluster.aws.waiters.StackWaiter")
+        stack_waiter_mock.return_value.wait.return_value = "CREATE_COMPLETE"
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -119,7 +120,9 @@ class TestCreateClusterCommand:
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(stack_waiter_mock.call_args.args[0]).is_equal_to("cluster")
+        # The stack is never polled more often than by the boto3 CloudFormation waiters
+        assert_that(stack_waiter_mock.call_args.kwargs["min_delay"]).is_greater_than_or_equal_to(30)
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     @pytest.mark.parametrize("cluster_name_arg, region_arg", [("--cluster-name", "--region"), ("-n", "-r")])
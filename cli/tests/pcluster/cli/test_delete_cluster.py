@@ -62,7 +62,8 @@ class TestDeleteClusterCommand:
             autospec=True,
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        stack_waiter_mock = mocker.patch("pcluster.aws.waiters.StackWaiter")
+        stack_waiter_mock.return_value.wait.return_value = "DELETE_COMPLETE"
         mock_aws_api(mocker)
 
         command = ["delete-cluster", "--cluster-name", "cluster", "--wait"]
@@ -72,7 +73,7 @@ class TestDeleteClusterCommand:
         assert_that(delete_cluster_mock.call_args).is_length(2)
         args_expected = {"region": None, "cluster_name": "cluster"}
         delete_cluster_mock.assert_called_with(**args_expected)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(stack_waiter_mock.call_args.args[0]).is_equal_to("cluster")
 
     def test_execute(self, mocker):
         response_dict = {
@@ -0,0 +1,141 @@
+#  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.api.models import ClusterInfoSummary, ImageBuildStatus, ImageInfoSummary
+from pcluster.aws.common import AWSClientError
+from pcluster.cli.entrypoint import run
+
+
+class TestListInventoryCommand:
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            ([], "the following arguments are required: --regions"),
+            (["--regions", "eu-west-"], "Bad Request: invalid or unsupported region 'eu-west-'"),
+            (["--regions", "eu-west-1", "--resource-type", "invalid"], "argument --resource-type: invalid choice"),
+            (["--regions", "eu-west-1", "--cluster-status", "invalid"], "argument --cluster-status: invalid choice"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "list-inventory"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    def test_list_clusters(self, mocker):
+        def _list_region_clusters(region, cluster_status=None):
+            if region == "us-west-2":
+                raise AWSClientError("describe_stacks", "Access denied")
+            return [
+                ClusterInfoSummary(
+                    cluster_name=f"cluster-{region}",
+                    region=region,
+                    version="3.1.0",
+                    cloudformation_stack_arn="arn",
+                    cloudformation_stack_status="CREATE_COMPLETE",
+                    cluster_status="CREATE_COMPLETE",
+                )
+            ]
+
+        list_region_clusters_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.list_region_clusters",
+            side_effect=_list_region_clusters,
+        )
+
+        out = run(
+            [
+                "list-inventory",
+                "--regions",
+                "eu-west-1",
+                "us-west-2",
+                "us-east-1",
+                "--cluster-status",
+                "CREATE_COMPLETE",
+            ]
+        )
+        assert_that(out).is_equal_to(
+            {
+                "clusters": [
+                    {
+                        "clusterName": f"cluster-{region}",
+                        "region": region,
+                        "version": "3.1.0",
+                        "cloudformationStackArn": "arn",
+                        "cloudformationStackStatus": "CREATE_COMPLETE",
+                        "clusterStatus": "CREATE_COMPLETE",
+                    }
+                    for region in ["eu-west-1", "us-east-1"]
+                ],
+                "failures": [{"region": "us-west-2", "message": "Access denied"}],
+            }
+        )
+        list_region_clusters_mock.assert_any_call("eu-west-1", cluster_status=["CREATE_COMPLETE"])
+
+    def test_list_images(self, mocker):
+        list_region_images_mock = mocker.patch(
+            "pcluster.api.controllers.image_operations_controller.list_region_images",
+            side_effect=lambda image_status, region: [
+                ImageInfoSummary(
+                    image_id="image", region=region, version="3.1.0", image_build_status=ImageBuildStatus.BUILD_FAILED
+                )
+            ],
+        )
+
+        out = run(["list-inventory", "--regions", "eu-west-1", "--resource-type", "images", "--image-status", "FAILED"])
+        assert_that(out).is_equal_to(
+            {
+                "images": [
+                    {"imageId": "image", "region": "eu-west-1", "version": "3.1.0", "imageBuildStatus": "BUILD_FAILED"}
+                ],
+                "failures": [],
+            }
+        )
+        list_region_images_mock.assert_called_once_with("FAILED", "eu-west-1")
+
+    @pytest.mark.parametrize("isatty", [True, False])
+    def test_stream_region_results(self, mocker, isatty):
+        def _list_region_images(image_status, region):
+            if region == "us-west-2":
+                raise AWSClientError("describe_stacks", "Access denied")
+            return [ImageInfoSummary(image_id="image", region=region, version="3.1.0", image_build_status=image_status)]
+
+        mocker.patch(
+            "pcluster.api.controllers.image_operations_controller.list_region_images", side_effect=_list_region_images
+        )
+        stderr_mock = mocker.patch("pcluster.cli.commands.inventory.sys.stderr")
+        stderr_mock.isatty.return_value = isatty
+
+        out = run(["list-inventory", "--regions", "eu-west-1", "us-west-2", "--resource-type", "images"])
+
+        # The results of each region are printed as soon as they are listed, the merged output follows
+        streamed_results = sorted(
+            (json.loads(call.args[0]) for call in stderr_mock.write.call_args_list), key=lambda result: result["region"]
+        )
+        expected_image = {
+            "imageId": "image",
+            "region": "eu-west-1",
+            "version": "3.1.0",
+            "imageBuildStatus": "AVAILABLE",
+        }
+        if isatty:
+            assert_that(streamed_results).is_equal_to(
+                [
+                    {"region": "eu-west-1", "images": [expected_image]},
+                    {"region": "us-west-2", "message": "Access denied"},
+                ]
+            )
+        else:
+            assert_that(streamed_results).is_empty()
+        assert_that(out).is_equal_to(
+            {"images": [expected_image], "failures": [{"region": "us-west-2", "message": "Access denied"}]}
+        )
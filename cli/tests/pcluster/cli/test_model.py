@@ -6,9 +6,12 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+
 import pytest
 from assertpy import assert_that
 
+import pcluster.cli.model
 from pcluster.cli.entrypoint import ParameterException, gen_parser
 
 
@@ -95,3 +98,49 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+    def test_gen_parser_selected_operations(self, identity_dispatch):
+        model = _model([{"body": False, "name": "query-param", "required": False, "type": "string"}])
+        model["other-op"] = {"func": "", "params": [{"body": False, "name": "other-param", "type": "string"}]}
+        parser, parser_map = gen_parser(model, operations=["op"])
+
+        assert_that(parser_map).contains_key("op", "other-op")
+        assert_that(parser_map["op"].format_usage()).contains("--query-param")
+        assert_that(parser_map["other-op"].format_usage()).does_not_contain("--other-param")
+
+
+class TestCliModelCache:
+    @pytest.fixture
+    def cli_model_cache_file(self, tmp_path, set_env):
+        cache_file = tmp_path / "cache" / "cli-model.json"
+        set_env("PCLUSTER_CLI_MODEL_CACHE_FILE", str(cache_file))
+        return cache_file
+
+    def test_load_cli_model(self, mocker, cli_model_cache_file):
+        package_spec_spy = mocker.spy(pcluster.cli.model, "package_spec")
+
+        cli_model = pcluster.cli.model.load_cli_model()
+        assert_that(package_spec_spy.call_count).is_equal_to(1)
+        assert_that(cli_model["operations"]).contains_key("list-clusters", "create-cluster")
+        assert_that([command["name"] for command in cli_model["commands"]]).contains("version", "ssh")
+        assert_that(json.loads(cli_model_cache_file.read_text())).is_equal_to(cli_model)
+
+        # The serialized model is reused while the fingerprint does not change
+        assert_that(pcluster.cli.model.load_cli_model()).is_equal_to(cli_model)
+        assert_that(package_spec_spy.call_count).is_equal_to(1)
+
+        # A new package version invalidates the serialized model
+        mocker.patch("pcluster.cli.model.get_installed_version", return_value="99.0.0")
+        assert_that(pcluster.cli.model.load_cli_model()["fingerprint"]).is_not_equal_to(cli_model["fingerprint"])
+        assert_that(package_spec_spy.call_count).is_equal_to(2)
+
+    def test_load_cli_model_invalid_cache(self, mocker, cli_model_cache_file):
+        cli_model_cache_file.parent.mkdir()
+        cli_model_cache_file.write_text("{invalid")
+        cli_model = pcluster.cli.model.load_cli_model()
+        assert_that(json.loads(cli_model_cache_file.read_text())).is_equal_to(cli_model)
+
+    def test_load_cli_model_cache_disabled(self, mocker, set_env, cli_model_cache_file):
+        set_env("PCLUSTER_CACHE_DISABLED", "true")
+        pcluster.cli.model.load_cli_model()
+        assert_that(cli_model_cache_file.exists()).is_false()
@@ -105,7 +105,8 @@ class TestUpdateClusterCommand:
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        stack_waiter_mock = mocker.patch("pcluster.aws.waiters.StackWaiter")
+        stack_waiter_mock.return_value.wait.return_value = "UPDATE_COMPLETE"
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -125,7 +126,7 @@ class TestUpdateClusterCommand:
             "validation_failure_level": None,
         }
         update_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(stack_waiter_mock.call_args.args[0]).is_equal_to("cluster")
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     def test_execute(self, mocker, test_datadir):
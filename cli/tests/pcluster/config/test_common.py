@@ -8,13 +8,17 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
+import time
 from typing import List
 
 import pytest
 from assertpy import assert_that
 
-from pcluster.config.common import Resource
+from pcluster.aws.common import AWSClientError
+from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor, ValidatorScheduler
 from pcluster.validators.common import FailureLevel, Validator
+from pcluster.validators.iam_validators import IamPolicyValidator
 
 
 class FakeInfoValidator(Validator):
@@ -38,6 +42,21 @@ class FakeComplexValidator(Validator):
         self._add_failure(f"Combination {fake_attribute} - {other_attribute}.", FailureLevel.WARNING)
 
 
+class FakeSlowValidator(Validator):
+    """Dummy validator taking a time inversely proportional to its param, to complete in reverse order."""
+
+    def _validate(self, param: int):
+        time.sleep(0.01 * (5 - param))
+        self._add_failure(f"Slow {param}.", FailureLevel.WARNING)
+
+
+class FakeExceptionValidator(Validator):
+    """Dummy validator raising an exception."""
+
+    def _validate(self):
+        raise Exception("Unexpected failure.")
+
+
 class FakePropertyValidator(Validator):
     """Dummy property validator of info level."""
 
@@ -150,6 +169,177 @@ def test_nested_resource_validate():
     assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value other-value.")
 
 
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_nested_resource_validate_order(max_workers):
+    """Verify that failures are returned in deterministic order regardless of the order validators complete."""
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self):
+            self._register_validator(FakeSlowValidator, param=self.fake_attribute)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, list_of_resources: List[FakeNestedResource]):
+            super().__init__()
+            self.list_of_resources = list_of_resources
+
+        def _register_validators(self):
+            self._register_validator(FakeExceptionValidator)
+            self._register_validator(FakeInfoValidator, param="parent")
+
+    nested_resources = [FakeNestedResource(value) for value in range(5)]
+    fake_resource = FakeParentResource(nested_resources)
+    validation_failures = fake_resource.validate(max_workers=max_workers)
+
+    assert_that(validation_failures).is_length(7)
+    for value in range(5):
+        assert_validation_result(validation_failures[value], FailureLevel.WARNING, f"Slow {value}.")
+        assert_that(nested_resources[value]._validation_failures).is_length(1)
+    assert_validation_result(validation_failures[5], FailureLevel.ERROR, "Unexpected failure.")
+    assert_validation_result(validation_failures[6], FailureLevel.INFO, "Wrong value parent.")
+
+    # Suppressed validators are not executed
+    validation_failures = fake_resource.validate(
+        suppressors=[TypeMatchValidatorsSuppressor({"FakeSlowValidator"})], max_workers=max_workers
+    )
+    assert_that(validation_failures).is_length(2)
+    assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Unexpected failure.")
+    assert_validation_result(validation_failures[1], FailureLevel.INFO, "Wrong value parent.")
+
+
+def test_validator_scheduler_timings():
+    """Verify that the scheduler tracks the execution time of executed validators only."""
+    scheduler = ValidatorScheduler(max_workers=2)
+    results = scheduler.run(
+        [(FakeSlowValidator, {"param": 4}), (FakeSlowValidator, {"param": 3}), (FakeInfoValidator, {"param": "x"})],
+        suppressors=[TypeMatchValidatorsSuppressor({"FakeInfoValidator"})],
+    )
+
+    assert_that(results).is_length(3)
+    assert_that(results[2]).is_empty()
+    assert_that(scheduler.timings).contains_only("FakeSlowValidator")
+    assert_that(scheduler.timings["FakeSlowValidator"]).is_length(2)
+    assert_that(scheduler.timing_report()).contains("FakeSlowValidator: 2,").does_not_contain("FakeInfoValidator")
+
+
+def test_resource_validate_with_baseline():
+    """Verify that only validators with arguments changed with respect to the baseline are executed."""
+
+    class FakeGlobalValidator(FakeInfoValidator):
+        """Dummy validator executed even if its arguments did not change."""
+
+        is_global = True
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self):
+            self._register_validator(FakeErrorValidator, param=self.fake_attribute)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, list_of_resources: List[FakeNestedResource]):
+            super().__init__()
+            self.list_of_resources = list_of_resources
+
+        def _register_validators(self):
+            self._register_validator(FakeComplexValidator, fake_attribute=self.list_of_resources, other_attribute=None)
+            self._register_validator(FakeGlobalValidator, param="global")
+
+    baseline = FakeParentResource([FakeNestedResource("value1"), FakeNestedResource("value2")])
+    baseline.validate()
+    target = FakeParentResource([FakeNestedResource("value1"), FakeNestedResource("value3")])
+    validation_failures = target.validate(baseline=baseline)
+
+    assert_that(validation_failures).is_length(3)
+    assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Error value3.")
+    assert_validation_result(validation_failures[1], FailureLevel.WARNING, "Combination [")
+    assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value global.")
+    # Only global validators are executed when nothing changed
+    assert_that(target.validate(baseline=target)).is_length(1)
+
+
+def test_validator_scheduler_deduplication(mocker):
+    """Verify that validators with the same arguments are executed once."""
+    validate_spy = mocker.spy(FakeInfoValidator, "_validate")
+    scheduler = ValidatorScheduler(max_workers=2)
+    results = scheduler.run(
+        [
+            (FakeInfoValidator, {"param": "x"}),
+            (FakeInfoValidator, {"param": "y"}),
+            (FakeInfoValidator, {"param": "x"}),
+        ]
+    )
+
+    assert_that([[failure.message for failure in failures] for failures in results]).is_equal_to(
+        [["Wrong value x."], ["Wrong value y."], ["Wrong value x."]]
+    )
+    assert_that(validate_spy.call_count).is_equal_to(2)
+    assert_that(scheduler.timings["FakeInfoValidator"]).is_length(2)
+
+
+def test_validator_scheduler_persistent_results(mocker, set_env, tmp_path):
+    """Verify that only the results of cacheable validators are persisted across runs, except for unexpected errors."""
+
+    class FakeCacheableErrorValidator(FakeErrorValidator):
+        """Dummy validator whose results can be persisted."""
+
+        cacheable = True
+
+    class FakeCacheableExceptionValidator(FakeExceptionValidator):
+        """Dummy validator whose results can be persisted."""
+
+        cacheable = True
+
+    set_env("PCLUSTER_PERSISTENT_CACHE", "true")
+    mocker.patch("pcluster.aws.common.PersistentCache.get_scope_dir", return_value=str(tmp_path))
+    validate_spy = mocker.spy(FakeErrorValidator, "_validate")
+    exception_spy = mocker.spy(FakeExceptionValidator, "_validate")
+    validators = [
+        (FakeCacheableErrorValidator, {"param": "x"}),
+        (FakeErrorValidator, {"param": "y"}),
+        (FakeCacheableExceptionValidator, {}),
+    ]
+
+    for _ in range(2):
+        results = ValidatorScheduler().run(validators)
+        assert_validation_result(results[0][0], FailureLevel.ERROR, "Error x.")
+        assert_validation_result(results[1][0], FailureLevel.ERROR, "Error y.")
+        assert_validation_result(results[2][0], FailureLevel.ERROR, "Unexpected failure.")
+
+    # Validators not opting in to the cache are always executed, validators run concurrently within a run
+    assert_that(sorted(call.kwargs["param"] for call in validate_spy.call_args_list)).is_equal_to(["x", "y", "y"])
+    assert_that(exception_spy.call_count).is_equal_to(2)
+
+
+def test_validator_scheduler_live_state_results_not_persisted(mocker, set_env, tmp_path):
+    """Verify that the failures of validators checking the live state of AWS resources are not persisted."""
+    set_env("PCLUSTER_PERSISTENT_CACHE", "true")
+    mocker.patch("pcluster.aws.common.PersistentCache.get_scope_dir", return_value=str(tmp_path))
+    get_policy_mock = mocker.patch(
+        "pcluster.validators.iam_validators.IamClient.get_policy",
+        side_effect=[AWSClientError("get_policy", "Policy not found."), {}],
+    )
+    validators = [(IamPolicyValidator, {"policy": "arn:aws:iam::aws:policy/FakePolicy"})]
+
+    # The policy created after the first validation is found by the second one
+    assert_validation_result(ValidatorScheduler().run(validators)[0][0], FailureLevel.ERROR, "Policy not found.")
+    assert_that(ValidatorScheduler().run(validators)).is_equal_to([[]])
+    assert_that(get_policy_mock.call_count).is_equal_to(2)
+
+
 @pytest.mark.parametrize(
     "value, default, expected_value, expected_implied",
     [
@@ -189,3 +379,50 @@ def test_resource_params(value, default, expected_value, expected_implied):
     assert_that(param).is_not_none()
     assert_that(param.value).is_equal_to("new_value")
     assert_that(param.default).is_equal_to(default)
+
+
+def test_resource_copy():
+    class TestResource(Resource):
+        def __init__(self):
+            super().__init__()
+            self.test_attr = Resource.init_param(value=None, default="default_value")
+            self.nested = [Resource()]
+
+    test_resource = TestResource()
+    resource_copy = copy.copy(test_resource)
+    resource_copy.test_attr = "new_value"
+
+    # Params are not shared with the original resource, nested resources are
+    assert_that(resource_copy.get_param("test_attr").value).is_equal_to("new_value")
+    assert_that(test_resource.test_attr).is_equal_to("default_value")
+    assert_that(test_resource.get_param("test_attr").value).is_equal_to("default_value")
+    assert_that(test_resource.is_implied("test_attr")).is_true()
+    assert_that(resource_copy.nested).is_same_as(test_resource.nested)
+
+
+def test_resource_compact_representation():
+    class TestResource(Resource):
+        def __init__(self, value=None):
+            super().__init__()
+            self.test_attr = Resource.init_param(value=value, default="default_value")
+
+        def _register_validators(self):
+            self._register_validator(FakeErrorValidator, param=self.test_attr)
+
+    class TestParentResource(Resource):
+        def __init__(self):
+            super().__init__()
+            self.nested = [TestResource("value1"), TestResource()]
+
+    test_resource = TestParentResource()
+    # Params have no instance dict, registry and validators lists are only allocated when needed
+    assert_that(hasattr(test_resource.nested[0].get_param("test_attr"), "__dict__")).is_false()
+    assert_that(vars(test_resource)).does_not_contain_key("_Resource__params", "_validators", "_validation_failures")
+    assert_that(vars(test_resource.nested[0])).does_not_contain_key("_validators", "_validation_failures")
+
+    validation_failures = test_resource.validate()
+    assert_that(validation_failures).is_length(2)
+    assert_that(test_resource.nested[1]._validation_failures).is_length(1)
+    # Validators are released after validation
+    assert_that(vars(test_resource.nested[0])).does_not_contain_key("_validators")
+    assert_that(test_resource.validate()).is_length(2)
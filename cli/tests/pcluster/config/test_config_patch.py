@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
 import shutil
 
@@ -550,3 +551,60 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def test_large_queue_list_changes():
+    def _queues(count):
+        return [
+            {
+                "Name": f"queue{queue}",
+                "ComputeResources": [
+                    {"Name": f"cr{resource}", "InstanceType": "c5.xlarge", "MaxCount": 10} for resource in range(count)
+                ],
+            }
+            for queue in range(count)
+        ]
+
+    base_conf = {"Scheduling": {"Scheduler": "slurm", "SlurmQueues": _queues(50)}}
+    target_conf = {"Scheduling": {"Scheduler": "slurm", "SlurmQueues": list(reversed(_queues(50)))}}
+    target_conf["Scheduling"]["SlurmQueues"][0]["ComputeResources"][10]["MaxCount"] = 20
+    target_conf["Scheduling"]["SlurmQueues"].pop()
+    base_snapshot, target_snapshot = copy.deepcopy(base_conf), copy.deepcopy(target_conf)
+
+    patch = ConfigPatch(dummy_cluster(), base_config=base_conf, target_config=target_conf)
+
+    # Reordered items are matched by their update key, and the input configurations are not modified
+    assert_that(patch.changes).is_length(2)
+    assert_that(patch.changes[0].path).is_equal_to(["Scheduling", "SlurmQueues[queue49]", "ComputeResources[cr10]"])
+    assert_that(patch.changes[0][1:4]).is_equal_to(("MaxCount", 10, 20))
+    assert_that(patch.changes[1].path).is_equal_to(["Scheduling"])
+    assert_that(patch.changes[1][1:4]).is_equal_to(("SlurmQueues", base_conf["Scheduling"]["SlurmQueues"][0], None))
+    assert_that(patch.changes[1].is_list).is_true()
+    assert_that(base_conf).is_equal_to(base_snapshot)
+    assert_that(target_conf).is_equal_to(target_snapshot)
+
+
+def test_patch_check_uses_cluster_state_snapshot(mocker):
+    cluster = dummy_cluster()
+    has_running_capacity_mock = mocker.patch.object(cluster, "has_running_capacity", return_value=False)
+    get_running_capacity_mock = mocker.patch.object(cluster, "get_running_capacity", return_value=5)
+    head_node_instance_mock = mocker.patch(
+        "pcluster.models.cluster.Cluster.head_node_instance", new_callable=mocker.PropertyMock
+    )
+    head_node_instance_mock.return_value.state = "running"
+
+    patch = ConfigPatch(cluster, base_config={}, target_config={})
+    patch.changes = [
+        Change(["HeadNode"], "InstanceType", "t2.micro", "c5.xlarge", UpdatePolicy.HEAD_NODE_STOP, is_list=False),
+        Change(["HeadNode", "Ssh"], "KeyName", "key1", "key2", UpdatePolicy.HEAD_NODE_STOP, is_list=False),
+        Change(["Scheduling"], "SlurmQueues", None, {"Name": "q"}, UpdatePolicy.COMPUTE_FLEET_STOP, is_list=True),
+        Change(["Scheduling"], "SlurmQueues", {"Name": "q1"}, None, UpdatePolicy.COMPUTE_FLEET_STOP, is_list=True),
+    ]
+    patch_allowed, rows = patch.check()
+
+    # Each cluster state value is retrieved once, and only if required by the policies in the patch
+    assert_that(patch_allowed).is_false()
+    assert_that([row[4] for row in rows[1:]]).is_equal_to(["ACTION NEEDED"] * 2 + ["SUCCEEDED"] * 2)
+    head_node_instance_mock.assert_called_once()
+    has_running_capacity_mock.assert_called_once()
+    get_running_capacity_mock.assert_not_called()
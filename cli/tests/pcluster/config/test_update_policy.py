@@ -11,6 +11,7 @@
 import pytest
 from assertpy import assert_that
 
+from pcluster.config.config_patch import ClusterStateSnapshot
 from pcluster.config.update_policy import UpdatePolicy
 from tests.pcluster.test_utils import dummy_cluster
 
@@ -36,6 +37,7 @@ def test_max_count_policy(mocker, is_fleet_stopped, old_max, new_max, expected_r
 
     patch_mock = mocker.MagicMock()
     patch_mock.cluster = cluster
+    patch_mock.cluster_state = ClusterStateSnapshot(cluster)
     change_mock = mocker.MagicMock()
     change_mock.new_value = new_max
     change_mock.old_value = old_max
@@ -22,7 +22,7 @@ from dateutil import tz
 from pcluster.api.models import ClusterStatus
 from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import Tag
-from pcluster.config.common import AllValidatorsSuppressor
+from pcluster.config.common import AllValidatorsSuppressor, ValidatorScheduler
 from pcluster.constants import PCLUSTER_CLUSTER_NAME_TAG, PCLUSTER_S3_ARTIFACTS_DICT
 from pcluster.models.cluster import BadRequestClusterActionError, Cluster, ClusterActionError, NodeType
 from pcluster.models.cluster_resources import ClusterStack
@@ -121,6 +121,28 @@ class TestCluster:
             all([source["Value"] == target["Value"] for source, target in zip(cfn_tags, expected_cfn_tags)])
         ).is_true()
 
+    def test_config_dump(self, cluster, mocker):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.get_installed_version", return_value="FakeInstalledVersion")
+        cluster.config = dummy_slurm_cluster_config(mocker)
+        dump_spy = mocker.spy(cluster.schema, "dump")
+
+        config_dump = cluster.config_dump
+        assert_that(cluster.config_dump).is_same_as(config_dump)
+        assert_that(dump_spy.call_count).is_equal_to(1)
+        # The serialization does not change the config
+        assert_that(cluster.schema.dump(cluster.config)).is_equal_to(config_dump)
+
+        # The config is serialized again when its tags change
+        cluster._add_version_tag()
+        assert_that(cluster.config_dump["Tags"]).contains(
+            {"Key": "parallelcluster:version", "Value": "FakeInstalledVersion"}
+        )
+
+        cluster.config = dummy_slurm_cluster_config(mocker)
+        assert_that(cluster.config_dump).is_not_same_as(config_dump)
+        assert_that(dump_spy.call_count).is_equal_to(4)
+
     @staticmethod
     def _sort_tags(tags):
         return sorted(tags, key=lambda tag: tag.key)
@@ -132,46 +154,50 @@ class TestCluster:
     @pytest.mark.parametrize(
         "stack_statuses",
         [
-            [
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_COMPLETE",
-                "UPDATE_COMPLETE",
-            ],
-            [
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "anything other than UPDATE_IN_PROGRESS",
-                "anything other than UPDATE_IN_PROGRESS",
-            ],
-            [
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_IN_PROGRESS",
-                "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS",
-                "UPDATE_COMPLETE",
-            ],
-            ["UPDATE_COMPLETE", "UPDATE_COMPLETE"],
+            ["UPDATE_IN_PROGRESS", "UPDATE_IN_PROGRESS", "UPDATE_COMPLETE"],
+            ["UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS", "UPDATE_COMPLETE"],
+            ["UPDATE_IN_PROGRESS", "UPDATE_ROLLBACK_IN_PROGRESS"],
+            ["UPDATE_COMPLETE"],
         ],
     )
     def test_wait_for_stack_update(self, cluster, mocker, stack_statuses):
         """
         Verify that _wait_for_stack_update behaves as expected.
 
-        _wait_for_stack_update should call updated_status until the StackStatus is anything besides UPDATE_IN_PROGRESS
-        and UPDATE_COMPLETE_CLEANUP_IN_PROGRESS.
-        use that to get expected call count for updated_status
+        _wait_for_stack_update should tail the stack events until the stack reaches a status other than
+        UPDATE_IN_PROGRESS and UPDATE_COMPLETE_CLEANUP_IN_PROGRESS, describing the stack only once.
         """
-        expected_call_count = len(stack_statuses)
-        updated_status_mock = mocker.patch.object(cluster, "_get_updated_stack_status", side_effect=stack_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.waiters.time.sleep")  # so we don't actually have to wait
+        describe_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value={
+                "StackId": cluster.stack_name,
+                "StackName": cluster.stack_name,
+                "StackStatus": stack_statuses[0],
+            },
+        )
+        # Every poll finds a new event of the stack, the most recent event first
+        stack_events = [
+            {
+                "StackEvents": [
+                    {
+                        "EventId": str(index),
+                        "LogicalResourceId": cluster.stack_name,
+                        "ResourceType": "AWS::CloudFormation::Stack",
+                        "ResourceStatus": stack_statuses[index],
+                    }
+                    for index in reversed(range(count))
+                ]
+            }
+            for count in range(1, len(stack_statuses) + 1)
+        ]
+        get_stack_events_mock = mocker.patch("pcluster.aws.cfn.CfnClient.get_stack_events", side_effect=stack_events)
 
         cluster._wait_for_stack_update()
-        assert_that(updated_status_mock.call_count).is_equal_to(expected_call_count)
+        describe_stack_mock.assert_called_once()
+        expected_call_count = len(stack_statuses) if len(stack_statuses) > 1 else 0
+        assert_that(get_stack_events_mock.call_count).is_equal_to(expected_call_count)
 
     @pytest.mark.parametrize(
         "template_body,error_message",
@@ -624,6 +650,37 @@ class TestCluster:
                     force=force,
                 )
 
+    @pytest.mark.parametrize("full_validation", [False, True])
+    def test_validate_update_request_scoped_validation(self, mocker, set_env, full_validation):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        cluster = Cluster(
+            FAKE_NAME,
+            stack=ClusterStack(
+                {
+                    "StackName": FAKE_NAME,
+                    "CreationTime": "2021-06-04 10:23:20.199000+00:00",
+                    "StackStatus": ClusterStatus.CREATE_COMPLETE,
+                }
+            ),
+            config=OLD_CONFIGURATION,
+        )
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        execute_mock = mocker.patch.object(ValidatorScheduler, "_execute", return_value=([], 0.0))
+
+        _, changes, _ = cluster.validate_update_request(
+            target_source_config=OLD_CONFIGURATION.replace("MaxCount: 11", "MaxCount: 12"),
+            force=True,
+            full_validation=full_validation,
+        )
+
+        assert_that(changes[1][1:4]).is_equal_to(["MaxCount", 11, 12])
+        executed_validators = {call.args[0].__name__ for call in execute_mock.call_args_list}
+        # Validators whose arguments did not change, like the key pair one, are only executed on full validation
+        assert_that("KeyPairValidator" in executed_validators).is_equal_to(full_validation)
+        # Validators with arguments depending on the MaxCount are always executed
+        assert_that(executed_validators).contains("ComputeResourceLaunchTemplateValidator")
+
     @pytest.mark.skip
     @pytest.mark.parametrize("template_url", ["s3://bucketname/bucketkey", "https://test"])
     def test_render_and_upload_scheduler_plugin_template(self, mocker, cluster, template_url):
@@ -9,6 +9,8 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
 import os
 import time
 
@@ -305,11 +307,46 @@ class TestCloudWatchLogsExporter:
         )
 
         expected_call_count = len(task_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        mocker.patch("pcluster.models.common.time.sleep")  # so we don't actually have to wait
 
         cw_logs_exporter._wait_for_task_completion("task_id")
         assert_that(wait_for_task_mock.call_count).is_equal_to(expected_call_count)
 
+    def test_wait_for_task_completion_backoff(self, cw_logs_exporter, mocker):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.aws.logs.LogsClient.get_export_task_status", side_effect=["RUNNING"] * 7 + ["COMPLETED"])
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep")
+
+        assert_that(cw_logs_exporter._wait_for_task_completion("task_id")).is_equal_to("COMPLETED")
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to(
+            [1, 1.5, 2.25, 3.375, 5.0625, 7.59375, 10, 10]
+        )
+
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/stream1/000001.gz": b"second chunk of stream1\n",
+            f"{prefix}/stream1/000000.gz": b"first chunk of stream1\n",
+            f"{prefix}/stream2/000000.gz": b"stream2\n",
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[mocker.MagicMock(key=key) for key in objects],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(objects[key]))},
+        )
+        mocker.patch.object(CloudWatchLogsExporter, "DECOMPRESSION_CHUNK_SIZE", 4)
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", str(tmpdir))
+
+        assert_that(get_object_mock.call_count).is_equal_to(3)
+        assert_that(sorted(os.listdir(tmpdir))).is_equal_to(["stream1", "stream2"])
+        assert_that(tmpdir.join("stream1").read()).is_equal_to("first chunk of stream1\nsecond chunk of stream1\n")
+        assert_that(tmpdir.join("stream2").read()).is_equal_to("stream2\n")
+
     @pytest.mark.parametrize("task_result", ["COMPLETED", "ERROR"])
     def test_export_logs_to_s3(self, cw_logs_exporter, mocker, task_result):
         """Verify that _export_logs_to_s3 behaves as expected."""
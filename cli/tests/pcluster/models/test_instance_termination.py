@@ -0,0 +1,75 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSClientError, LimitExceededError
+from pcluster.models.instance_termination import InstanceTerminator
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+FILTERS = [
+    {"Name": "tag:parallelcluster:cluster-name", "Values": ["cluster"]},
+    {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+]
+
+
+def test_terminate(mocker):
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.models.instance_termination.time.sleep")
+    instance_ids = [f"i-{index:04}" for index in range(450)]
+    mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instance_ids", return_value=iter(instance_ids))
+
+    def _terminate_instances(batch):
+        if batch[0] == "i-0400":
+            raise AWSClientError("terminate_instances", "Unauthorized")
+
+    terminate_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances)
+    list_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", side_effect=[["i-0001"], []])
+
+    report = InstanceTerminator(max_workers=3, request_rate=100).terminate(FILTERS, wait=True)
+
+    # Batches are terminated independently
+    batches = [call.args[0] for call in terminate_mock.call_args_list]
+    assert_that(batches).is_length(5)
+    assert_that(sorted(instance_id for batch in batches for instance_id in batch)).is_equal_to(instance_ids)
+    assert_that(max(len(batch) for batch in batches)).is_equal_to(100)
+    assert_that(report.requested).is_equal_to(450)
+    assert_that(report.terminated).is_equal_to(400)
+    assert_that(report.failed).is_equal_to(50)
+    assert_that(report.remaining).is_equal_to(0)
+    assert_that([str(error) for error in report.errors]).is_equal_to(["Unauthorized"])
+    # Termination is awaited looking for the instances in any non terminal state
+    list_mock.assert_called_with(
+        [
+            {"Name": "tag:parallelcluster:cluster-name", "Values": ["cluster"]},
+            {"Name": "instance-state-name", "Values": ["pending", "running", "shutting-down", "stopping", "stopped"]},
+        ]
+    )
+    assert_that(list_mock.call_count).is_equal_to(2)
+
+
+def test_terminate_throttled(mocker):
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.models.instance_termination.time.sleep")
+    mocker.patch("pcluster.aws.ec2.Ec2Client.iter_instance_ids", return_value=iter(["i-1", "i-2"]))
+    terminate_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.terminate_instances",
+        side_effect=LimitExceededError("terminate_instances", "Request limit exceeded."),
+    )
+    list_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids")
+
+    report = InstanceTerminator().terminate(FILTERS, wait=True)
+
+    # Throttled calls are retried by botocore only, within the max attempts of the RetryPolicy
+    terminate_mock.assert_called_once_with(["i-1", "i-2"])
+    assert_that(str(report)).is_equal_to("requested: 2, terminated: 0, failed: 2")
+    assert_that(report.errors[0]).is_instance_of(LimitExceededError)
+    # Nothing to wait for when no termination succeeded
+    list_mock.assert_not_called()
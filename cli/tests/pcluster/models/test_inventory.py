@@ -0,0 +1,58 @@
+# Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+from assertpy import assert_that
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError
+from pcluster.models.inventory import Inventory, list_cluster_stacks
+
+
+def test_inventory_collect(set_env):
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    regions = ["eu-west-1", "us-west-2", "eu-west-1", "ap-south-1"]
+    all_regions_started = threading.Barrier(3, timeout=10)
+
+    def _list_region(region):
+        # Regions are queried concurrently, with AWS calls targeting the region being listed
+        all_regions_started.wait()
+        if region == "us-west-2":
+            raise AWSClientError("describe_stacks", "Access denied")
+        return [f"{AWSApi.instance().aws_region}-cluster1", f"{region}-cluster2"]
+
+    items, failures = Inventory(regions).collect(_list_region)
+
+    assert_that(items).is_equal_to(
+        ["eu-west-1-cluster1", "eu-west-1-cluster2", "ap-south-1-cluster1", "ap-south-1-cluster2"]
+    )
+    assert_that(failures).is_equal_to({"us-west-2": "Access denied"})
+    # The environment of the caller is left untouched
+    assert_that(AWSApi.instance().aws_region).is_equal_to("us-east-1")
+
+
+def test_inventory_iter_regions():
+    inventories = list(Inventory(["eu-west-1", "us-east-1"], max_workers=1).iter_regions(lambda region: [region]))
+    assert_that({inventory.region: inventory.items for inventory in inventories}).is_equal_to(
+        {"eu-west-1": ["eu-west-1"], "us-east-1": ["us-east-1"]}
+    )
+    assert_that(list(Inventory([]).iter_regions(lambda region: [region]))).is_empty()
+
+
+def test_list_cluster_stacks(mocker):
+    list_pcluster_stacks_mock = mocker.patch(
+        "pcluster.aws.cfn.CfnClient.list_pcluster_stacks",
+        side_effect=[([{"StackName": "c1"}], "token"), ([{"StackName": "c2"}], None)],
+    )
+    mocker.patch("pcluster.aws.cfn.CfnClient.__init__", return_value=None)
+
+    assert_that(list_cluster_stacks()).is_equal_to([{"StackName": "c1"}, {"StackName": "c2"}])
+    list_pcluster_stacks_mock.assert_called_with(next_token="token")
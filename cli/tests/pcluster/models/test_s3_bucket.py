@@ -11,6 +11,7 @@
 import os
 
 import pytest
+from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -66,3 +67,73 @@ def test_configure_s3_bucket(mocker, put_bucket_versioning_error, put_bucket_enc
     if put_bucket_versioning_error or put_bucket_encryption_error or put_bucket_policy_error:
         with pytest.raises(AWSClientError, match="An error occurred"):
             bucket.configure_s3_bucket()
+
+
+def head_object_side_effect(objects):
+    def _head_object(bucket_name, object_name):
+        if object_name not in objects:
+            raise AWSClientError(function_name="head_object", message="Not Found", error_code="404")
+        return {"Metadata": objects[object_name]}
+
+    return _head_object
+
+
+@pytest.fixture
+def stored_objects(mocker):
+    """Mock the S3 object operations with an in-memory store of the object metadata."""
+    objects = {}
+
+    def _store(bucket_name, key, metadata=None, **kwargs):
+        objects[key] = metadata
+        return {"VersionId": "new-version"}
+
+    upload_mocks = {
+        operation: mocker.patch(f"pcluster.aws.s3.S3Client.{operation}", side_effect=_store)
+        for operation in ["put_object", "upload_file", "upload_fileobj"]
+    }
+    return objects, upload_mocks
+
+
+def test_upload_resources_skips_unchanged(mocker, tmp_path, stored_objects):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket()
+    objects, upload_mocks = stored_objects
+    head_object_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object", side_effect=head_object_side_effect(objects)
+    )
+    (tmp_path / "artifacts").mkdir()
+    (tmp_path / "artifacts" / "handler.py").write_text("print('handler')")
+    (tmp_path / "script.sh").write_text("echo script")
+
+    # Stored objects are not checked when not requested, e.g. for a new artifact directory
+    assert_that(bucket.upload_resources(str(tmp_path), "artifacts.zip")).is_equal_to(2)
+    head_object_mock.assert_not_called()
+    assert_that(objects).is_length(2)
+    assert_that(upload_mocks["upload_fileobj"].call_count).is_equal_to(1)
+    assert_that(upload_mocks["upload_file"].call_count).is_equal_to(1)
+
+    # Unchanged resources are not uploaded again, even if the files were rewritten
+    os.utime(tmp_path / "artifacts" / "handler.py", (0, 0))
+    assert_that(bucket.upload_resources(str(tmp_path), "artifacts.zip", skip_unchanged=True)).is_equal_to(0)
+
+    (tmp_path / "artifacts" / "handler.py").write_text("print('new handler')")
+    assert_that(bucket.upload_resources(str(tmp_path), "artifacts.zip", skip_unchanged=True)).is_equal_to(1)
+    assert_that(upload_mocks["upload_fileobj"].call_count).is_equal_to(2)
+    assert_that(upload_mocks["upload_file"].call_count).is_equal_to(1)
+
+
+def test_upload_config_always_uploads(mocker, stored_objects):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket()
+    _, upload_mocks = stored_objects
+    head_object_mock = mocker.patch("pcluster.aws.s3.S3Client.head_object")
+
+    # Every upload of the config creates a new version, even if the content is unchanged
+    for _ in range(2):
+        assert_that(bucket.upload_config({"Image": {"Os": "alinux2"}}, "config.yaml")).is_equal_to(
+            {"VersionId": "new-version"}
+        )
+    assert_that(upload_mocks["put_object"].call_count).is_equal_to(2)
+    head_object_mock.assert_not_called()
@@ -9,7 +9,12 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import gc
 import json
+import os
+import time
+import tracemalloc
 from io import BytesIO
 from urllib.error import HTTPError
 
@@ -21,6 +26,7 @@ from marshmallow.validate import ValidationError
 from yaml.parser import ParserError
 
 from pcluster.aws.common import AWSClientError
+from pcluster.config.common import Resource
 from pcluster.constants import SUPPORTED_OSES
 from pcluster.schemas.cluster_schema import (
     ClusterSchema,
@@ -76,6 +82,75 @@ def test_cluster_schema_awsbatch(mocker, test_datadir, config_file_name):
     _check_cluster_schema(config_file_name)
 
 
+def _large_cluster_config():
+    """Return a Slurm configuration with 20 queues of 50 compute resources each."""
+    input_yaml, _ = load_cluster_model_from_yaml("slurm.required.yaml")
+    queue = input_yaml["Scheduling"]["SlurmQueues"][0]
+    compute_resource = queue["ComputeResources"][0]
+    input_yaml["Scheduling"]["SlurmQueues"] = [
+        {
+            **queue,
+            "Name": f"queue{queue_index}",
+            "ComputeResources": [{**compute_resource, "Name": f"compute-resource{index}"} for index in range(50)],
+        }
+        for queue_index in range(20)
+    ]
+    return input_yaml
+
+
+def _iter_resources(value):
+    """Yield the resources of the configuration tree rooted in the given value."""
+    if isinstance(value, Resource):
+        yield value
+        for attribute in vars(value).values():
+            yield from _iter_resources(attribute)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_resources(item)
+
+
+def test_cluster_schema_large_config_compact_resources(mocker):
+    """Verify that the resources of a configuration with 1,000 compute resources do not allocate unneeded state."""
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.utils.get_region", return_value="fake_region")
+    cluster = ClusterSchema(cluster_name="clustername").load(_large_cluster_config())
+
+    resources = list(_iter_resources(cluster))
+    assert_that(cluster.scheduling.queues).is_length(20)
+    assert_that(len(resources)).is_greater_than(1000)
+    for resource in resources:
+        for param in resource.params.values():
+            assert_that(hasattr(param, "__dict__")).is_false()
+        # Validator lists and failures are allocated only when the configuration is validated
+        assert_that(vars(resource)).does_not_contain_key("_validators", "_validation_failures")
+
+
+@pytest.mark.skipif(not os.environ.get("PCLUSTER_BENCHMARK"), reason="Benchmark enabled by PCLUSTER_BENCHMARK")
+def test_cluster_schema_large_config_benchmark(mocker, record_property, capsys):
+    """Report build time and retained memory of a configuration with 1,000 compute resources."""
+    mock_aws_api(mocker)
+    mocker.patch("pcluster.utils.get_region", return_value="fake_region")
+    input_yaml = _large_cluster_config()
+
+    tracemalloc.start()
+    try:
+        start_time = time.perf_counter()
+        cluster = ClusterSchema(cluster_name="clustername").load(copy.deepcopy(input_yaml))
+        build_time = time.perf_counter() - start_time
+        gc.collect()
+        config_size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert_that(cluster.scheduling.queues).is_length(20)
+    record_property("build_time_seconds", build_time)
+    record_property("retained_memory_bytes", config_size)
+    with capsys.disabled():
+        print(
+            f"\nConfig with 1,000 compute resources built in {build_time:.3f}s, retaining {config_size / 1024:.0f} KiB"
+        )
+
+
 @pytest.mark.skip
 @pytest.mark.parametrize("config_file_name", ["scheduler_plugin.required.yaml", "scheduler_plugin.full.yaml"])
 def test_cluster_schema_scheduler_plugin(mocker, test_datadir, config_file_name):
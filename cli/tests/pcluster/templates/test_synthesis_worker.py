@@ -0,0 +1,160 @@
+#  Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+import io
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from pcluster.templates.synthesis_worker import (
+    SynthesisWorker,
+    SynthesisWorkerError,
+    SynthesisWorkerPool,
+    _read_message,
+    _write_message,
+    serve,
+)
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket
+
+
+@pytest.fixture
+def pool():
+    pool = SynthesisWorkerPool(max_workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def _serve(*requests):
+    input_stream = io.BytesIO()
+    for request in requests:
+        _write_message(input_stream, {"environ": {"AWS_DEFAULT_REGION": "us-east-1"}, "kwargs": {}, **request})
+    input_stream.seek(0)
+    output_stream = io.BytesIO()
+    serve(input_stream, output_stream)
+    output_stream.seek(0)
+    return [_read_message(output_stream) for _ in requests]
+
+
+def test_serve():
+    responses = _serve({"action": "ping"}, {"action": "unknown"})
+
+    assert_that(responses[0]).is_equal_to(("ok", "pong"))
+    assert_that(responses[1][0]).is_equal_to("error")
+    assert_that(responses[1][1]["message"]).contains("Unknown synthesis worker action: unknown")
+
+
+def test_worker_process():
+    worker = SynthesisWorker()
+    try:
+        assert_that(worker.ping(timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)).is_true()
+        # Errors raised by the worker are raised again by the caller, and the worker keeps serving requests
+        with pytest.raises(SynthesisWorkerError, match="Unknown synthesis worker action: unknown"):
+            worker.request("unknown", timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)
+        assert_that(worker.is_alive()).is_true()
+    finally:
+        worker.stop()
+    assert_that(worker.is_alive()).is_false()
+
+    with pytest.raises(SynthesisWorkerError, match="Synthesis worker failure"):
+        worker.ping(timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)
+
+
+def test_worker_request_timeout(mocker):
+    worker = SynthesisWorker()
+    try:
+        # The timeout covers the whole reply, not only its first bytes
+        read_mock = mocker.patch("pcluster.templates.synthesis_worker.os.read", side_effect=[b"\x00", b""])
+        mocker.patch("pcluster.templates.synthesis_worker.select.select", side_effect=[([1], [], []), ([], [], [])])
+        with pytest.raises(SynthesisWorkerError, match="did not reply within 5 seconds"):
+            worker.request("ping", timeout=5)
+        read_mock.assert_called_once()
+    finally:
+        mocker.stopall()
+        worker.stop()
+    assert_that(worker.is_alive()).is_false()
+
+
+def test_pool_reuses_and_replaces_workers(pool):
+    assert_that(pool.submit("ping", timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)).is_equal_to("pong")
+    first_worker = pool._idle_workers.queue[0]
+    pool.submit("ping", timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)
+    assert_that(pool._idle_workers.queue).is_equal_to([first_worker])
+
+    # A terminated worker is replaced by a new one
+    first_worker.stop()
+    assert_that(pool.submit("ping", timeout=SynthesisWorkerPool.HEALTH_CHECK_TIMEOUT)).is_equal_to("pong")
+    assert_that(pool._idle_workers.queue).is_length(1)
+    assert_that(pool._idle_workers.queue[0].pid).is_not_equal_to(first_worker.pid)
+    assert_that(pool._workers).is_length(1)
+
+
+@pytest.mark.parametrize(
+    "idle_time, ping_result, expected_reused", [(0, None, True), (61, True, True), (61, False, False)]
+)
+def test_pool_checks_idle_workers(mocker, pool, idle_time, ping_result, expected_reused):
+    idle_worker = mocker.MagicMock(last_used=100, is_alive=mocker.MagicMock(return_value=True))
+    if ping_result is False:
+        idle_worker.ping.side_effect = SynthesisWorkerError("Synthesis worker did not reply")
+    else:
+        idle_worker.ping.return_value = ping_result
+    pool._idle_workers.put(idle_worker)
+    new_worker = mocker.MagicMock()
+    mocker.patch("pcluster.templates.synthesis_worker.SynthesisWorker", return_value=new_worker)
+    mocker.patch("pcluster.templates.synthesis_worker.time.monotonic", return_value=100 + idle_time)
+
+    pool.synthesize("cluster", stack_name="cluster")
+
+    # Workers idle for longer than the health check interval are pinged before being reused
+    assert_that(idle_worker.ping.called).is_equal_to(idle_time > SynthesisWorkerPool.HEALTH_CHECK_INTERVAL)
+    used_worker, unused_worker = (idle_worker, new_worker) if expected_reused else (new_worker, idle_worker)
+    used_worker.request.assert_called_once_with(
+        "synthesize_cluster_template", timeout=SynthesisWorkerPool.SYNTHESIS_TIMEOUT, stack_name="cluster"
+    )
+    unused_worker.request.assert_not_called()
+    if not expected_reused:
+        idle_worker.stop.assert_called_once()
+
+
+def test_pool_shutdown_stops_busy_workers(mocker, pool):
+    idle_worker, busy_worker = mocker.MagicMock(), mocker.MagicMock()
+    pool._workers.update([idle_worker, busy_worker])
+    pool._idle_workers.put(idle_worker)
+
+    pool.shutdown()
+
+    idle_worker.stop.assert_called_once()
+    busy_worker.kill.assert_called_once()
+    assert_that(pool._workers).is_empty()
+    assert_that(pool._idle_workers.empty()).is_true()
+
+
+@pytest.mark.parametrize("env_value, expected_max_workers", [(None, 0), ("0", 0), ("2", 2), ("-1", 0), ("invalid", 0)])
+def test_pool_instance(set_env, env_value, expected_max_workers):
+    if env_value is not None:
+        set_env("PCLUSTER_CDK_WORKERS", env_value)
+    instance = SynthesisWorkerPool.instance()
+    if expected_max_workers:
+        assert_that(instance.max_workers).is_equal_to(expected_max_workers)
+        assert_that(SynthesisWorkerPool.instance()).is_same_as(instance)
+    else:
+        assert_that(instance).is_none()
+
+
+def test_builder_uses_pool(mocker):
+    pool = mocker.MagicMock()
+    pool.synthesize.return_value = {"Resources": {}}
+    mocker.patch("pcluster.templates.cdk_builder.SynthesisWorkerPool.instance", return_value=pool)
+    bucket = dummy_cluster_bucket()
+    image_config = object()
+
+    template = CDKTemplateBuilder.build_imagebuilder_template(image_config, "image-id", bucket)
+
+    assert_that(template).is_equal_to({"Resources": {}})
+    pool.synthesize.assert_called_once_with(
+        "imagebuilder", image_config=image_config, image_id="image-id", bucket=bucket
+    )
@@ -10,10 +10,12 @@
 # limitations under the License.
 # This module provides unit tests for the functions in the pcluster.utils module."""
 import os
+import threading
 import time
 
 import pytest
 from assertpy import assert_that
+from freezegun import freeze_time
 
 import pcluster.aws.common
 import pcluster.utils as utils
@@ -162,6 +164,160 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    @staticmethod
+    @Cache.cached(maxsize=2)
+    def _bounded_cached_method(arg):
+        TestCache.invocations.append(arg)
+        return arg
+
+    @staticmethod
+    @Cache.cached(ttl=60)
+    def _ttl_cached_method(arg):
+        TestCache.invocations.append(arg)
+        return arg
+
+    def test_lru_eviction(self):
+        cache = self._bounded_cached_method.cache
+        for arg in [1, 2, 1, 3, 1, 2]:
+            assert_that(self._bounded_cached_method(arg)).is_equal_to(arg)
+
+        # 2 is evicted when 3 is added, since 1 was used more recently
+        assert_that(self.invocations).is_equal_to([1, 2, 3, 2])
+        assert_that(cache.stats()).is_equal_to({"hits": 2, "misses": 4, "evictions": 2, "size": 2})
+        assert_that(Cache.stats()).contains_key(cache.name)
+
+    def test_ttl_expiration(self):
+        with freeze_time("2021-01-01 00:00:00") as frozen_time:
+            assert_that(self._ttl_cached_method(1)).is_equal_to(1)
+            frozen_time.tick(59)
+            assert_that(self._ttl_cached_method(1)).is_equal_to(1)
+            assert_that(self.invocations).is_length(1)
+            frozen_time.tick(2)
+            assert_that(self._ttl_cached_method(1)).is_equal_to(1)
+            assert_that(self.invocations).is_length(2)
+
+    def test_clear_all_preserve_ttl(self):
+        assert_that(self._ttl_cached_method(1)).is_equal_to(1)
+        assert_that(self._cached_method_1(1, 2)).is_equal_to((1, 2))
+
+        Cache.clear_all(preserve_ttl=True)
+
+        assert_that(self._ttl_cached_method(1)).is_equal_to(1)
+        assert_that(self._cached_method_1(1, 2)).is_equal_to((1, 2))
+        assert_that(self.invocations).is_equal_to([1, (1, 2), (1, 2)])
+
+    def test_exact_keys(self):
+        # Arguments with the same hash or that are equal only once converted must not share the same entry
+        for args in [(-1, -2), (-2, -2), ([1], (1,)), ((1,), [1]), ({"a": [1]}, {"a": (1,)})]:
+            assert_that(self._cached_method_1(*args)).is_equal_to(args)
+            assert_that(self._cached_method_1(*args)).is_equal_to(args)
+
+        assert_that(self.invocations).is_length(5)
+
+    def test_concurrent_invocations(self):
+        event = threading.Event()
+
+        @Cache.cached
+        def _slow_method(arg):
+            event.wait(5)
+            TestCache.invocations.append(arg)
+            return arg
+
+        threads = [threading.Thread(target=_slow_method, args=(1,)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        event.set()
+        for thread in threads:
+            thread.join()
+
+        assert_that(self.invocations).is_equal_to([1])
+
+    def test_invalidation_during_computation(self):
+        store = Cache.create_store("test_invalidation", maxsize=8)
+
+        def _compute_and_invalidate():
+            # The value computed before the invalidation is returned, but not stored
+            store.invalidate("key")
+            return "stale"
+
+        assert_that(store.get_or_compute("key", _compute_and_invalidate)).is_equal_to("stale")
+        assert_that(store.get("key")).is_equal_to((False, None))
+        assert_that(store.get_or_compute("key", lambda: "fresh")).is_equal_to("fresh")
+        assert_that(store.get("key")).is_equal_to((True, "fresh"))
+
+
+class TestPersistentCache:
+    invocations = []
+
+    @pytest.fixture(autouse=True)
+    def persistent_cache(self, mocker, set_env, tmpdir):
+        Cache.clear_all()
+        del self.invocations[:]
+        set_env("PCLUSTER_PERSISTENT_CACHE", "true")
+        set_env("PCLUSTER_PERSISTENT_CACHE_TTL", "60")
+        mocker.patch("pcluster.aws.common.PersistentCache.get_scope_dir", return_value=str(tmpdir))
+        return tmpdir
+
+    class _Client:
+        @Cache.cached(
+            persistent=True,
+            serialize=lambda value: {"wrapped": value},
+            deserialize=lambda value: tuple(value["wrapped"]),
+        )
+        def cached_method(self, arg1, arg2=None):
+            TestPersistentCache.invocations.append((arg1, arg2))
+            return arg1, arg2
+
+    def test_persistent_cache(self, persistent_cache):
+        with freeze_time("2021-01-01 00:00:00") as frozen_time:
+            assert_that(self._Client().cached_method(1, arg2=[2])).is_equal_to((1, [2]))
+            # A different client instance, with an empty in-memory cache, reads the persisted value
+            Cache.clear_all()
+            assert_that(self._Client().cached_method(1, arg2=[2])).is_equal_to((1, [2]))
+            assert_that(self.invocations).is_length(1)
+            assert_that(persistent_cache.join(self._Client.cached_method.cache.name).listdir()).is_length(1)
+
+            # Non serializable arguments bypass the persistent cache
+            Cache.clear_all()
+            assert_that(self._Client().cached_method(1, arg2=object)).is_equal_to((1, object))
+            assert_that(self.invocations).is_length(2)
+
+            # Expired entries are ignored and replaced
+            frozen_time.tick(61)
+            Cache.clear_all()
+            assert_that(self._Client().cached_method(1, arg2=[2])).is_equal_to((1, [2]))
+            assert_that(self.invocations).is_length(3)
+
+    def test_persistent_cache_ttl(self, persistent_cache):
+        class _ShortLivedClient:
+            @Cache.cached(ttl=10, persistent=True)
+            def cached_method(self, arg1):
+                TestPersistentCache.invocations.append(arg1)
+                return arg1
+
+        with freeze_time("2021-01-01 00:00:00") as frozen_time:
+            _ShortLivedClient().cached_method(1)
+            # Persisted entries do not outlive the time-to-live of the decorated function
+            frozen_time.tick(11)
+            Cache.clear_all()
+            _ShortLivedClient().cached_method(1)
+            assert_that(self.invocations).is_length(2)
+
+    def test_disabled_persistent_cache(self, persistent_cache, set_env):
+        set_env("PCLUSTER_PERSISTENT_CACHE", "false")
+        assert_that(self._Client().cached_method(1)).is_equal_to((1, None))
+        assert_that(persistent_cache.listdir()).is_empty()
+
+    def test_invalid_entry(self, persistent_cache):
+        self._Client().cached_method(1)
+        entry_dir = persistent_cache.join(self._Client.cached_method.cache.name)
+        entry_dir.listdir()[0].write("{invalid")
+
+        Cache.clear_all()
+        assert_that(self._Client().cached_method(1)).is_equal_to((1, None))
+        assert_that(self.invocations).is_length(2)
+        assert_that(entry_dir.listdir()).is_length(1)
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
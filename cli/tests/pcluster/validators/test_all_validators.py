@@ -189,15 +189,13 @@ def test_validators_are_called_with_correct_argument(test_datadir, mocker):
 
     _load_and_validate(test_datadir / "slurm.yaml")
 
-    # Assert validators are called
+    # Assert validators are called, once for each distinct set of arguments
     scheduler_os_validator.assert_has_calls([call(os="alinux2", scheduler="slurm")])
     compute_resource_size_validator.assert_has_calls(
         [
             # Defaults of min_count=0, max_count=10
             call(min_count=0, max_count=5),
             call(min_count=0, max_count=10),
-            call(min_count=0, max_count=10),
-            call(min_count=0, max_count=10),
         ],
         any_order=True,
     )
@@ -205,7 +203,6 @@ def test_validators_are_called_with_correct_argument(test_datadir, mocker):
         [
             call(max_length=10, resource_name="SlurmQueues", resources_length=2),
             call(max_length=5, resource_name="ComputeResources", resources_length=2),
-            call(max_length=5, resource_name="ComputeResources", resources_length=2),
         ],
         any_order=True,
     )
@@ -222,12 +219,10 @@ def test_validators_are_called_with_correct_argument(test_datadir, mocker):
         any_order=True,
     )
     subnets_validator.assert_has_calls([call(subnet_ids=["subnet-23456789", "subnet-12345678"])])
-    security_groups_validator.assert_has_calls(
-        [call(security_group_ids=None), call(security_group_ids=None)], any_order=True
-    )
+    security_groups_validator.assert_has_calls([call(security_group_ids=None)])
     # Defaults of disable_simultaneous_multithreading=False
     disable_simultaneous_multithreading_architecture_validator.assert_has_calls(
-        [call(disable_simultaneous_multithreading=False, architecture="x86_64")] * 5
+        [call(disable_simultaneous_multithreading=False, architecture="x86_64")]
     )
     architecture_os_validator.assert_has_calls(
         [call(os="alinux2", architecture="x86_64", custom_ami="ami-12345678", ami_search_filters=None)]
@@ -20,6 +20,7 @@ from pcluster.validators.cluster_validators import (
     FSX_SUPPORTED_ARCHITECTURES_OSES,
     ArchitectureOsValidator,
     ClusterNameValidator,
+    ComputeResourceLaunchTemplateValidator,
     ComputeResourceSizeValidator,
     DcvValidator,
     DisableSimultaneousMultithreadingArchitectureValidator,
@@ -954,6 +955,70 @@ def test_generate_tag_specifications(input_tags):
     assert_that(_LaunchTemplateValidator._generate_tag_specifications(input_tags)).is_equal_to(expected_output_tags)
 
 
+@pytest.mark.parametrize(
+    "test_all_compute_resources, env_value, expected_instance_types",
+    [
+        (False, None, ["c5n.18xlarge"]),
+        (True, None, ["t2.micro", "c5n.18xlarge", "t2.micro", "c5n.18xlarge"]),
+        (None, "false", ["c5n.18xlarge"]),
+        (None, "0", ["c5n.18xlarge"]),
+        (None, "True", ["t2.micro", "c5n.18xlarge", "t2.micro", "c5n.18xlarge"]),
+    ],
+)
+def test_compute_resource_launch_template_validator(
+    aws_api_mock, set_env, test_all_compute_resources, env_value, expected_instance_types
+):
+    """Verify dry-run launches are executed for every compute resource and subnet only when requested."""
+    if env_value is not None:
+        set_env("PCLUSTER_DRYRUN_ALL_COMPUTE_RESOURCES", env_value)
+
+    def _compute_resource(name, instance_type, interfaces_count):
+        return DefaultMunch.fromDict(
+            {
+                "name": name,
+                "instance_type": instance_type,
+                "max_network_interface_count": interfaces_count,
+                "vcpus": 4,
+                "disable_simultaneous_multithreading_via_cpu_options": False,
+                "efa": {"enabled": False},
+            }
+        )
+
+    queue = DefaultMunch.fromDict(
+        {
+            "name": "queue1",
+            "networking": {
+                "subnet_ids": ["subnet-1", "subnet-2"],
+                "security_groups": ["sg-1"],
+                "assign_public_ip": False,
+            },
+        }
+    )
+    queue.compute_resources = [
+        _compute_resource("cr1", "t2.micro", 1),
+        _compute_resource("cr2", "c5n.18xlarge", 2),
+        # Same launch parameters as cr1, expected to be tested only once
+        _compute_resource("cr3", "t2.micro", 1),
+    ]
+    aws_api_mock.ec2.get_subnet_avail_zone.return_value = "us-east-1a"
+
+    actual_failures = ComputeResourceLaunchTemplateValidator().execute(
+        queue=queue, ami_id="ami-12345678", tags=[], test_all_compute_resources=test_all_compute_resources
+    )
+
+    assert_that(actual_failures).is_empty()
+    launched = sorted(
+        (call.kwargs["NetworkInterfaces"][0]["SubnetId"], call.kwargs["InstanceType"])
+        for call in aws_api_mock.ec2.run_instances.call_args_list
+    )
+    expected_subnets = (
+        ["subnet-1", "subnet-1", "subnet-2", "subnet-2"] if len(expected_instance_types) > 1 else ["subnet-1"]
+    )
+    assert_that(launched).is_equal_to(sorted(zip(expected_subnets, expected_instance_types)))
+    for call in aws_api_mock.ec2.run_instances.call_args_list:
+        assert_that(call.kwargs).contains_entry({"DryRun": True}, {"ImageId": "ami-12345678"})
+
+
 @pytest.mark.parametrize(
     "head_node_security_groups, queues, expect_warning",
     [